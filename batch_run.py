@@ -0,0 +1,78 @@
+"""Başsız (headless) toplu senaryo koşucusu.
+
+Örnek:
+    python batch_run.py scenarios/ --backend fake --mode stream --jobs 8
+    python batch_run.py scenario_waypoints.json --mode scenario --json out.json
+    python batch_run.py scenarios/ --mode scenario --clock sim      # gerçek zamandan hızlı
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from core.batch_runner import BACKENDS, MODES, expand_paths, run_many
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Senaryo dosyalarını arayüzsüz koştur.")
+    ap.add_argument("paths", nargs="+", help="JSON senaryo dosyaları veya dizinler")
+    ap.add_argument("--backend", choices=BACKENDS, default="fake")
+    ap.add_argument("--mode", choices=MODES, default="stream",
+                    help="stream → follow_stream, timed → zaman damgalı follow_stream, "
+                         "scenario → fly_scenario")
+    ap.add_argument("--interval", type=float, default=0.1, help="follow_stream kare aralığı (s)")
+    ap.add_argument("--timeout", type=float, default=None, help="koşu başına üst süre (s)")
+    ap.add_argument("--join", action="store_true",
+                    help="rotaya uçağın konumuna en yakın noktadan katıl")
+    ap.add_argument("--simplify", type=float, default=None, metavar="M",
+                    help="rotayı M metre toleransla sadeleştir (Douglas-Peucker)")
+    ap.add_argument("--alt-tol", type=float, default=50.0, help="sadeleştirme irtifa toleransı")
+    ap.add_argument("--cache", action="store_true",
+                    help="ayrıştırılmış senaryoları <dosya>.cache olarak sakla/kullan")
+    ap.add_argument("--clock", default="real", metavar="SAAT",
+                    help="real | scaled:N (N kat hızlı) | sim (olay adımlı sanal zaman)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="paralel süreç sayısı")
+    ap.add_argument("--json", dest="json_out", help="özetleri bu dosyaya yaz")
+    args = ap.parse_args(argv)
+
+    paths = expand_paths(args.paths)
+    if not paths:
+        print("❌ Senaryo bulunamadı.")
+        return 1
+
+    t0 = time.perf_counter()
+    results, failed = [], 0
+    for r in run_many(paths, jobs=args.jobs, backend=args.backend, mode=args.mode,
+                      interval=args.interval, timeout=args.timeout, join=args.join,
+                      simplify_m=args.simplify, alt_tol=args.alt_tol,
+                      sidecar=args.cache, clock=args.clock):
+        results.append(r)
+        if r["error"]:
+            failed += 1
+            print(f"❌ {r['path']}: {r['error']}")
+            continue
+        flag = "  ⏱️ zaman aşımı" if r["timed_out"] else ""
+        if "compression" in r:
+            flag += f"  sadeleştirme {r['compression']:.1f}×"
+        if r.get("frame_us") is not None:
+            flag += f"  kare {r['frame_us']:.0f} µs"
+        if "playback" in r:
+            pb = r["playback"]
+            flag += (f"  {pb['skipped']} kare atlandı, zamanlama hatası "
+                     f"{pb['timing_err_ms']:.1f}/{pb['timing_err_max_ms']:.1f} ms")
+        if r["clock"] != "real":
+            flag += f"  sim {r['sim_s']:.0f} s ({r['speedup']:.0f}×)"
+        print(f"✅ {r['path']}: {r['duration_s']:.1f} s  {r['fps']:.1f} Hz  "
+              f"{r['commands']} komut  konum hatası {r['pos_err_nm']:.3f} NM  "
+              f"irtifa hatası {r['alt_err_ft']:.0f} ft{flag}")
+
+    print(f"— {len(results)} koşu, {failed} hata, toplam {time.perf_counter() - t0:.1f} s")
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
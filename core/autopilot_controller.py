@@ -1,4 +1,5 @@
-import time
+from core.task_manager import FlightTaskManager
+from core.triggers import TriggerEngine, ge, near
 
 
 class AutopilotController:
@@ -9,10 +10,14 @@ class AutopilotController:
     uçağın sabit irtifaya ‘kilitlenme’ problemi kalmıyor.
     """
 
-    def __init__(self, aq, ae, status_callback=None):
+    def __init__(self, aq, ae, status_callback=None, triggers=None, clock=None, tasks=None):
         self.aq = aq
         self.ae = ae
         self.status_callback = status_callback
+        self.triggers = triggers or TriggerEngine(clock=clock)
+        self.clock = clock or self.triggers.clock
+        # FlightController ile paylaşılırsa kalkış ve NAV birbirini keser
+        self.tasks = tasks or FlightTaskManager(self.clock)
 
     # --------------------------------------------------
     def set_status(self, msg):
@@ -21,6 +26,10 @@ class AutopilotController:
 
     # --------------------------------------------------
     def takeoff_sequence(self):
+        """Kalkışı yönetilen görev olarak çalıştır ve bitmesini bekle."""
+        self.tasks.run("takeoff", self._takeoff)
+
+    def _takeoff(self, token):
         try:
             # Park frenini bırak
             if ev := self.ae.find("PARKING_BRAKES"):
@@ -32,9 +41,13 @@ class AutopilotController:
             self.aq.set("ELEVATOR_TRIM_POSITION", 100)
             self.set_status("🚀 Kalkış başladı...")
 
-            # 70 kt IAS’ya ulaşana kadar bekle
-            while (spd := self.aq.get("AIRSPEED_INDICATED")) is None or spd < 70:
-                time.sleep(0.5)
+            trig = self.triggers
+            trig.aq = self.aq
+
+            # 70 kt IAS’ya ulaşana kadar bekle (tetikleyici anında uyandırır)
+            if trig.wait_for(ge("AIRSPEED_INDICATED", 70), stop=token) is None:
+                self.set_status("⏹️ Kalkış iptal edildi.")
+                return
 
             # Anlık irtifaya +350 ft’lik bir tırmanış talimatı ver
             cur_alt    = self.aq.get("PLANE_ALTITUDE")
@@ -50,13 +63,11 @@ class AutopilotController:
             self.set_status(f"🛫 {int(target_alt)} ft’e tırmanılıyor...")
 
             # Hedef irtifaya ±50 ft yaklaşınca VS’yi sıfırla ‑ ALT HOLD bırakma!
-            while True:
-                cur_alt = self.aq.get("PLANE_ALTITUDE")
-                if cur_alt and abs(cur_alt - target_alt) < 50:
-                    if ev := self.ae.find("AP_VS_SET_ENGLISH"):
-                        ev(0)
-                    break
-                time.sleep(1)
+            if trig.wait_for(near("PLANE_ALTITUDE", target_alt, 50), stop=token) is None:
+                self.set_status("⏹️ Kalkış iptal edildi.")
+                return
+            if ev := self.ae.find("AP_VS_SET_ENGLISH"):
+                ev(0)
                 
             # VS’yi 0’a çektikten hemen sonra:
             if ev := self.ae.find("AP_ALT_HOLD_OFF"):
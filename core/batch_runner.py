@@ -0,0 +1,178 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.clock import make_clock
+from core.flight_controller import FlightController, _haversine_nm
+from core.playback import TimedPlayback
+from core.scenario import stream_frames
+from core.scenario_cache import ScenarioCache
+from core.spatial_index import RouteIndex
+from core.route_simplify import simplify_route, compression_ratio
+
+
+BACKENDS = ("fake", "simconnect")
+MODES    = ("stream", "timed", "scenario")
+
+_CACHE = ScenarioCache()               # süreç başına; aynı dosya tekrar koşulursa
+
+
+class _CountingRequests:
+    """aq sarmalayıcısı: set() çağrılarını (sim'e giden komutları) sayar."""
+
+    def __init__(self, aq):
+        self._aq = aq
+        self.count = 0
+
+    def get(self, name, *args):
+        return self._aq.get(name, *args)
+
+    def set(self, name, value):
+        self.count += 1
+        self._aq.set(name, value)
+
+
+class _CountingEvents:
+    """ae sarmalayıcısı: tetiklenen event sayısını tutar."""
+
+    def __init__(self, ae):
+        self._ae = ae
+        self.count = 0
+
+    def find(self, name):
+        ev = self._ae.find(name)
+        if not ev:
+            return ev
+
+        def _call(*args):
+            self.count += 1
+            return ev(*args)
+        return _call
+
+
+class _StatusLog:
+    def __init__(self):
+        self.last = None
+        self.error = None
+
+    def __call__(self, msg):
+        self.last = msg
+        if msg.startswith("❌") and self.error is None:
+            self.error = msg
+
+
+def _make_backend(backend, first_wp, clock):
+    if backend == "fake":
+        from core.fake_sim import FakeSim
+        sim = FakeSim(lat=first_wp.lat, lon=first_wp.lon, alt=first_wp.alt,
+                      hdg=first_wp.get("heading_deg", 0.0), ias=first_wp.get("spd", 90.0),
+                      clock=clock)
+        return sim.aq, sim.ae
+    if backend == "simconnect":
+        if clock.scale != 1.0:
+            raise ValueError("SimConnect yalnızca gerçek zamanlı saatle (--clock real) koşar")
+        from core.simconnect_manager import SimConnectManager
+        mgr = SimConnectManager()
+        mgr.connect()
+        return mgr.get_requests(), mgr.get_events()
+    raise ValueError(f"Bilinmeyen backend: {backend}")
+
+
+def run_one(path, backend="fake", mode="stream", interval=0.1, timeout=None, join=False,
+            simplify_m=None, alt_tol=50.0, sidecar=False, clock="real"):
+    """Tek senaryoyu başsız (headless) koşturur ve özet sözlüğü döndürür.
+    join=True ise rotaya uçağın anlık konumuna en yakın noktadan katılınır;
+    simplify_m verilirse rota önce Douglas-Peucker ile sadeleştirilir;
+    sidecar=True ise ayrıştırılmış senaryo "<dosya>.cache" olarak saklanır.
+    clock: "real" | "scaled:N" | "sim" (bkz. core.clock.make_clock);
+    interval/timeout saat zamanındadır, timeout yalnızca gerçek zamanda
+    üst sınır olarak da uygulanır.
+    Hatalar fırlatılmaz, özetin 'error' alanına yazılır.
+    """
+    summary = {"path": path, "backend": backend, "mode": mode, "clock": clock, "error": None}
+    try:
+        _CACHE.sidecar = sidecar
+        waypoints = _CACHE.load(path)
+        if not waypoints:
+            raise ValueError("Senaryo boş")
+        if simplify_m:
+            legs = simplify_route(waypoints, simplify_m, alt_tol)
+            summary["compression"] = compression_ratio(waypoints, legs)
+            waypoints = legs
+        clk = make_clock(clock)
+        aq, ae = _make_backend(backend, waypoints[0], clk)
+        cq, ce = _CountingRequests(aq), _CountingEvents(ae)
+        status = _StatusLog()
+        flight = FlightController(cq, ce, status_callback=status, clock=clk)
+        start = flight.join_index(RouteIndex.from_waypoints(waypoints)) if join else 0
+
+        t0 = time.perf_counter()
+        c0 = clk.now()
+        playback = None
+        if mode == "stream":
+            flight.follow_stream(stream_frames(waypoints, start=start), interval)
+        elif mode == "timed":
+            playback = TimedPlayback(waypoints, start, clock=clk)
+            flight.follow_stream(playback, 0)
+        elif mode == "scenario":
+            flight.fly_scenario(waypoints, start)
+        else:
+            raise ValueError(f"Bilinmeyen mod: {mode}")
+        flight.nav_thread.join(timeout)
+        timed_out = flight.nav_thread.is_alive()
+        if timed_out:
+            flight.stop_nav()
+        duration = time.perf_counter() - t0
+        sim_s = clk.now() - c0
+
+        last = waypoints[-1]
+        lat = aq.get("PLANE_LATITUDE")
+        lon = aq.get("PLANE_LONGITUDE")
+        alt = aq.get("PLANE_ALTITUDE")
+        summary.update(
+            points=len(waypoints),
+            start=start,
+            duration_s=duration,
+            sim_s=sim_s,
+            speedup=sim_s / duration if duration > 0 else 0.0,
+            frames=flight.loop_count,
+            fps=flight.loop_count / sim_s if sim_s > 0 else 0.0,     # saat zamanına göre
+            frame_us=flight.frame_cost_us if mode != "scenario" else None,
+            commands=cq.count + ce.count,
+            pos_err_nm=_haversine_nm(lat, lon, last.lat, last.lon),
+            alt_err_ft=abs(alt - last.alt),
+            timed_out=timed_out,
+            error=status.error,
+        )
+        if playback is not None:
+            summary["playback"] = playback.stats()
+    except Exception as e:
+        summary["error"] = f"{type(e).__name__}: {e}"
+    return summary
+
+
+def expand_paths(paths):
+    """Dizinleri içlerindeki *.json dosyalarına açar."""
+    out = []
+    for p in paths:
+        if os.path.isdir(p):
+            out += sorted(os.path.join(p, n) for n in os.listdir(p) if n.endswith(".json"))
+        else:
+            out.append(p)
+    return out
+
+
+def run_many(paths, jobs=1, **kwargs):
+    """Senaryoları sırayla ya da süreç havuzunda paralel koşturur.
+    Özetleri giriş sırasıyla üretir (generator).
+    """
+    if kwargs.get("backend") == "simconnect":
+        jobs = 1                     # tek sim oturumu paylaşılamaz
+    if jobs <= 1:
+        for p in paths:
+            yield run_one(p, **kwargs)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_one, p, **kwargs) for p in paths]
+        for fut in futures:
+            yield fut.result()
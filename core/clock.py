@@ -0,0 +1,223 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class RealClock:
+    """Gerçek zaman: time.monotonic / time.sleep / Event.wait."""
+
+    scale = 1.0
+
+    def now(self):
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def event(self):
+        return threading.Event()
+
+    def wait(self, event, timeout=None):
+        """event.wait(timeout) karşılığı; süre saat biriminde."""
+        return event.wait(timeout)
+
+    def spawn(self, target, *args, name=None):
+        """Görev iş parçacığı başlat (daemon) ve döndür."""
+        t = threading.Thread(target=target, args=args, name=name, daemon=True)
+        t.start()
+        return t
+
+    def call_later(self, delay, fn, *args):
+        """delay saniye (saat zamanı) sonra fn(*args) çağır."""
+        def _run():
+            self.sleep(delay)
+            fn(*args)
+        return self.spawn(_run)
+
+    def __repr__(self):
+        return "RealClock()"
+
+
+class ScaledClock(RealClock):
+    """Ölçekli zaman: scale=10 → 10 sn'lik bekleme gerçekte 1 sn sürer.
+    now() da aynı oranda ilerler; FakeSim bu saate göre integre edilirse
+    senaryo scale kat hızlı koşar.
+    """
+
+    def __init__(self, scale=10.0):
+        if scale <= 0:
+            raise ValueError("scale > 0 olmalı")
+        self.scale = float(scale)
+        self._t0 = time.monotonic()
+
+    def now(self):
+        return self._t0 + (time.monotonic() - self._t0) * self.scale
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds / self.scale)
+
+    def wait(self, event, timeout=None):
+        return event.wait(None if timeout is None else timeout / self.scale)
+
+    def __repr__(self):
+        return f"ScaledClock({self.scale:g})"
+
+
+# ────────────────────────────────────────────────────────────────────
+#   Tam benzetimli (olay adımlı) saat
+# ────────────────────────────────────────────────────────────────────
+class _Sleeper:
+    __slots__ = ("deadline", "event", "participant", "woken")
+
+    def __init__(self, deadline, event, participant):
+        self.deadline = deadline
+        self.event = event
+        self.participant = participant
+        self.woken = False
+
+
+class _SimEvent:
+    """threading.Event benzeri; set() edildiğinde SimClock'ta bekleyenleri uyandırır."""
+
+    def __init__(self, clock):
+        self._clock = clock
+        self._flag = False
+
+    def is_set(self):
+        return self._flag
+
+    def set(self):
+        clock = self._clock
+        with clock._cv:
+            self._flag = True
+            clock._wake_event(self)
+
+    def clear(self):
+        self._flag = False
+
+    def wait(self, timeout=None):
+        return self._clock.wait(self, timeout)
+
+
+class SimClock(RealClock):
+    """Olay adımlı sanal zaman. now() yalnızca saatin görev iş
+    parçacıklarının (spawn ile başlatılan) tümü sleep/wait'te beklerken
+    ilerler: zaman en yakın uyanma anına atlar. Böylece 10 dakikalık bir
+    senaryo FakeSim ile hesaplama süresi kadar (saniyeler) sürer.
+
+    Gerçek G/Ç yapan arka uçlarla (SimConnect) kullanılmamalıdır.
+    Bekleme olayları clock.event() ile üretilmelidir ki set() anında
+    bekleyen uyansın.
+    """
+
+    scale = float("inf")
+
+    def __init__(self, start=0.0):
+        self._cv = threading.Condition()
+        self._now = float(start)
+        self._running = 0                    # beklemede olmayan görev iş parçacığı sayısı
+        self._heap = []
+        self._by_event = {}
+        self._seq = itertools.count()
+        self._local = threading.local()
+        self.advances = 0
+
+    def now(self):
+        return self._now
+
+    def event(self):
+        return _SimEvent(self)
+
+    def spawn(self, target, *args, name=None):
+        def _run():
+            self._local.participant = True
+            try:
+                target(*args)
+            finally:
+                with self._cv:
+                    self._running -= 1
+                    self._advance()
+        with self._cv:
+            self._running += 1               # başlamadan say: arada zaman atlamasın
+        t = threading.Thread(target=_run, name=name, daemon=True)
+        t.start()
+        return t
+
+    def sleep(self, seconds):
+        self.wait(None, max(seconds, 0.0))
+
+    def wait(self, event, timeout=None):
+        participant = getattr(self._local, "participant", False)
+        with self._cv:
+            if event is not None and event.is_set():
+                return True
+            if timeout is not None and timeout <= 0:
+                return event.is_set() if event is not None else False
+            deadline = self._now + timeout if timeout is not None else float("inf")
+            s = _Sleeper(deadline, event, participant)
+            heapq.heappush(self._heap, (deadline, next(self._seq), s))
+            if event is not None:
+                self._by_event.setdefault(event, []).append(s)
+            if participant:
+                self._running -= 1
+            self._advance()
+            while not s.woken:
+                self._cv.wait()
+            return event.is_set() if event is not None else False
+
+    # --------------------------------------------------
+    def _wake(self, s):
+        if s.woken:
+            return
+        s.woken = True
+        if s.participant:
+            self._running += 1
+        if s.event is not None:
+            lst = self._by_event.get(s.event)
+            if lst:
+                lst.remove(s)
+                if not lst:
+                    del self._by_event[s.event]
+
+    def _wake_event(self, event):
+        for s in list(self._by_event.get(event, ())):
+            self._wake(s)
+        self._cv.notify_all()
+
+    def _advance(self):
+        """Koşan görev kalmadıysa zamanı en yakın uyanma anına taşı."""
+        heap = self._heap
+        while heap and heap[0][2].woken:
+            heapq.heappop(heap)                  # olayla uyanmış kayıtlar
+        if self._running > 0 or not heap:
+            return
+        deadline = heap[0][0]
+        if deadline == float("inf"):
+            return                               # herkes süresiz bekliyor: dış olay gerek
+        if deadline > self._now:
+            self._now = deadline
+            self.advances += 1
+        while heap and heap[0][0] <= self._now:
+            self._wake(heapq.heappop(heap)[2])
+        self._cv.notify_all()
+
+    def __repr__(self):
+        return f"SimClock(t={self._now:.3f})"
+
+
+REAL_CLOCK = RealClock()
+
+
+def make_clock(spec):
+    """"real" | "scaled:N" | "sim" → saat nesnesi."""
+    if spec is None or spec == "real":
+        return REAL_CLOCK
+    if spec == "sim":
+        return SimClock()
+    if spec.startswith("scaled"):
+        _, _, factor = spec.partition(":")
+        return ScaledClock(float(factor or 10.0))
+    raise ValueError(f"Bilinmeyen saat: {spec}")
@@ -0,0 +1,161 @@
+import math
+import threading
+
+from core.clock import REAL_CLOCK
+
+
+class FakeSim:
+    """SimConnect yerine kullanılabilen basit kinematik uçak modeli.
+    AircraftRequests / AircraftEvents arayüzünü taklit eder (aq.get/set,
+    ae.find) ve her okumada durumu geçen süre kadar ilerletir. Batch
+    koşularında ve simülatörsüz geliştirmede kullanılır. Süre clock'tan
+    okunur; ölçekli/sanal saatle senaryo gerçek zamandan hızlı koşar.
+    """
+
+    TURN_RATE_DPS = 3.0         # standart dönüş (°/s)
+    ACCEL_KT_S    = 4.0         # hızlanma / yavaşlama (kt/s)
+    ROTATE_KT     = 60.0        # kalkış dönüş hızı (kt)
+
+    def __init__(self, lat=40.8915, lon=29.3037, alt=1000.0, hdg=0.0, ias=0.0, clock=None):
+        self._lock = threading.Lock()
+        self.clock = clock or REAL_CLOCK
+        self._last = self.clock.now()
+        self.vars = {
+            "PLANE_LATITUDE": lat,
+            "PLANE_LONGITUDE": lon,
+            "PLANE_ALTITUDE": alt,
+            "PLANE_HEADING_DEGREES_TRUE": math.radians(hdg),
+            "AIRSPEED_INDICATED": ias,
+            "VERTICAL_SPEED": 0.0,
+            "PLANE_PITCH_DEGREES": 0.0,
+            "PLANE_BANK_DEGREES": 0.0,
+            "GENERAL_ENG_THROTTLE_LEVER_POSITION:1": 0.0,
+            "FLAPS_HANDLE_PERCENT": 0.0,
+            "ELEVATOR_TRIM_POSITION": 0.0,
+        }
+        # Otopilot durumu
+        self.ap = {
+            "master": False, "hdg_hold": False, "alt_hold": False,
+            "hdg_bug": hdg, "alt_var": alt, "vs": 0.0, "spd": 90.0,
+            "athr": False, "brakes": True,
+        }
+        self.aq = _FakeRequests(self)
+        self.ae = _FakeEvents(self)
+
+    # --------------------------------------------------
+    def _target_speed(self):
+        if self.ap["athr"]:
+            return self.ap["spd"]
+        if self.ap["brakes"]:
+            return 0.0
+        return 1.4 * self.vars["GENERAL_ENG_THROTTLE_LEVER_POSITION:1"]
+
+    def _advance(self):
+        now = self.clock.now()
+        dt, self._last = now - self._last, now
+        if dt <= 0:
+            return
+        v, ap = self.vars, self.ap
+
+        # ---- hız ----
+        tgt = self._target_speed()
+        ias = v["AIRSPEED_INDICATED"]
+        step = self.ACCEL_KT_S * dt
+        v["AIRSPEED_INDICATED"] = min(ias + step, tgt) if tgt > ias else max(ias - step, tgt)
+
+        # ---- heading ----
+        hdg = math.degrees(v["PLANE_HEADING_DEGREES_TRUE"]) % 360
+        bank = 0.0
+        if ap["master"] and ap["hdg_hold"]:
+            diff = (ap["hdg_bug"] - hdg + 540) % 360 - 180
+            turn = max(min(diff, self.TURN_RATE_DPS * dt), -self.TURN_RATE_DPS * dt)
+            hdg = (hdg + turn) % 360
+            bank = 25.0 if diff > 1 else -25.0 if diff < -1 else 0.0
+        v["PLANE_HEADING_DEGREES_TRUE"] = math.radians(hdg)
+        v["PLANE_BANK_DEGREES"] = math.radians(bank)
+
+        # ---- dikey ----
+        alt, vs = v["PLANE_ALTITUDE"], 0.0
+        airborne = v["AIRSPEED_INDICATED"] >= self.ROTATE_KT
+        if ap["master"] and airborne:
+            err = ap["alt_var"] - alt
+            if ap["alt_hold"]:
+                vs = max(min(err * 60.0 / dt, 1000.0), -1000.0)
+            else:
+                vs = ap["vs"]
+            dz = vs * dt / 60.0
+            if (ap["alt_hold"] or vs * err > 0) and abs(dz) > abs(err):
+                dz = err                    # hedef irtifa yakalandı
+            alt += dz
+        v["PLANE_ALTITUDE"] = alt
+        v["VERTICAL_SPEED"] = vs
+        v["PLANE_PITCH_DEGREES"] = math.radians(-vs / 200.0)
+
+        # ---- konum ----
+        dist_m = v["AIRSPEED_INDICATED"] * 1852.0 / 3600.0 * dt
+        if dist_m:
+            rad = math.radians(hdg)
+            lat = v["PLANE_LATITUDE"]
+            v["PLANE_LATITUDE"] = lat + dist_m * math.cos(rad) / 111_111.0
+            v["PLANE_LONGITUDE"] += dist_m * math.sin(rad) / (111_111.0 * math.cos(math.radians(lat)))
+
+    # --------------------------------------------------
+    def get(self, name, default=None):
+        with self._lock:
+            self._advance()
+            return self.vars.get(name, default)
+
+    def set(self, name, value):
+        with self._lock:
+            self._advance()
+            self.vars[name] = value
+
+    def event(self, name, *args):
+        with self._lock:
+            self._advance()
+            ap = self.ap
+            if name == "AP_MASTER":
+                ap["master"] = True
+            elif name == "AP_MASTER_OFF":
+                ap["master"] = False
+            elif name == "PARKING_BRAKES":
+                ap["brakes"] = not ap["brakes"]
+            elif name == "HEADING_BUG_SET" and args:
+                ap["hdg_bug"] = float(args[0]) % 360
+            elif name == "AP_HDG_HOLD_ON":
+                ap["hdg_hold"] = True
+            elif name == "AP_HDG_HOLD_OFF":
+                ap["hdg_hold"] = False
+            elif name == "AP_ALT_VAR_SET_ENGLISH" and args:
+                ap["alt_var"] = float(args[0])
+            elif name == "AP_VS_SET_ENGLISH" and args:
+                ap["vs"] = float(args[0])
+            elif name == "AP_ALT_HOLD_ON":
+                ap["alt_hold"] = True
+            elif name == "AP_ALT_HOLD_OFF":
+                ap["alt_hold"] = False
+            elif name == "AP_SPD_VAR_SET" and args:
+                ap["spd"] = float(args[0])
+            elif name == "AP_AUTOTHROTTLE_ARM":
+                ap["athr"] = True
+            elif name == "THROTTLE_AXIS_SET_EX1" and args:
+                self.vars["GENERAL_ENG_THROTTLE_LEVER_POSITION:1"] = float(args[0]) / 163.84
+
+
+class _FakeRequests:
+    def __init__(self, sim):
+        self._sim = sim
+
+    def get(self, name, default=None):
+        return self._sim.get(name, default)
+
+    def set(self, name, value):
+        self._sim.set(name, value)
+
+
+class _FakeEvents:
+    def __init__(self, sim):
+        self._sim = sim
+
+    def find(self, name):
+        return lambda *args: self._sim.event(name, *args)
@@ -1,31 +1,33 @@
 import math
 import time
-import threading
 
+from core.clock import REAL_CLOCK
+from core.geo import _bearing, _haversine_nm
+from core.log import get_logger
+from core.scenario import Frame, PackedScenario, as_frames
+from core.task_manager import FlightTaskManager
+from core.triggers import TriggerEngine, POSITION_VARS, within_nm
 
-def _bearing(lat1, lon1, lat2, lon2):
-    rlat1, rlat2 = map(math.radians, (lat1, lat2))
-    dlon = math.radians(lon2 - lon1)
-    x = math.sin(dlon) * math.cos(rlat2)
-    y = math.cos(rlat1) * math.sin(rlat2) - math.sin(rlat1) * math.cos(rlat2) * math.cos(dlon)
-    return (math.degrees(math.atan2(x, y)) + 360) % 360
+log = get_logger("flight")
 
 
-def _haversine_nm(lat1, lon1, lat2, lon2):
-    R_nm = 3440.065
-    dlat = math.radians(lat2 - lat1)
-    dlon = math.radians(lon2 - lon1)
-    a = math.sin(dlat/2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon/2)**2
-    return 2 * R_nm * math.asin(math.sqrt(a))
+def _fmt(v, spec):
+    return "—" if v is None else format(v, spec)
 
 
 class FlightController:
-    def __init__(self, aq, ae, status_callback=None):
+    def __init__(self, aq, ae, status_callback=None, triggers=None, clock=None, tasks=None):
         self.aq = aq
         self.ae = ae
         self.status_callback = status_callback
-        self.nav_thread = None
-        self.nav_stop = threading.Event()
+        # Tüm bekleme/zamanlama bu saatten geçer (gerçek, ölçekli ya da sanal)
+        self.clock = clock or (triggers.clock if triggers else REAL_CLOCK)
+        self.triggers = triggers or TriggerEngine(clock=self.clock)
+        # NAV / senaryo / veri takibi / ışınlama: aynı anda tek etkin görev
+        self.tasks = tasks or FlightTaskManager(self.clock)
+        self.loop_count = 0          # aktif görevin döngü/kare sayacı
+        self.frame_cost_us = 0.0     # follow_stream: kare başına ortalama işlem süresi (µs)
+        self.frame_applied = None    # follow_stream: kare sim'e yazılınca çağrılır (frame)
 
     def _status(self, msg):
         if self.status_callback:
@@ -36,32 +38,72 @@ class FlightController:
         if ev:
             ev(*args)
 
+    def _trig(self):
+        # aq bağlantı sonrası atanabildiği için her görevde eşitlenir
+        self.triggers.aq = self.aq
+        return self.triggers
+
+    def _read_position(self, trig):
+        # Son yoklama periyodunda başka okuyucu (telemetri yayını) tazelediyse
+        # anlık görüntüden alınır; sim'e ikinci kez gidilmez
+        pos = trig.fresh(POSITION_VARS)
+        return pos["PLANE_LATITUDE"], pos["PLANE_LONGITUDE"], pos["PLANE_ALTITUDE"]
+
+    @property
+    def nav_thread(self):
+        """Etkin görevin ana iş parçacığı (yoksa None)."""
+        return self.tasks.thread
+
+    @property
+    def nav_stop(self):
+        """Etkin görevin iptal token'ı."""
+        return self.tasks.token
+
     def stop_nav(self):
-        if self.nav_thread and self.nav_thread.is_alive():
-            self.nav_stop.set()
-            self.nav_thread.join()
+        """Etkin görevi (yan iş parçacıklarıyla) iptal et; geçiş süresi (ms)."""
+        return self.tasks.cancel()
+
+    def join_index(self, route_index):
+        """Uçağın anlık konumuna göre rotaya katılınacak nokta indeksi.
+        Bağlantı yoksa ya da konum okunamazsa baştan (0) başlanır.
+        """
+        if self.aq is None:
+            return 0
+        lat = self.aq.get("PLANE_LATITUDE")
+        lon = self.aq.get("PLANE_LONGITUDE")
+        if None in (lat, lon):
+            return 0
+        return route_index.join_index(lat, lon)
 
 
     def follow_stream(self, stream, interval=0.1):
         self.stop_nav()
-        self.nav_stop.clear()
+        self.loop_count = 0
+        self.frame_cost_us = 0.0
         self._status("📡 Veri takibi başladı…")
 
-        def _loop():
+        def _loop(token):
+            bind = getattr(stream, "bind_stop", None)
+            if bind is not None:
+                bind(token)              # akış kendi beklerken de iptal edilebilsin
             try:
                 self._ev("AP_MASTER_OFF")
 
+                busy = 0.0
                 for frame in stream:
-                    if self.nav_stop.is_set():
+                    if token.is_set():
                         break
-
-                    lat = frame.get("lat")
-                    lon = frame.get("lon")
-                    alt = frame.get("alt")
-                    hdg = frame.get("heading_deg")
-                    pitch = frame.get("pitch_deg") or frame.get("pitch")
-                    roll  = frame.get("roll_deg")  or frame.get("bank") or frame.get("roll")
-                    yaw   = frame.get("yaw_deg")
+                    t0 = time.perf_counter()
+                    self.loop_count += 1
+                    if not isinstance(frame, Frame):
+                        frame = Frame.from_mapping(frame)   # ham sözlük: takma adlar bir kez çözülür
+                        if frame is None:
+                            continue                        # bozuk kayıt: atla (günlükte)
+
+                    lat = frame.lat
+                    lon = frame.lon
+                    alt = frame.alt
+                    hdg = frame.heading_deg
 
                     # Pozisyon
                     if lat is not None: self.aq.set("PLANE_LATITUDE", lat)
@@ -69,24 +111,26 @@ class FlightController:
                     if alt is not None: self.aq.set("PLANE_ALTITUDE", alt)
 
                     if hdg is not None:
-                        print(f"Trying to set heading to {hdg}")
-                        hdg_deg = frame["heading_deg"]
-                        hdg_rad = math.radians(hdg_deg) * 366 / 360
+                        hdg_rad = math.radians(hdg) * 366 / 360
                         self._ev("HEADING_BUG_SET", int(hdg))
                         self.aq.set("PLANE_HEADING_DEGREES_TRUE", hdg_rad) # Asıl heading set 
-                        print(f"Trying to set heading to {hdg_rad}")
+                        log.debug("Heading %s° → %.4f rad", hdg, hdg_rad)
 
-                        
+                    if self.frame_applied:
+                        self.frame_applied(frame)
                     self._status(
-                        f"📡 LAT {lat:.4f} LON {lon:.4f} ALT {alt} HDG {hdg}"
+                        f"📡 LAT {_fmt(lat, '.4f')} LON {_fmt(lon, '.4f')} ALT {alt} HDG {hdg}"
                     )
-                    time.sleep(interval)
+                    busy += time.perf_counter() - t0
+                    self.frame_cost_us = busy / self.loop_count * 1e6
+                    if interval and token.sleep(interval):
+                        break
 
                 self._status("✅ Veri takibi bitti.")
             except Exception as e:
                 self._status(f"❌ Veri takibi hata: {e}")
 
-        threading.Thread(target=_loop, daemon=True).start()
+        self.tasks.start("follow", _loop)
 
     def teleport(self, lat, lon, alt, spd, hdg=None, step_m=5):
         """
@@ -96,6 +140,7 @@ class FlightController:
         • hdg=None     : ilk adımda zorla heading -> otomatik hesap; elle verirsen bu kullanılır
         • step_m       : yatay adım (metre)
         """
+        self.stop_nav()
         try:
             # --- Mevcut konum / irtifa ---
             cur_lat = self.aq.get("PLANE_LATITUDE")
@@ -129,12 +174,12 @@ class FlightController:
             self._ev("HEADING_BUG_SET", first_hdg)
             self._ev("AP_HDG_HOLD_ON")
 
-            # ---- Adım döngüsü (ayrı thread) ----
-            def _step_loop():
+            # ---- Adım döngüsü (görev olarak) ----
+            def _step_loop(token):
                 nonlocal cur_lat, cur_lon, cur_alt
                 for i in range(steps):
-                    if self.nav_stop.is_set():
-                        break
+                    if token.is_set():
+                        return           # iptal: hedefe atlamadan bırak
 
                     cur_lat += d_lat_per
                     cur_lon += d_lon_per
@@ -146,7 +191,8 @@ class FlightController:
 
                     self._ev("AP_ALT_VAR_SET_ENGLISH", int(cur_alt))
                     self._status(f"📍 Step {i+1}/{steps}  LAT:{cur_lat:.6f}  LON:{cur_lon:.6f}  ALT:{cur_alt:.1f}")
-                    time.sleep(0.1)
+                    if token.sleep(0.1):
+                        return
 
                 # Son değerleri hedefe eşitle
                 self.aq.set("PLANE_LATITUDE",  lat)
@@ -162,7 +208,7 @@ class FlightController:
                 self._ev("AP_AUTOTHROTTLE_ARM")
                 self._ev("THROTTLE_AXIS_SET_EX1", 8192)
 
-            threading.Thread(target=_step_loop, daemon=True).start()
+            self.tasks.start("teleport", _step_loop)
 
         except Exception as e:
             self._status(f"❌ Işınlama hatası: {e}")
@@ -170,28 +216,28 @@ class FlightController:
     def fly_to(self, lat, lon, alt, spd):
         self._ev("AP_ALT_HOLD_OFF")
         self.stop_nav()
-        self.nav_stop.clear()
+        self.loop_count = 0
         self._prepare_autopilot(lat, lon, alt, spd)                # ✱ spd ile
         
-        threading.Timer(0.5, lambda: self._prepare_autopilot(lat, lon, alt, spd)).start()
-        self.nav_thread = threading.Thread(
-            target=self._nav_loop, args=(lat, lon, alt), daemon=True
-        )
-        self.nav_thread.start()
+        task = self.tasks.start("nav", self._nav_loop, lat, lon, alt)
+        # 0.5 s sonra tekrar uygula (görev iptal edilirse uygulanmaz)
+        self.tasks.call_later(task.token, 0.5, self._prepare_autopilot, lat, lon, alt, spd)
 
 
-    def fly_scenario(self, waypoints):
+    def fly_scenario(self, waypoints, start=0):
         self.stop_nav()
-        self.nav_stop.clear()
+        self.loop_count = 0
 
         if not waypoints:
             self._status("❌ Senaryo boş.")
             return
 
-        self.nav_thread = threading.Thread(
-            target=self._scenario_loop, args=(waypoints,), daemon=True
-        )
-        self.nav_thread.start()
+        # Görev kendi kopyasını uçar: UI listeyi (yerinde) değiştirse de
+        # bacak indeksleri kaymaz (ayrık modda kopya zaten pickle ile gelir)
+        waypoints = as_frames(waypoints)
+        if isinstance(waypoints, PackedScenario):
+            waypoints = waypoints.copy()
+        self.tasks.start("scenario", self._scenario_loop, waypoints, start)
 
     def _prepare_autopilot(self, tgt_lat, tgt_lon, tgt_alt, tgt_spd):
         self._ev("AP_ALT_HOLD_OFF")
@@ -204,7 +250,7 @@ class FlightController:
 
         self._ev("AP_MASTER")
         self._ev("HEADING_BUG_SET", int(brg))
-        self._ev("AP_HDG_HOLD_OFF"); time.sleep(0.05); self._ev("AP_HDG_HOLD_ON")
+        self._ev("AP_HDG_HOLD_OFF"); self.clock.sleep(0.05); self._ev("AP_HDG_HOLD_ON")
 
         # ---- dikey profil ----
         self._ev("AP_ALT_VAR_SET_ENGLISH", int(tgt_alt))
@@ -220,16 +266,17 @@ class FlightController:
         self._ev("THROTTLE_AXIS_SET_EX1", 8192)
         self._ev("AP_AUTOTHROTTLE_ARM")
 
-    def _nav_loop(self, tgt_lat, tgt_lon, tgt_alt):
+    def _nav_loop(self, token, tgt_lat, tgt_lon, tgt_alt):
         self._status("🗺️ NAV başladı…")
+        trig = self._trig()
+        arrive = within_nm(tgt_lat, tgt_lon, 0.3)
         try:
-            while not self.nav_stop.is_set():
-                cur_lat = self.aq.get("PLANE_LATITUDE")
-                cur_lon = self.aq.get("PLANE_LONGITUDE")
-                cur_alt = self.aq.get("PLANE_ALTITUDE")
+            while not token.is_set():
+                self.loop_count += 1
+                cur_lat, cur_lon, cur_alt = self._read_position(trig)
 
                 if None in (cur_lat, cur_lon, cur_alt):
-                    time.sleep(0.5)
+                    token.sleep(0.5)
                     continue
 
                 dist_nm = _haversine_nm(cur_lat, cur_lon, tgt_lat, tgt_lon)
@@ -256,23 +303,27 @@ class FlightController:
 
                 if abs(alt_err) < 100 and abs(dist_nm) < 3:
                     self._ev("AP_ALT_HOLD_ON")
-                time.sleep(1)
+                # Bir sonraki yönlendirmeye kadar bekle; okumayı döngü yapar,
+                # başka okuyucu (telemetri yayını) varışı görürse erken uyanır
+                trig.wait_for(arrive, timeout=1.0, stop=token, poll=False)
 
             self._ev("AP_VS_SET_ENGLISH", 0)
         except Exception as e:
             self._status(f"❌ NAV hata: {e}")
 
-    def _scenario_loop(self, waypoints):
-        self._status("📍 Senaryo başladı…")
+    def _scenario_loop(self, token, waypoints, start=0):
+        self._status("📍 Senaryo başladı…" if not start else f"📍 Senaryoya {start + 1}. noktadan katılındı…")
+        trig = self._trig()
         try:
-            for idx, wp in enumerate(waypoints, start=1):
-                if self.nav_stop.is_set():
+            for idx in range(start + 1, len(waypoints) + 1):
+                if token.is_set():
                     break
+                wp = waypoints[idx - 1]
 
-                tgt_lat = wp["lat"]
-                tgt_lon = wp["lon"]
-                tgt_alt = wp["alt"]
-                tgt_spd = wp.get("spd", 90)
+                tgt_lat = wp.lat
+                tgt_lon = wp.lon
+                tgt_alt = wp.alt
+                tgt_spd = wp.spd if wp.spd is not None else 90
 
                 self._status(
                     f"🎯 Nokta {idx}/{len(waypoints)} → LAT {tgt_lat:.4f}  LON {tgt_lon:.4f}  ALT {tgt_alt}  SPD {tgt_spd}"
@@ -280,16 +331,15 @@ class FlightController:
 
                 self._prepare_autopilot(tgt_lat, tgt_lon, tgt_alt, tgt_spd)
                 # 0.5 saniye sonra tekrar uygula
-                threading.Timer(0.5, lambda lat=tgt_lat, lon=tgt_lon, alt=tgt_alt, spd=tgt_spd:
-                self._prepare_autopilot(lat, lon, alt, spd)).start()
+                self.tasks.call_later(token, 0.5, self._prepare_autopilot, tgt_lat, tgt_lon, tgt_alt, tgt_spd)
 
-                while not self.nav_stop.is_set():
-                    cur_lat = self.aq.get("PLANE_LATITUDE")
-                    cur_lon = self.aq.get("PLANE_LONGITUDE")
-                    cur_alt = self.aq.get("PLANE_ALTITUDE")
+                arrive = within_nm(tgt_lat, tgt_lon, 0.3)
+                while not token.is_set():
+                    self.loop_count += 1
+                    cur_lat, cur_lon, cur_alt = self._read_position(trig)
 
                     if None in (cur_lat, cur_lon, cur_alt):
-                        time.sleep(0.5)
+                        token.sleep(0.5)
                         continue
 
                     dist_nm = _haversine_nm(cur_lat, cur_lon, tgt_lat, tgt_lon)
@@ -316,7 +366,7 @@ class FlightController:
                     self._status(
                         f"✈️ {idx}. Nokta → Dist {dist_nm:.2f} NM  AltFark {alt_err:.0f} ft  BRG {brg:.0f}°"
                     )
-                    time.sleep(1)
+                    trig.wait_for(arrive, timeout=1.0, stop=token, poll=False)
 
             self._status("✅ Senaryo tamamlandı.")
             self._ev("AP_VS_SET_ENGLISH", 0)
@@ -0,0 +1,17 @@
+import math
+
+
+def _bearing(lat1, lon1, lat2, lon2):
+    rlat1, rlat2 = map(math.radians, (lat1, lat2))
+    dlon = math.radians(lon2 - lon1)
+    x = math.sin(dlon) * math.cos(rlat2)
+    y = math.cos(rlat1) * math.sin(rlat2) - math.sin(rlat1) * math.cos(rlat2) * math.cos(dlon)
+    return (math.degrees(math.atan2(x, y)) + 360) % 360
+
+
+def _haversine_nm(lat1, lon1, lat2, lon2):
+    R_nm = 3440.065
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat/2)**2 + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon/2)**2
+    return 2 * R_nm * math.asin(math.sqrt(a))
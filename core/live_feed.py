@@ -0,0 +1,319 @@
+import socket
+import struct
+import threading
+import time
+from collections import deque
+
+from core.playback import TimedPlayback
+from core.scenario import FIELDS, Frame
+
+
+# Kablo formatı (sürüm 2): magic "USL2", sıra no (uint32), ardından FIELDS
+# sırasıyla float64 alanlar (eksik = NaN). Sabit boyutlu kayıt; TCP'de art
+# arda gelir. Sürüm 1 ("USLF", "t" alanı yok) eski göndericiler için okunur.
+_MAGIC = b"USL2"
+RECORD = struct.Struct("<4sI" + "d" * len(FIELDS))
+_V1_MAGIC = b"USLF"
+_V1_FIELDS = tuple(f for f in FIELDS if f != "t")
+_LAYOUTS = {
+    _MAGIC:    (RECORD, FIELDS, ()),
+    _V1_MAGIC: (struct.Struct("<4sI" + "d" * len(_V1_FIELDS)), _V1_FIELDS, ("t",)),
+}
+_SYNC = b"USL"                 # tüm sürümlerin ortak öneki (TCP'de yeniden hizalama)
+_NAN = float("nan")
+
+POLICIES = ("drop_oldest", "latest")
+
+
+def encode_frame(frame, seq, buf=None, offset=0):
+    """Frame'i (ya da alan sözlüğünü) kablo kaydına çevirir. buf verilirse
+    içine yazar (pack_into), yoksa bytes döndürür."""
+    get = frame.get
+    vals = [get(f) for f in FIELDS]
+    vals = [_NAN if v is None else v for v in vals]
+    if buf is None:
+        return RECORD.pack(_MAGIC, seq & 0xFFFFFFFF, *vals)
+    RECORD.pack_into(buf, offset, _MAGIC, seq & 0xFFFFFFFF, *vals)
+
+
+def parse_address(text, default_port=49005):
+    """"udp:49005", "tcp:127.0.0.1:49005" → (proto, host, port)."""
+    parts = text.strip().split(":")
+    proto = parts.pop(0).lower() if parts[0].lower() in ("udp", "tcp") else "udp"
+    host, port = "127.0.0.1", default_port
+    if len(parts) >= 2:
+        host, port = parts[0] or host, int(parts[1])
+    elif parts and parts[0]:
+        port = int(parts[0])
+    return proto, host, port
+
+
+class _Wake:
+    """CancelToken.link için: iptalde koşul değişkenini uyandırır."""
+
+    __slots__ = ("cond",)
+
+    def __init__(self, cond):
+        self.cond = cond
+
+    def set(self):
+        with self.cond:
+            self.cond.notify_all()
+
+
+class LiveFeed:
+    """Yerel UDP/TCP soketinden canlı kare (Frame) kaynağı.
+
+    Alıcı iş parçacığı kayıtları önceden ayrılmış tampona (recv_into) alır
+    ve önceden ayrılmış Frame havuzundan birine çözer; kuyruk maxlen ile
+    sınırlıdır. Politika:
+      • "drop_oldest" — kuyruk doluyken en eski kare atılır
+      • "latest"      — yalnızca en taze kare tutulur (maxlen=1)
+    Böylece tüketici yavaş kalsa da gecikme birikmez; sim her zaman en
+    yeni örneği izler. Nesne bir iterator'dır: follow_stream(feed, 0).
+
+    Gecikme: alım anından FlightController.frame_applied kancasına
+    (kare sim'e yazıldıktan sonra) kadar geçen süre ölçülür.
+    İlk kare geldikten sonra idle_timeout saniye veri gelmezse akış biter;
+    ilk kare (kaynak geç başlasa da) close() ya da görev iptaline dek
+    beklenir. follow_stream görev token'ını bind_stop ile bağlar.
+    """
+
+    def __init__(self, proto="udp", host="127.0.0.1", port=49005, policy="drop_oldest",
+                 maxlen=8, idle_timeout=5.0):
+        if policy not in POLICIES:
+            raise ValueError(f"Bilinmeyen politika: {policy}")
+        if proto not in ("udp", "tcp"):
+            raise ValueError(f"Bilinmeyen protokol: {proto}")
+        self.proto, self.host, self.port = proto, host, port
+        self.policy = policy
+        self.maxlen = 1 if policy == "latest" else max(1, maxlen)
+        self.idle_timeout = idle_timeout
+
+        # Havuz: kuyruk + tüketicinin elindeki + alıcının yazdığı
+        pool = [Frame() for _ in range(self.maxlen + 2)]
+        self._free = deque(pool)
+        self._queue = deque()
+        self._rx_time = {fr: 0.0 for fr in pool}
+        self._held = None
+        self._cond = threading.Condition()
+        self._sock = None
+        self._thread = None
+        self._closed = threading.Event()
+        self._stop = None                # follow_stream görev token'ı (bind_stop)
+        self._streaming = False          # bu takipte kare verildi mi (boşta sayacı için)
+
+        # İstatistikler
+        self.received = self.dropped = self.lost = self.bad = self.applied = 0
+        self.latency_ms = self.latency_max_ms = 0.0
+        self._latency_sum = 0.0
+        self._last_seq = None
+
+    # --------------------------------------------------
+    def start(self):
+        """Soketi aç ve alıcı iş parçacığını başlat."""
+        if self.proto == "udp":
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind((self.host, self.port))
+        else:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind((self.host, self.port))
+            s.listen(1)
+        s.settimeout(0.2)
+        self.port = s.getsockname()[1]          # port=0 → işletim sisteminin verdiği
+        self._sock = s
+        self._thread = threading.Thread(target=self._rx_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._closed.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+
+    # --------------------------------------------------
+    def _rx_loop(self):
+        buf = bytearray(RECORD.size * 64)
+        view = memoryview(buf)
+        try:
+            if self.proto == "udp":
+                while not self._closed.is_set():
+                    try:
+                        n = self._sock.recv_into(buf)
+                    except socket.timeout:
+                        continue
+                    self._ingest_datagram(buf, n)
+            else:
+                while not self._closed.is_set():
+                    try:
+                        conn, _ = self._sock.accept()
+                    except socket.timeout:
+                        continue
+                    conn.settimeout(0.2)
+                    have = 0
+                    with conn:
+                        while not self._closed.is_set():
+                            try:
+                                n = conn.recv_into(view[have:])
+                            except socket.timeout:
+                                continue
+                            if not n:
+                                break                    # gönderici kapattı: yeni bağlantı bekle
+                            have += n
+                            used = self._ingest_stream(buf, have)
+                            if used:                     # yarım kaydı başa taşı
+                                buf[:have - used] = buf[used:have]
+                                have -= used
+        except OSError:
+            pass                                         # close(): soket kapandı
+
+    def _ingest_datagram(self, buf, n):
+        """UDP: datagram tek sürümden tam kayıtlar içermeli; değilse
+        (bilinmeyen magic, kayıt boyutunun katı olmayan uzunluk) bozuk sayılır."""
+        layout = _LAYOUTS.get(bytes(buf[:4]))
+        if layout is None or not n or n % layout[0].size:
+            self.bad += 1
+            return
+        rec_struct = layout[0]
+        for off in range(0, n, rec_struct.size):
+            if buf[off:off + 4] != buf[:4]:
+                self.bad += 1
+                continue
+            self._ingest(rec_struct.unpack_from(buf, off), layout)
+
+    def _ingest_stream(self, buf, have):
+        """TCP: baştaki tam kayıtları işle, tüketilen bayt sayısını döndür.
+        Bilinmeyen veri bir kez bozuk sayılır ve sonraki magic'e atlanır."""
+        off = 0
+        while have - off >= 4:
+            layout = _LAYOUTS.get(bytes(buf[off:off + 4]))
+            if layout is None:
+                self.bad += 1
+                nxt = buf.find(_SYNC, off + 1, have)
+                off = nxt if nxt >= 0 else max(off + 1, have - len(_SYNC) + 1)
+                continue
+            size = layout[0].size
+            if have - off < size:
+                break
+            self._ingest(layout[0].unpack_from(buf, off), layout)
+            off += size
+        return off
+
+    def _ingest(self, rec, layout):
+        """Tek kaydı havuzdaki Frame'e çöz ve kuyruğa koy."""
+        _, fields, missing = layout
+        now = time.perf_counter()
+        seq = rec[1]
+        if self._last_seq is not None and seq != (self._last_seq + 1) & 0xFFFFFFFF:
+            self.lost += (seq - self._last_seq - 1) & 0xFFFFFFFF
+        self._last_seq = seq
+        self.received += 1
+
+        with self._cond:
+            fr = self._free.popleft()               # havuz boyutu sayesinde hep dolu
+            for i, f in enumerate(fields, start=2):
+                v = rec[i]
+                setattr(fr, f, None if v != v else v)     # NaN → None
+            for f in missing:
+                setattr(fr, f, None)                      # eski sürümde olmayan alan
+            self._rx_time[fr] = now
+            if len(self._queue) >= self.maxlen:
+                self._free.append(self._queue.popleft())
+                self.dropped += 1
+            self._queue.append(fr)
+            self._cond.notify()
+
+    # --------------------------------------------------
+    def bind_stop(self, stop):
+        """Görev token'ını bağla: iptalde bekleyen __next__ hemen biter.
+        Her takipte yeniden çağrılır; boşta sayacı ilk kareye dek durur."""
+        self._stop = stop
+        self._streaming = False
+        link = getattr(stop, "link", None)
+        if link is not None:
+            link(_Wake(self._cond))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._cond:
+            if self._held is not None:            # önceki kare işlendi: havuza geri
+                self._free.append(self._held)
+                self._held = None
+            # Boşta sayacı ilk kareden sonra işler: kaynak geç başlayabilir
+            deadline = time.monotonic() + self.idle_timeout \
+                if self.idle_timeout and self._streaming else None
+            stop = self._stop
+            while not self._queue:
+                if self._closed.is_set() or (stop is not None and stop.is_set()):
+                    raise StopIteration
+                left = deadline - time.monotonic() if deadline else 0.5
+                if left <= 0:
+                    raise StopIteration
+                self._cond.wait(min(left, 0.5))
+            self._held = fr = self._queue.popleft()
+            self._streaming = True
+            return fr
+
+    def frame_applied(self, frame):
+        """FlightController kancası: kare sim'e uygulandı → gecikmeyi kaydet."""
+        t = self._rx_time.get(frame)
+        if not t:
+            return
+        ms = (time.perf_counter() - t) * 1000
+        self.applied += 1
+        self._latency_sum += ms
+        self.latency_ms = ms
+        if ms > self.latency_max_ms:
+            self.latency_max_ms = ms
+
+    def stats(self):
+        avg = self._latency_sum / self.applied if self.applied else 0.0
+        return {
+            "received": self.received, "applied": self.applied, "dropped": self.dropped,
+            "lost": self.lost, "bad": self.bad,
+            "latency_ms": self.latency_ms, "latency_avg_ms": avg,
+            "latency_max_ms": self.latency_max_ms,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (f"{s['received']} alındı, {s['applied']} uygulandı, {s['dropped']} atıldı, "
+                f"{s['lost']} kayıp  gecikme ort {s['latency_avg_ms']:.1f} ms "
+                f"/ max {s['latency_max_ms']:.1f} ms")
+
+
+def send_frames(frames, proto="udp", host="127.0.0.1", port=49005, rate_hz=50.0, timed=False):
+    """Kareleri rate_hz ile LiveFeed'e gönderir (test/tekrar oynatma).
+    timed=True → her kare kendi zaman damgasında (TimedPlayback) gönderilir."""
+    if proto == "udp":
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        send = lambda b: s.sendto(b, (host, port))
+    else:
+        s = socket.create_connection((host, port))
+        send = s.sendall
+    buf = bytearray(RECORD.size)
+    dt = 1.0 / rate_hz
+    nxt = time.perf_counter()
+    if timed:
+        frames = TimedPlayback(frames)
+    try:
+        for seq, fr in enumerate(frames):
+            encode_frame(fr, seq, buf)
+            send(buf)
+            if timed:
+                continue                 # bekleme TimedPlayback'te
+            nxt += dt
+            delay = nxt - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+    finally:
+        s.close()
@@ -0,0 +1,192 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+
+
+# Tüm modüller bu kökün altında günlükler; yapılandırılmadıysa sessizdir
+# (NullHandler: Python'un stderr'e eşzamanlı "last resort" yazımı devreye girmez)
+ROOT = "msfs"
+logging.getLogger(ROOT).addHandler(logging.NullHandler())
+
+_handler = None
+_listener = None
+_atexit_registered = False
+
+
+def get_logger(name):
+    """msfs.<name> günlükçüsü."""
+    return logging.getLogger(f"{ROOT}.{name}")
+
+
+# ────────────────────────────────────────────────────────────────────
+#   Çağıran tarafı: hız sınırı + tekrar bastırma, bloklamayan kuyruk
+# ────────────────────────────────────────────────────────────────────
+class Throttle(logging.Filter):
+    """Mesaj başına hız sınırı ve tekrarlayan hata bastırma.
+
+    Anahtar (kaynak, seviye, şablon)'dur: %-biçimli çağrılarda değerler
+    değişse de aynı satır aynı kovaya düşer. Her kova saniyede rate
+    jeton kazanır (en çok burst). WARNING ve üstünde, dedup_s içinde
+    metni aynı olan kayıt da bastırılır. Bastırılan sayı, aynı anahtarın
+    geçen bir sonraki kaydına record.suppressed olarak eklenir.
+    """
+
+    def __init__(self, rate=5.0, burst=10, dedup_s=5.0):
+        super().__init__()
+        self.rate, self.burst, self.dedup_s = rate, burst, dedup_s
+        self._buckets = {}               # anahtar → [jeton, son zaman, bastırılan, son metin, metin zamanı]
+        self._lock = threading.Lock()
+        self.suppressed = 0
+
+    def filter(self, record):
+        key = (record.name, record.levelno, record.msg)
+        now = record.created
+        text = record.getMessage() if self.dedup_s and record.levelno >= logging.WARNING else None
+        with self._lock:
+            b = self._buckets.get(key)
+            if b is None:
+                b = self._buckets[key] = [float(self.burst), now, 0, None, 0.0]
+            tokens = b[0]
+            if self.rate:
+                tokens = min(float(self.burst), tokens + (now - b[1]) * self.rate)
+                b[1] = now
+            dup = text is not None and text == b[3] and now - b[4] < self.dedup_s
+            if dup or (self.rate and tokens < 1.0):
+                b[0] = tokens
+                b[2] += 1
+                self.suppressed += 1
+                return False
+            b[0] = tokens - 1.0 if self.rate else tokens
+            record.suppressed, b[2] = b[2], 0
+            if text is not None:
+                b[3], b[4] = text, now
+            return True
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Kuyruk doluysa kaydı düşürür (çağıran asla beklemez). Biçimlendirme
+    dinleyici iş parçacığında yapılır; kayıtlar aynı süreçte kaldığı için
+    kopyalanmaz (günlük argümanları değiştirilmeyen değerler olmalı)."""
+
+    dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record):
+        return record
+
+
+# ────────────────────────────────────────────────────────────────────
+#   Dinleyici tarafı: konsol ve JSONL çıkışları
+# ────────────────────────────────────────────────────────────────────
+class _ConsoleFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s", "%H:%M:%S")
+
+    def formatMessage(self, record):
+        s = super().formatMessage(record)
+        n = getattr(record, "suppressed", 0)
+        return f"{s}  (+{n} bastırıldı)" if n else s
+
+
+class JsonlHandler(logging.Handler):
+    """Her kayıt bir JSON satırı: t, lvl, src, msg (+ n: bastırılan, exc).
+    Yazım tamponludur; flush_s'de bir ve kapanışta diske aktarılır."""
+
+    def __init__(self, path, flush_s=1.0):
+        super().__init__()
+        self.path = path
+        self.flush_s = flush_s
+        self._f = open(path, "a", encoding="utf-8")
+        self._last_flush = 0.0
+        self._exc_fmt = logging.Formatter()
+
+    def emit(self, record):
+        try:
+            d = {"t": round(record.created, 6), "lvl": record.levelname,
+                 "src": record.name, "msg": record.getMessage()}
+            n = getattr(record, "suppressed", 0)
+            if n:
+                d["n"] = n
+            if record.exc_info:
+                d["exc"] = self._exc_fmt.formatException(record.exc_info)
+            self._f.write(json.dumps(d, ensure_ascii=False) + "\n")
+            if record.created - self._last_flush >= self.flush_s:
+                self._f.flush()
+                self._last_flush = record.created
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        try:
+            if not self._f.closed:
+                self._f.close()
+        finally:
+            super().close()
+
+
+# ────────────────────────────────────────────────────────────────────
+def setup_logging(level="WARNING", jsonl=None, console=True,
+                  rate=5.0, burst=10, dedup_s=5.0, queue_size=10000):
+    """msfs.* günlüklerini arka plan kuyruğuna bağla.
+
+    Çağıran iş parçacığı (denetim döngüsü, PFD) yalnızca kaydı süzgeçten
+    geçirip kuyruğa bırakır; biçimlendirme ve G/Ç QueueListener iş
+    parçacığında olur. rate=0 → hız sınırı yok; dedup_s=0 → tekrar
+    bastırma yok. İkinci çağrı önceki yapılandırmayı kapatır.
+    """
+    global _handler, _listener, _atexit_registered
+    if isinstance(level, str):
+        level = level.upper()
+        if not isinstance(logging.getLevelName(level), int):
+            raise ValueError(f"Bilinmeyen günlük seviyesi: {level!r}")
+    shutdown_logging()
+    sinks = []
+    if console:
+        h = logging.StreamHandler(sys.stderr)
+        h.setFormatter(_ConsoleFormatter())
+        sinks.append(h)
+    if jsonl:
+        sinks.append(JsonlHandler(jsonl))
+
+    _handler = _QueueHandler(queue.Queue(queue_size))
+    _handler.addFilter(Throttle(rate, burst, dedup_s))
+    root = logging.getLogger(ROOT)
+    root.setLevel(level)
+    root.addHandler(_handler)
+    root.propagate = False
+    _listener = logging.handlers.QueueListener(_handler.queue, *sinks)
+    _listener.start()
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
+    return _handler
+
+
+def shutdown_logging():
+    """Kuyruktaki kayıtları yaz ve çıkışları kapat."""
+    global _handler, _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for h in _listener.handlers:
+        h.close()
+    logging.getLogger(ROOT).removeHandler(_handler)
+    _handler = _listener = None
+
+
+def log_stats():
+    """{"dropped": kuyruk dolu, "suppressed": hız sınırı/tekrar, "queued": bekleyen}."""
+    h = _handler
+    if h is None:
+        return {"dropped": 0, "suppressed": 0, "queued": 0}
+    throttle = h.filters[0]
+    return {"dropped": h.dropped, "suppressed": throttle.suppressed, "queued": h.queue.qsize()}
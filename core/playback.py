@@ -0,0 +1,114 @@
+from array import array
+
+from core.clock import REAL_CLOCK
+from core.scenario import as_frames
+
+
+def frame_times(waypoints, default_dt=0.1):
+    """Karelerin zaman damgaları (s, array('d')). 't' alanı olmayan kare
+    bir öncekinden default_dt sonra sayılır; geri giden damga bir
+    öncekine eşitlenir (zaman monoton kalır)."""
+    cols = getattr(waypoints, "cols", None)     # PackedScenario: sütundan oku (eksik = NaN)
+    raw = cols["t"] if cols else [wp.t for wp in waypoints]
+    out = array("d")
+    prev = None
+    for v in raw:
+        if v is None or v != v:
+            v = 0.0 if prev is None else prev + default_dt
+        elif prev is not None and v < prev:
+            v = prev
+        out.append(v)
+        prev = v
+    return out
+
+
+def has_timestamps(waypoints):
+    """Senaryoda en az bir zaman damgası var mı?"""
+    cols = getattr(waypoints, "cols", None)
+    if cols:
+        return any(v == v for v in cols["t"])
+    return any(wp.t is not None for wp in as_frames(waypoints))
+
+
+class TimedPlayback:
+    """Zaman damgalı oynatma: her kare kendi t'sine göre saatte planlanır
+    (hedef = başlangıç + (t - t0) / speed); düzensiz örneklenmiş kayıtlar
+    sabit hıza yeniden örneklenmeden doğru hızda oynar.
+
+    Geride kalınırsa zamanı gelmiş kareler toplu atlanır ve yalnızca en
+    yenisi verilir; gecikme birikmez. Zamanlama hatası (kare verildiği an
+    − hedef an) her karede ölçülür. Nesne bir iterator'dır:
+    follow_stream(playback, 0). follow_stream görev token'ını bind_stop ile
+    bağlar; uzun boşluklarda bekleme de iptal anında kesilir.
+    """
+
+    def __init__(self, waypoints, start=0, clock=None, speed=1.0, default_dt=0.1):
+        self.waypoints = waypoints = as_frames(waypoints)
+        self.times = frame_times(waypoints, default_dt)
+        self.clock = clock or REAL_CLOCK
+        self.speed = speed
+        self.i = start
+        self._stop = None
+        self._t0 = self._c0 = None
+        self.frames = self.skipped = 0
+        self.err_sum = self.err_max = 0.0     # s
+
+    def bind_stop(self, stop):
+        self._stop = stop
+
+    def _due(self, i):
+        return self._c0 + (self.times[i] - self._t0) / self.speed
+
+    def _wait(self, dt):
+        """dt bekle; durdurulduysa True."""
+        stop = self._stop
+        if stop is None:
+            self.clock.sleep(dt)
+            return False
+        sleep = getattr(stop, "sleep", None)            # CancelToken
+        return sleep(dt) if sleep is not None else self.clock.wait(stop, dt)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        n, clk = len(self.times), self.clock
+        if self.i >= n:
+            raise StopIteration
+        if self._c0 is None:
+            self._c0, self._t0 = clk.now(), self.times[self.i]
+        due = self._due(self.i)
+        now = clk.now()
+        if due > now:
+            if self._wait(due - now):
+                raise StopIteration
+            now = clk.now()
+        else:
+            # Geride: zamanı gelmiş kareleri atla, en yenisini ver
+            j = self.i
+            while j + 1 < n and self._due(j + 1) <= now:
+                j += 1
+            self.skipped += j - self.i
+            self.i, due = j, self._due(j)
+        err = now - due
+        self.frames += 1
+        self.err_sum += err
+        if err > self.err_max:
+            self.err_max = err
+        frame = self.waypoints[self.i]
+        self.i += 1
+        return frame
+
+    # --------------------------------------------------
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "skipped": self.skipped,
+            "timing_err_ms": self.err_sum / self.frames * 1000 if self.frames else 0.0,
+            "timing_err_max_ms": self.err_max * 1000,
+        }
+
+    def summary(self):
+        s = self.stats()
+        return (f"{s['frames']} kare, {s['skipped']} atlandı, zamanlama hatası "
+                f"ort {s['timing_err_ms']:.1f} ms / en kötü {s['timing_err_max_ms']:.1f} ms")
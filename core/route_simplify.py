@@ -0,0 +1,62 @@
+import math
+
+
+_M_PER_DEG = 111_111.0
+
+
+def simplify_route(waypoints, tol_m=15.0, alt_tol=50.0):
+    """Yoğun izi Douglas-Peucker ile en az sayıda bacağa (leg) indirger.
+    Bir nokta, kaldırıldığında oluşan doğrudan yatay sapması tol_m
+    metreyi ya da irtifa sapması alt_tol'u (dosyadaki irtifa birimi)
+    aşıyorsa tutulur. İlk ve son nokta her zaman korunur.
+    alt_tol=None → yalnızca yatay sapmaya bakılır. tol_m > 0 olmalıdır.
+    """
+    if not tol_m > 0:
+        raise ValueError(f"Sadeleştirme toleransı pozitif olmalı (tol_m={tol_m!r})")
+    n = len(waypoints)
+    if n <= 2:
+        return list(waypoints)
+
+    cols = getattr(waypoints, "cols", None)     # PackedScenario: sütunlardan oku
+    lats = cols["lat"] if cols else [wp.lat for wp in waypoints]
+    lons = cols["lon"] if cols else [wp.lon for wp in waypoints]
+    zs   = cols["alt"] if cols else [wp.alt for wp in waypoints]
+    lat0 = sum(lats) / n
+    kx = _M_PER_DEG * math.cos(math.radians(lat0))
+    xs = [lon * kx for lon in lons]
+    ys = [lat * _M_PER_DEG for lat in lats]
+    inv_h = 1.0 / tol_m
+    inv_v = 1.0 / alt_tol if alt_tol else 0.0
+
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]                # özyineleme yerine yığın: derin izlerde taşma olmaz
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        ax, ay, az = xs[a], ys[a], zs[a]
+        sx, sy, sz = xs[b] - ax, ys[b] - ay, zs[b] - az
+        seg2 = sx * sx + sy * sy
+        worst, worst_i = 1.0, -1
+        for i in range(a + 1, b):
+            px, py = xs[i] - ax, ys[i] - ay
+            t = (px * sx + py * sy) / seg2 if seg2 else 0.0
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+            dx, dy = px - t * sx, py - t * sy
+            err = math.sqrt(dx * dx + dy * dy) * inv_h
+            if inv_v:
+                err = max(err, abs(zs[i] - az - t * sz) * inv_v)
+            if err > worst:
+                worst, worst_i = err, i
+        if worst_i >= 0:
+            keep[worst_i] = True
+            stack.append((a, worst_i))
+            stack.append((worst_i, b))
+
+    return [waypoints[i] for i in range(n) if keep[i]]
+
+
+def compression_ratio(original, simplified):
+    """Sadeleştirme oranı (ör. 300.0 → 300 noktadan 1'e)."""
+    return len(original) / max(len(simplified), 1)
@@ -0,0 +1,300 @@
+import json
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+
+from core.log import get_logger
+
+log = get_logger("scenario")
+
+
+M_TO_FT   = 3.28084
+MPS_TO_KT = 1.943844
+
+# Dosyalarda karşılaşılan alan adları → normalize edilmiş alan adı.
+# Her ad (anahtar, çarpan) çiftidir: irtifa ft'e, hız kt'a çevrilir.
+_ALIASES = {
+    "lat":         (("latitude", 1.0), ("lat", 1.0)),
+    "lon":         (("longitude", 1.0), ("lon", 1.0)),
+    "alt":         (("altitude_m", M_TO_FT), ("altitude_ft", 1.0), ("alt", 1.0)),
+    "spd":         (("spd", 1.0), ("speed_kt", 1.0), ("speed_mps", MPS_TO_KT)),
+    "heading_deg": (("heading_deg", 1.0), ("heading", 1.0), ("hdg", 1.0)),
+    "pitch_deg":   (("pitch_deg", 1.0), ("pitch", 1.0)),
+    "roll_deg":    (("roll_deg", 1.0), ("bank", 1.0), ("roll", 1.0)),
+    "yaw_deg":     (("yaw_deg", 1.0),),
+    "flaps":       (("flaps", 1.0),),
+    "elev_trim":   (("elev_trim", 1.0),),
+    # İsteğe bağlı kayıt zamanı (s); zaman damgalı oynatma (core.playback) kullanır
+    "t":           (("t", 1.0), ("time_s", 1.0), ("time", 1.0), ("time_ms", 0.001)),
+}
+
+_REQUIRED = ("lat", "lon", "alt")
+
+# Sıkıştırılmış (packed) sütun düzeninin alan sırası
+FIELDS = tuple(_ALIASES)
+
+
+def _first(wp, keys):
+    for k, factor in keys:
+        v = wp.get(k)
+        if v is not None:
+            return float(v) * factor
+    return None
+
+
+class Frame:
+    """Tek waypoint / veri karesi. Alan başına bir slot (sözlük yok),
+    eksik alan None. Sıcak döngüler alanlara öznitelikle erişir
+    (frame.lat); get()/[] yalnızca eski sözlük tabanlı kod için.
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, **values):
+        for f in FIELDS:
+            setattr(self, f, values.get(f))
+
+    @classmethod
+    def from_mapping(cls, wp):
+        """Ham sözlüğü (takma adlar + birim dönüşümü) Frame'e çevirir.
+        Zorunlu alan denetimi yapmaz; canlı akış kareleri için. Sözlük
+        olmayan ya da sayıya çevrilemeyen kare None döner (günlüğe yazılır):
+        akış tek bozuk kayıtta kesilmez."""
+        try:
+            return normalize_waypoint(wp, strict=False)
+        except (ValueError, TypeError) as e:
+            log.warning("Bozuk kare atlandı: %s (%.80r)", e, wp)
+            return None
+
+    def get(self, name, default=None):
+        v = getattr(self, name, None)
+        return default if v is None else v
+
+    def __getitem__(self, name):
+        v = getattr(self, name, None)
+        if v is None:
+            raise KeyError(name)
+        return v
+
+    def __repr__(self):
+        vals = ", ".join(f"{f}={getattr(self, f)!r}" for f in FIELDS if getattr(self, f) is not None)
+        return f"Frame({vals})"
+
+
+def normalize_waypoint(wp, idx=0, strict=True):
+    """Ham waypoint sözlüğünü tek tip alan adlarına ve birimlere çevirip
+    Frame döndürür (irtifa ft, hız kt, açılar derece). strict=True iken
+    eksik zorunlu alan (lat/lon/alt) ya da geçersiz koordinat ValueError
+    fırlatır.
+    """
+    if not isinstance(wp, dict):
+        raise ValueError(f"{idx}. nokta sözlük değil")
+    fr = Frame.__new__(Frame)
+    for name, keys in _ALIASES.items():
+        v = _first(wp, keys)
+        if v is None and strict and name in _REQUIRED:
+            raise ValueError(f"{idx}. noktada '{name}' eksik")
+        setattr(fr, name, v)
+    if strict and not (-90.0 <= fr.lat <= 90.0 and -180.0 <= fr.lon <= 180.0):
+        raise ValueError(f"{idx}. noktada geçersiz koordinat")
+    if strict:
+        if fr.heading_deg is None:
+            fr.heading_deg = 0.0
+        if fr.flaps is None:
+            fr.flaps = 0.0
+        if fr.elev_trim is None:
+            fr.elev_trim = 0.0
+    return fr
+
+
+def load_scenario(path):
+    """JSON senaryo dosyasını oku → normalize edilmiş, sütun tabanlı
+    PackedScenario (normalizasyon burada bir kez yapılır).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        waypoints = json.load(f)
+    if not isinstance(waypoints, list):
+        raise ValueError("Liste formatı bekleniyor")
+    return PackedScenario(pack(normalize_waypoint(wp, i) for i, wp in enumerate(waypoints, start=1)))
+
+
+def as_frames(waypoints):
+    """Sözlük listesi → Frame listesi; zaten Frame/PackedScenario ise aynen."""
+    if isinstance(waypoints, PackedScenario):
+        return waypoints
+    return [wp if isinstance(wp, Frame) else normalize_waypoint(wp, i)
+            for i, wp in enumerate(waypoints, start=1)]
+
+
+def stream_frames(waypoints, interval=0.0, start=0, clock=None):
+    """Waypoint listesini follow_stream için kare (frame) akışına çevirir.
+    Hızı follow_stream(interval) belirler; burada ek bekleme yalnızca
+    interval > 0 verilirse yapılır (clock.sleep; varsayılan gerçek zaman).
+    start: rotaya katılınacak kare indeksi.
+    """
+    sleep = clock.sleep if clock is not None else time.sleep
+    for i in range(start, len(waypoints)):
+        yield waypoints[i]
+        if interval:
+            sleep(interval)
+
+
+# ────────────────────────────────────────────────────────────────────
+#   Sıkıştırılmış sütun gösterimi: alan başına bir array('d'), eksik = NaN
+# ────────────────────────────────────────────────────────────────────
+_NAN = float("nan")
+_PACK_MAGIC  = b"USCN"
+_PACK_HEADER = struct.Struct("<4sHqqI")   # magic, sürüm, kaynak mtime_ns, kaynak boyutu, nokta sayısı
+_PACK_VERSION = 3                         # 2: irtifa ft'e normalize, 3: t sütunu
+
+
+def pack(frames):
+    """Frame dizisi → {alan: array('d')} sütunları (None → NaN)."""
+    cols = {f: array("d") for f in FIELDS}
+    appenders = [(f, cols[f].append) for f in FIELDS]
+    for fr in frames:
+        for f, app in appenders:
+            v = getattr(fr, f)
+            app(_NAN if v is None else v)
+    return cols
+
+
+class PackedScenario:
+    """Sıkıştırılmış sütunlar (alan başına array('d')) üzerinde waypoint
+    dizisi; nokta başına ~80 bayt. Frame nesneleri yalnızca erişildiğinde
+    üretilir; böylece büyük senaryolar önbellekten anında "yüklenir".
+
+    shared=True (önbellekten gelen sütunlar): ilk değişiklikte sütunlar
+    kopyalanır (yazarken kopyala), önbellekteki kayıt bozulmaz. Toplu
+    işlemler (offset, delete) nokta başına Frame üretmeden doğrudan
+    sütun dilimleri üzerinde çalışır: delete dilim silme (memmove),
+    offset dilim üzerinde tek map geçişi.
+    """
+
+    __slots__ = ("cols", "_n", "shared")
+
+    def __init__(self, cols=None, shared=False):
+        self.cols = cols if cols is not None else {f: array("d") for f in FIELDS}
+        self._n = len(self.cols[FIELDS[0]])
+        self.shared = shared and cols is not None
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(self._n))]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("waypoint indeksi aralık dışında")
+        cols = self.cols
+        fr = Frame.__new__(Frame)
+        for f in FIELDS:
+            v = cols[f][i]
+            setattr(fr, f, v if v == v else None)    # NaN → None
+        return fr
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self[i]
+
+    def _own(self):
+        if self.shared:
+            self.cols = {f: c[:] for f, c in self.cols.items()}     # dilim kopyası: memcpy
+            self.shared = False
+
+    def append(self, frame):
+        self._own()
+        if not isinstance(frame, Frame):
+            frame = normalize_waypoint(frame, self._n + 1)
+        for f in FIELDS:
+            v = getattr(frame, f)
+            self.cols[f].append(_NAN if v is None else v)
+        self._n += 1
+
+    def clear(self):
+        if self.shared:
+            self.cols, self.shared = {f: array("d") for f in FIELDS}, False
+        for col in self.cols.values():
+            del col[:]
+        self._n = 0
+
+    # ---- Toplu işlemler ----
+    def offset(self, field, delta, start=0, stop=None):
+        """field sütununa [start, stop) aralığında delta ekle (eksik/NaN kalır)."""
+        self._own()
+        col = self.cols[field]
+        sl = slice(start, self._n if stop is None else stop)
+        col[sl] = array("d", map(float(delta).__add__, col[sl]))
+
+    def delete(self, start, stop=None):
+        """[start, stop) aralığındaki noktaları sil."""
+        self._own()
+        sl = slice(start, self._n if stop is None else stop)
+        for col in self.cols.values():
+            del col[sl]
+        self._n = len(self.cols[FIELDS[0]])
+
+    def copy(self):
+        return PackedScenario({f: c[:] for f, c in self.cols.items()})
+
+    def to_list(self):
+        return list(self)
+
+
+def packed_nbytes(cols):
+    return sum(c.itemsize * len(c) for c in cols.values())
+
+
+def save_packed(path, cols, source_key=(0, 0)):
+    """Sütunları ikili dosyaya yazar. source_key: kaynak (mtime_ns, boyut).
+
+    Önce aynı dizinde yazana özel geçici dosyaya yazılır, sonra
+    os.replace ile yerine konur: paralel okuyan/yazan işçiler ve yarıda
+    kalan yazım hiçbir zaman yarım dosya görmez.
+    """
+    n = len(cols[FIELDS[0]]) if cols else 0
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_PACK_HEADER.pack(_PACK_MAGIC, _PACK_VERSION, source_key[0], source_key[1], n))
+            for name in FIELDS:
+                col = cols[name]
+                if sys.byteorder != "little":
+                    col = array("d", col)
+                    col.byteswap()
+                f.write(col.tobytes())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_packed(path, source_key=None):
+    """save_packed() dosyasını okur. source_key verilir ve eşleşmezse
+    (kaynak değişmiş) ya da dosya bozuksa None döner.
+    """
+    try:
+        with open(path, "rb") as f:
+            magic, ver, mtime_ns, size, n = _PACK_HEADER.unpack(f.read(_PACK_HEADER.size))
+            if magic != _PACK_MAGIC or ver != _PACK_VERSION:
+                return None
+            if source_key is not None and (mtime_ns, size) != tuple(source_key):
+                return None
+            cols = {}
+            for name in FIELDS:
+                col = array("d")
+                col.fromfile(f, n)
+                if sys.byteorder != "little":
+                    col.byteswap()
+                cols[name] = col
+            return cols
+    except (OSError, EOFError, struct.error):
+        return None
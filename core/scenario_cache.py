@@ -0,0 +1,82 @@
+import os
+import threading
+from collections import OrderedDict
+
+from core.scenario import load_scenario, packed_nbytes, save_packed, load_packed, PackedScenario
+
+
+class ScenarioCache:
+    """Ayrıştırılmış + normalize edilmiş senaryoların LRU önbelleği.
+    Anahtar (mutlak yol, mtime_ns, boyut): dosya değişince kayıt geçersiz
+    olur. Kayıtlar sıkıştırılmış sütunlar (array('d')) olarak tutulur;
+    toplam boyut max_bytes'ı aşınca en az kullanılan kayıt atılır.
+    sidecar=True ise sütunlar "<dosya>.cache" yanına da yazılır, böylece
+    uygulama yeniden açıldığında JSON tekrar ayrıştırılmaz.
+    """
+
+    SIDECAR_EXT = ".cache"
+
+    def __init__(self, max_bytes=256 * 1024 * 1024, sidecar=False):
+        self.max_bytes = max_bytes
+        self.sidecar = sidecar
+        self.nbytes = 0
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()       # yol → (anahtar, sütunlar, bayt)
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------
+    def load(self, path):
+        """Senaryoyu önbellekten (ya da diskten) waypoint dizisi
+        (PackedScenario) olarak verir; sütunlar paylaşılır, ilk
+        değişiklikte kopyalanır.
+        """
+        return PackedScenario(self.load_packed(path), shared=True)
+
+    def load_packed(self, path):
+        """Senaryonun sıkıştırılmış sütunlarını verir (paylaşılan nesne, değiştirmeyin)."""
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        key = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[0] == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        cols = load_packed(path + self.SIDECAR_EXT, key) if self.sidecar else None
+        if cols is None:
+            cols = load_scenario(path).cols
+            if self.sidecar:
+                try:
+                    save_packed(path + self.SIDECAR_EXT, cols, key)
+                except OSError:
+                    pass                    # salt-okunur dizin: yalnızca bellekte tut
+        self._put(path, key, cols)
+        return cols
+
+    def _put(self, path, key, cols):
+        size = packed_nbytes(cols)
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old:
+                self.nbytes -= old[2]
+            if size > self.max_bytes:
+                return                      # bütçeden büyük kayıt önbelleğe alınmaz
+            self._entries[path] = (key, cols, size)
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                _, (_, _, dropped) = self._entries.popitem(last=False)
+                self.nbytes -= dropped
+
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self.nbytes = 0
+            elif (entry := self._entries.pop(os.path.abspath(path), None)):
+                self.nbytes -= entry[2]
+
+    def __len__(self):
+        return len(self._entries)
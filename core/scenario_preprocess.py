@@ -0,0 +1,138 @@
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.flight_controller import _haversine_nm
+from core.route_simplify import simplify_route
+from core.scenario import load_scenario, save_packed, load_packed, PackedScenario
+
+
+INDEX_NAME = "index.json"
+PACKED_EXT = ".scn"
+INDEX_VERSION = 1
+
+
+def route_stats(waypoints, simplify_tol_m=15.0):
+    """Rota istatistikleri: uzunluk (NM), toplam tırmanış/iniş (ft),
+    sadeleştirilmiş bacak sayısı, irtifa aralığı.
+    """
+    cols = getattr(waypoints, "cols", None)
+    lats = cols["lat"] if cols else [wp.lat for wp in waypoints]
+    lons = cols["lon"] if cols else [wp.lon for wp in waypoints]
+    alts = cols["alt"] if cols else [wp.alt for wp in waypoints]
+    length_nm = climb_ft = descent_ft = 0.0
+    for i in range(1, len(alts)):
+        length_nm += _haversine_nm(lats[i - 1], lons[i - 1], lats[i], lons[i])
+        dz = alts[i] - alts[i - 1]
+        if dz > 0:
+            climb_ft += dz
+        else:
+            descent_ft -= dz
+    return {
+        "points": len(waypoints),
+        "length_nm": round(length_nm, 3),
+        "climb_ft": round(climb_ft, 1),
+        "descent_ft": round(descent_ft, 1),
+        "min_alt_ft": round(min(alts), 1) if alts else None,
+        "max_alt_ft": round(max(alts), 1) if alts else None,
+        "legs": max(len(simplify_route(waypoints, simplify_tol_m)) - 1, 0),
+    }
+
+
+def preprocess_file(src, out_dir, simplify_tol_m=15.0):
+    """Tek dosyayı doğrula + normalize et + istatistik çıkar + .scn olarak yaz.
+    Süreç havuzunda çalışır; yalnızca küçük özet sözlüğünü geri döndürür.
+    """
+    st = os.stat(src)
+    name = os.path.basename(src)
+    entry = {"file": name, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    t0 = time.perf_counter()
+    try:
+        waypoints = load_scenario(src)
+        if not waypoints:
+            raise ValueError("Senaryo boş")
+        packed = os.path.splitext(name)[0] + PACKED_EXT
+        save_packed(os.path.join(out_dir, packed), waypoints.cols, (st.st_mtime_ns, st.st_size))
+        entry["packed"] = packed
+        entry.update(route_stats(waypoints, simplify_tol_m))
+        entry["error"] = None
+    except Exception as e:
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return entry
+
+
+def read_index(out_dir):
+    """index.json'u okur; yoksa ya da sürümü uymuyorsa None."""
+    try:
+        with open(os.path.join(out_dir, INDEX_NAME), "r", encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == INDEX_VERSION else None
+
+
+def load_indexed(out_dir, entry):
+    """İndeks kaydının .scn dosyasını açar. Kaynak JSON o günden beri
+    değiştiyse (ya da .scn yoksa) None döner; çağıran JSON'a düşmelidir.
+    """
+    if not entry.get("packed"):
+        return None
+    src = os.path.join(out_dir, entry.get("source_dir", ""), entry["file"])
+    try:
+        st = os.stat(src)
+    except OSError:
+        return None
+    cols = load_packed(os.path.join(out_dir, entry["packed"]), (st.st_mtime_ns, st.st_size))
+    return PackedScenario(cols) if cols is not None else None
+
+
+def preprocess_dir(src_dir, out_dir=None, jobs=None, simplify_tol_m=15.0, force=False,
+                   progress=None):
+    """Dizindeki tüm *.json senaryoları süreç havuzunda ön-işler ve
+    out_dir/index.json yazar. Değişmemiş (mtime/boyut aynı) dosyalar
+    force=False iken yeniden işlenmez. progress(entry) her dosyada çağrılır.
+    """
+    out_dir = out_dir or src_dir
+    os.makedirs(out_dir, exist_ok=True)
+    names = sorted(n for n in os.listdir(src_dir) if n.endswith(".json") and n != INDEX_NAME)
+
+    old = {} if force else {e["file"]: e for e in (read_index(out_dir) or {}).get("scenarios", [])}
+    entries, todo = {}, []
+    for n in names:
+        st = os.stat(os.path.join(src_dir, n))
+        e = old.get(n)
+        if (e and not e.get("error") and e.get("mtime_ns") == st.st_mtime_ns
+                and e.get("size") == st.st_size
+                and os.path.exists(os.path.join(out_dir, e["packed"]))):
+            entries[n] = e
+        else:
+            todo.append(os.path.join(src_dir, n))
+
+    def _done(entry):
+        entries[entry["file"]] = entry
+        if progress:
+            progress(entry)
+
+    if jobs == 1 or len(todo) <= 1:
+        for src in todo:
+            _done(preprocess_file(src, out_dir, simplify_tol_m))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunk = max(1, len(todo) // ((jobs or os.cpu_count() or 1) * 4))
+            for entry in pool.map(preprocess_file, todo, [out_dir] * len(todo),
+                                  [simplify_tol_m] * len(todo), chunksize=chunk):
+                _done(entry)
+
+    source_dir = os.path.relpath(src_dir, out_dir)
+    index = {
+        "version": INDEX_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scenarios": [dict(entries[n], source_dir=source_dir) for n in names],
+    }
+    tmp = os.path.join(out_dir, INDEX_NAME + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, ensure_ascii=False)
+    os.replace(tmp, os.path.join(out_dir, INDEX_NAME))   # yarım yazılmış indeks görünmesin
+    return index
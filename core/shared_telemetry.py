@@ -0,0 +1,113 @@
+import struct
+import time
+from multiprocessing import shared_memory
+
+from core.telemetry_server import TELEMETRY_VARS
+
+
+# Paylaşılan bloktaki alanlar: PFD değişkenleri + sim sürecinin görev durumu
+SHARED_VARS = TELEMETRY_VARS + ("NAV_ACTIVE", "LOOP_COUNT")
+
+_SEQ    = struct.Struct("<Q")
+_VALUES = struct.Struct("<" + "d" * len(SHARED_VARS))
+_STAMP  = struct.Struct("<d")
+BLOCK_SIZE = _SEQ.size + _STAMP.size + _VALUES.size
+_NAN = float("nan")
+
+
+class SharedTelemetry:
+    """Süreçler arası telemetri bloğu (multiprocessing.shared_memory).
+
+    Düzen: seq (uint64) | yayın zamanı (time.time) | SHARED_VARS (float64).
+    Tek yazar seqlock kullanır: yazmadan önce seq tek sayıya, bitince çifte
+    çıkar. Okuyucu seq'i önce ve sonra okur; tekse ya da değiştiyse yeniden
+    dener. Böylece okuyucu hiçbir zaman yarım yazılmış bir görüntü görmez ve
+    yazar (sim süreci) okuyucuyu (UI) asla beklemez.
+
+    Okuyucu tarafı aq gibi get(name, default) sunar; PFDWindow ve
+    TelemetryServer'a doğrudan verilebilir (set() yok sayılır).
+    """
+
+    def __init__(self, name=None, create=False):
+        self._shm = shared_memory.SharedMemory(name=name, create=create, size=BLOCK_SIZE)
+        self.name = self._shm.name
+        self._buf = self._shm.buf
+        self._owner = create
+        self._seq = 0
+        self._cache_seq = -1
+        self._cache = dict.fromkeys(SHARED_VARS)
+        self.retries = 0                 # okuyucunun yeniden deneme sayısı (ölçüm)
+        self.stale = 0                   # süre dolup eski görüntü dönülen okuma sayısı
+        self._last_raw = None            # son tutarlı (seq, zaman, değerler)
+        if create:
+            _SEQ.pack_into(self._buf, 0, 0)
+            _VALUES.pack_into(self._buf, _SEQ.size + _STAMP.size, *([_NAN] * len(SHARED_VARS)))
+
+    def close(self):
+        self._buf = None
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    # Yazar (sim süreci) --------------------------------------------------
+    def write(self, values):
+        """values: SHARED_VARS sırasıyla float dizisi (None → NaN)."""
+        buf = self._buf
+        self._seq += 1
+        _SEQ.pack_into(buf, 0, self._seq * 2 - 1)         # tek: yazılıyor
+        _STAMP.pack_into(buf, _SEQ.size, time.time())
+        _VALUES.pack_into(buf, _SEQ.size + _STAMP.size,
+                          *[_NAN if v is None else v for v in values])
+        _SEQ.pack_into(buf, 0, self._seq * 2)             # çift: tutarlı
+
+    # Okuyucu (UI süreci) --------------------------------------------------
+    READ_TIMEOUT_S = 0.05        # yazım bu kadar sürmez; aşılırsa yazar yazarken ölmüştür
+
+    def read_raw(self):
+        """Tutarlı (seq, zaman, değerler) üçlüsü; yazar yazarken yeniden dener.
+        READ_TIMEOUT_S içinde tutarlı görüntü alınamazsa (yazar seq tekken
+        öldü) son tutarlı görüntü döner — zamanı eskidiği için age_s
+        büyür; hiç yoksa TimeoutError."""
+        buf = self._buf
+        deadline = None
+        while True:
+            s1 = _SEQ.unpack_from(buf, 0)[0]
+            if not s1 & 1:
+                stamp = _STAMP.unpack_from(buf, _SEQ.size)[0]
+                vals = _VALUES.unpack_from(buf, _SEQ.size + _STAMP.size)
+                if _SEQ.unpack_from(buf, 0)[0] == s1:
+                    self._last_raw = raw = (s1, stamp, vals)
+                    return raw
+            self.retries += 1
+            now = time.monotonic()
+            if deadline is None:
+                deadline = now + self.READ_TIMEOUT_S
+            elif now >= deadline:
+                if self._last_raw is None:
+                    raise TimeoutError("Paylaşılan telemetri okunamadı (yazar yarıda kaldı)")
+                self.stale += 1
+                return self._last_raw
+            time.sleep(0)
+
+    def read(self):
+        """Son tutarlı görüntü → {SimVar: değer} (okunamayan = None)."""
+        seq, _, vals = self.read_raw()
+        if seq != self._cache_seq:
+            self._cache = {n: (None if v != v else v) for n, v in zip(SHARED_VARS, vals)}
+            self._cache_seq = seq
+        return self._cache
+
+    @property
+    def age_s(self):
+        """Son yayından bu yana geçen süre (sn)."""
+        return time.time() - self.read_raw()[1]
+
+    def get(self, name, default=None):
+        v = self.read().get(name)
+        return default if v is None else v
+
+    def set(self, name, value):
+        pass
@@ -0,0 +1,376 @@
+import multiprocessing as mp
+import queue
+import threading
+from collections import deque
+
+from core.log import get_logger, setup_logging
+from core.scenario import FIELDS, Frame
+from core.shared_telemetry import SharedTelemetry
+from core.telemetry_server import TELEMETRY_VARS
+
+log = get_logger("sim_process")
+
+
+# ────────────────────────────────────────────────────────────────────
+#   Sim süreci: SimConnect G/Ç + uçuş denetimi (UI'dan ayrı GIL)
+# ────────────────────────────────────────────────────────────────────
+_EMPTY = object()          # zaman aşımı: kare yok
+_SUPERSEDED = object()     # daha yeni bir takip başladı
+
+
+class _FrameRouter:
+    """Sim sürecindeki tek kare kuyruğunu takip nesillerine (gen) dağıtır.
+
+    Takip yeniden başlatılırken eski akış kuyruğu boşaltmaya devam
+    edebilir. Eski nesillerin kareleri atılır; yeni nesle ait bir kare
+    eski akışa düşerse yeni akış için sırasıyla saklanır ve eski akış
+    biter. Okuma kilit altında yapılır, böylece kare sırası korunur.
+    """
+
+    def __init__(self, frame_q):
+        self.frame_q = frame_q
+        self.latest = 0
+        self._held = {}                  # gen → deque(değerler)
+        self._lock = threading.Lock()
+
+    def begin(self, gen):
+        """Yeni takip: gen'den eski akışlar ilk okumada biter."""
+        with self._lock:
+            self._advance(gen)
+
+    def _advance(self, gen):
+        if gen > self.latest:
+            self.latest = gen
+            for g in [g for g in self._held if g < gen]:
+                del self._held[g]
+
+    def next(self, gen, timeout=0.2):
+        """gen'in sıradaki değerleri (akış sonu: None), _EMPTY ya da _SUPERSEDED."""
+        with self._lock:
+            if gen < self.latest:
+                return _SUPERSEDED
+            held = self._held.get(gen)
+            if held:
+                return held.popleft()
+            try:
+                item_gen, values = self.frame_q.get(timeout=timeout)
+            except queue.Empty:
+                return _EMPTY
+            self._advance(item_gen)
+            if item_gen == gen:
+                return values
+            if item_gen > gen:
+                self._held.setdefault(item_gen, deque()).append(values)   # yeni takibe sakla
+                return _SUPERSEDED
+            return _EMPTY                # önceki takipten kalan kare: atılır
+
+
+class _QueueStream:
+    """_FrameRouter'dan follow_stream akışı: yalnızca kendi nesline (gen)
+    ait kareleri verir; akış sonu (None), daha yeni takip ya da görev
+    iptali (bind_stop) ile biter."""
+
+    def __init__(self, router, gen):
+        self.router, self.gen = router, gen
+        self._stop = None
+
+    def bind_stop(self, stop):
+        self._stop = stop
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        stop = self._stop
+        while stop is None or not stop.is_set():
+            values = self.router.next(self.gen)
+            if values is _EMPTY:
+                continue
+            if values is None or values is _SUPERSEDED:
+                break
+            return Frame(**dict(zip(FIELDS, values)))
+        raise StopIteration
+
+
+def _connect(backend):
+    if backend == "fake":
+        from core.fake_sim import FakeSim
+        sim = FakeSim()
+        return sim.aq, sim.ae
+    from core.simconnect_manager import SimConnectManager
+    mgr = SimConnectManager()
+    mgr.connect()
+    return mgr.get_requests(), mgr.get_events()
+
+
+def _sim_main(shm_name, cmd_q, reply_q, status_q, frame_q, backend, rate_hz, log_cfg):
+    """Sim süreci giriş noktası (spawn ile başlatılabilmesi için modül düzeyinde)."""
+    if log_cfg:
+        setup_logging(**log_cfg)
+    from core.autopilot_controller import AutopilotController
+    from core.flight_controller import FlightController
+    from core.task_manager import FlightTaskManager
+    from core.triggers import TriggerEngine
+
+    shm = SharedTelemetry(shm_name)
+    # Koşullar çoğunlukla yayın okumalarıyla beslenir; yoklama önbellekten sık olmasın
+    if backend == "simconnect":
+        from core.simconnect_manager import SimConnectManager
+        triggers = TriggerEngine(rate_hz=min(rate_hz, 1000.0 / SimConnectManager.CACHE_MS))
+    else:
+        triggers = TriggerEngine()
+    tasks = FlightTaskManager()
+    autopilot = AutopilotController(None, None, lambda m: status_q.put(("autopilot", m)),
+                                    triggers=triggers, tasks=tasks)
+    flight = FlightController(None, None, lambda m: status_q.put(("flight", m)),
+                              triggers=triggers, tasks=tasks)
+    stop = threading.Event()
+    router = _FrameRouter(frame_q)
+
+    def _publish():
+        aq = flight.aq
+        vals = [aq.get(n) for n in TELEMETRY_VARS]
+        triggers.update(dict(zip(TELEMETRY_VARS, vals)))   # bekleyen koşullar ek okuma yapmaz
+        nav = flight.nav_thread
+        vals.append(1.0 if nav is not None and nav.is_alive() else 0.0)
+        vals.append(float(flight.loop_count))
+        shm.write(vals)
+
+    def _publish_loop():
+        dt = 1.0 / rate_hz
+        while not stop.is_set():
+            try:
+                if flight.aq is not None:
+                    _publish()
+            except Exception as e:
+                log.debug("Telemetri yayını hatası: %s", e)   # sonraki turda tekrar
+            stop.wait(dt)
+
+    threading.Thread(target=_publish_loop, daemon=True).start()
+
+    def _bg(fn, *args):
+        threading.Thread(target=fn, args=args, daemon=True).start()
+
+    try:
+        while True:
+            cmd, *args = cmd_q.get()
+            if cmd == "shutdown":
+                break
+            try:
+                if cmd == "connect":
+                    aq, ae = _connect(backend)
+                    autopilot.aq = flight.aq = aq
+                    autopilot.ae = flight.ae = ae
+                    _publish()                 # UI ilk okumada dolu görüntü görsün
+                    reply_q.put(None)
+                elif cmd == "takeoff":
+                    _bg(autopilot.takeoff_sequence)
+                elif cmd == "teleport":
+                    _bg(flight.teleport, *args)
+                elif cmd == "fly_to":
+                    _bg(flight.fly_to, *args)
+                elif cmd == "fly_scenario":
+                    _bg(flight.fly_scenario, *args)
+                elif cmd == "follow":
+                    gen, interval = args
+                    router.begin(gen)          # eski akış yeni takibin karelerini tüketmesin
+                    flight.follow_stream(_QueueStream(router, gen), interval)
+                elif cmd == "stop":
+                    flight.stop_nav()
+            except Exception as e:
+                if cmd == "connect":
+                    reply_q.put(f"{type(e).__name__}: {e}")
+                else:
+                    log.exception("Sim süreci komut hatası (%s)", cmd)
+                    status_q.put(("flight", f"❌ {cmd} hata: {e}"))
+    finally:
+        stop.set()
+        flight.stop_nav()
+        shm.close()
+
+
+# ────────────────────────────────────────────────────────────────────
+#   UI tarafı vekilleri: SimConnectManager / AutopilotController /
+#   FlightController ile aynı arayüz, işi sim sürecine komutla yaptırır
+# ────────────────────────────────────────────────────────────────────
+class RemoteSimManager:
+    def __init__(self, proc):
+        self._proc = proc
+
+    def connect(self, timeout=30.0):
+        self._proc.cmd_q.put(("connect",))
+        try:
+            err = self._proc.reply_q.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("Sim süreci yanıt vermedi")
+        if err:
+            raise ConnectionError(err)
+
+    def get_requests(self):
+        return self._proc.telemetry
+
+    def get_events(self):
+        return None
+
+
+class RemoteAutopilot:
+    def __init__(self, proc):
+        self._proc = proc
+        self.aq = self.ae = None
+        self.status_callback = None
+
+    def takeoff_sequence(self):
+        self._proc.cmd_q.put(("takeoff",))
+
+
+class _RemoteNav:
+    """nav_thread yerine: sim sürecindeki görevin canlılığı (paylaşılan bloktan)."""
+
+    def __init__(self, telemetry):
+        self._t = telemetry
+
+    def is_alive(self):
+        return bool(self._t.get("NAV_ACTIVE", 0.0))
+
+
+class RemoteFlight:
+    """FlightController vekili. Kare akışları (follow_stream) UI sürecinde
+    bir pompa iş parçacığıyla sınırlı kuyruğa aktarılır ve sim sürecinde
+    uygulanır; frame_applied bu modda kare sim sürecine teslim edilince
+    çağrılır.
+    """
+
+    def __init__(self, proc):
+        self._proc = proc
+        self.aq = self.ae = None
+        self.status_callback = None
+        self.frame_applied = None
+        self.nav_thread = _RemoteNav(proc.telemetry)
+        self._gen = 0
+        self._pump = None
+        self._pump_stop = threading.Event()
+
+    @property
+    def loop_count(self):
+        return int(self._proc.telemetry.get("LOOP_COUNT", 0.0))
+
+    def join_index(self, route_index):
+        lat = self._proc.telemetry.get("PLANE_LATITUDE")
+        lon = self._proc.telemetry.get("PLANE_LONGITUDE")
+        if None in (lat, lon):
+            return 0
+        return route_index.join_index(lat, lon)
+
+    def _stop_pump(self):
+        if self._pump is not None and self._pump.is_alive():
+            self._pump_stop.set()
+            self._pump.join()
+        self._pump_stop.clear()
+
+    def stop_nav(self):
+        self._stop_pump()
+        self._proc.cmd_q.put(("stop",))
+
+    def teleport(self, lat, lon, alt, spd, hdg=None, step_m=5):
+        self._proc.cmd_q.put(("teleport", lat, lon, alt, spd, hdg, step_m))
+
+    def fly_to(self, lat, lon, alt, spd):
+        self._stop_pump()
+        self._proc.cmd_q.put(("fly_to", lat, lon, alt, spd))
+
+    def fly_scenario(self, waypoints, start=0):
+        self._stop_pump()
+        self._proc.cmd_q.put(("fly_scenario", waypoints, start))
+
+    def follow_stream(self, stream, interval=0.1):
+        self._stop_pump()
+        self._gen += 1
+        gen, frame_q, stop = self._gen, self._proc.frame_q, self._pump_stop
+        bind = getattr(stream, "bind_stop", None)
+        if bind is not None:
+            bind(stop)                   # zaman damgalı akış beklerken de durdurulabilsin
+        self._proc.cmd_q.put(("follow", gen, interval))
+
+        def _put(item):
+            while not stop.is_set():
+                try:
+                    frame_q.put(item, timeout=0.2)   # kuyruk dolu: sim yetişene kadar bekle
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _pump():
+            for frame in stream:
+                if not isinstance(frame, Frame):
+                    frame = Frame.from_mapping(frame)
+                    if frame is None:
+                        continue                 # bozuk kayıt (günlükte)
+                # Kuyruk arka planda seri hale getirir; havuzdan gelen kare
+                # yeniden kullanılabileceği için değerler burada kopyalanır
+                if not _put((gen, tuple(getattr(frame, f) for f in FIELDS))):
+                    return
+                if self.frame_applied:
+                    self.frame_applied(frame)
+            _put((gen, None))
+
+        self._pump = threading.Thread(target=_pump, daemon=True)
+        self._pump.start()
+
+
+class SimProcess:
+    """Sim G/Ç + uçuş denetimini ayrı süreçte çalıştırır.
+
+    Sim süreci telemetriyi rate_hz ile paylaşılan belleğe (seqlock) yazar;
+    UI yalnızca bu bloğu okur ve komutları kuyrukla gönderir. Böylece PFD
+    çizimi ya da Tk olay döngüsündeki takılmalar denetim döngüsünün
+    zamanlamasını etkilemez ve iş iki çekirdeğe yayılır.
+
+    sim_manager / autopilot / flight, MainWindow'a doğrudan verilebilen
+    vekillerdir. log_cfg verilirse sim süreci de setup_logging(**log_cfg)
+    ile günlükler (JSONL dosyası ayrı olmalı).
+    """
+
+    def __init__(self, backend="simconnect", rate_hz=30.0, frame_queue=64, log_cfg=None):
+        ctx = mp.get_context("spawn")
+        self.telemetry = SharedTelemetry(create=True)
+        self.cmd_q    = ctx.Queue()
+        self.reply_q  = ctx.Queue()
+        self.status_q = ctx.Queue()
+        self.frame_q  = ctx.Queue(maxsize=frame_queue)
+        self.proc = ctx.Process(
+            target=_sim_main, daemon=True,
+            args=(self.telemetry.name, self.cmd_q, self.reply_q, self.status_q, self.frame_q,
+                  backend, rate_hz, log_cfg),
+        )
+        self.sim_manager = RemoteSimManager(self)
+        self.autopilot   = RemoteAutopilot(self)
+        self.flight      = RemoteFlight(self)
+        self._status_thread = None
+
+    def start(self):
+        self.proc.start()
+        self._status_thread = threading.Thread(target=self._status_loop, daemon=True)
+        self._status_thread.start()
+        return self
+
+    def _status_loop(self):
+        while True:
+            try:
+                src, msg = self.status_q.get()
+            except (EOFError, OSError):
+                return
+            if src is None:
+                return
+            target = self.autopilot if src == "autopilot" else self.flight
+            if target.status_callback:
+                target.status_callback(msg)
+
+    def shutdown(self, timeout=3.0):
+        self.flight._stop_pump()
+        self.cmd_q.put(("shutdown",))
+        self.proc.join(timeout)
+        if self.proc.is_alive():
+            self.proc.terminate()
+        self.status_q.put((None, None))
+        self.telemetry.close()
@@ -1,14 +1,22 @@
-from SimConnect import SimConnect, AircraftRequests, AircraftEvents
-
 class SimConnectManager:
+    """SimConnect sarmalayıcısı.
+    `SimConnect` paketi yalnızca connect() çağrıldığında yüklenir; böylece
+    uygulama ve çekirdek denetleyiciler SimConnect kurulu olmayan
+    makinelerde de açılabilir.
+    """
+
+    CACHE_MS = 2000      # AircraftRequests önbelleği: bir SimVar en çok bu sıklıkla tazelenir
+
     def __init__(self):
         self.sm = None
         self.aq = None
         self.ae = None
 
     def connect(self):
+        from SimConnect import SimConnect, AircraftRequests, AircraftEvents
+
         self.sm = SimConnect()
-        self.aq = AircraftRequests(self.sm, _time=2000)
+        self.aq = AircraftRequests(self.sm, _time=self.CACHE_MS)
         self.ae = AircraftEvents(self.sm)
 
     def get_requests(self):
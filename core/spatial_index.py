@@ -0,0 +1,136 @@
+import heapq
+import math
+from array import array
+
+
+_M_PER_DEG = 111_111.0
+
+
+class RouteIndex:
+    """Rota noktaları üzerinde mekânsal indeks.
+    Noktalar yerel düzlemde (metre) ardışık parçalara (LEAF nokta) bölünür,
+    parçaların sınır kutuları FANOUT'lu bir ağaç oluşturur. Rota sıralı
+    olduğu için kurulum O(n)'dir; "en yakın nokta / segment" sorgusu en-iyi
+    öncelikli (best-first) arama ile milyon noktada bile milisaniyenin
+    altında kalır.
+    """
+
+    LEAF   = 32
+    FANOUT = 8
+
+    def __init__(self, lats, lons):
+        n = len(lats)
+        if n == 0:
+            raise ValueError("Boş rota indekslenemez")
+        self.n = n
+        self.lat0 = (min(lats) + max(lats)) / 2
+        self.lon0 = (min(lons) + max(lons)) / 2
+        self._kx = _M_PER_DEG * math.cos(math.radians(self.lat0))
+        lon0, lat0, kx = self.lon0, self.lat0, self._kx
+        self.xs = array("d", [(lon - lon0) * kx for lon in lons])
+        self.ys = array("d", [(lat - lat0) * _M_PER_DEG for lat in lats])
+
+        # Seviye 0: yapraklar. j. yaprak [j*LEAF, (j+1)*LEAF] noktalarını
+        # kapsar; komşu yaprağın ilk noktası da dahil, böylece sınırdaki
+        # segment de kutunun içinde kalır.
+        xs, ys, L = self.xs, self.ys, self.LEAF
+        level = ([], [], [], [])
+        for a in range(0, max(n - 1, 1), L):
+            b = min(a + L + 1, n)
+            sx, sy = xs[a:b], ys[a:b]
+            level[0].append(min(sx)); level[1].append(min(sy))
+            level[2].append(max(sx)); level[3].append(max(sy))
+        self.levels = [tuple(array("d", c) for c in level)]
+
+        F = self.FANOUT
+        while len(self.levels[-1][0]) > 1:
+            x0, y0, x1, y1 = self.levels[-1]
+            up = ([], [], [], [])
+            for a in range(0, len(x0), F):
+                up[0].append(min(x0[a:a + F])); up[1].append(min(y0[a:a + F]))
+                up[2].append(max(x1[a:a + F])); up[3].append(max(y1[a:a + F]))
+            self.levels.append(tuple(array("d", c) for c in up))
+
+    @classmethod
+    def from_waypoints(cls, waypoints):
+        cols = getattr(waypoints, "cols", None)     # PackedScenario: sütunları doğrudan kullan
+        if cols is not None:
+            return cls(cols["lat"], cols["lon"])
+        return cls([wp.lat for wp in waypoints], [wp.lon for wp in waypoints])
+
+    # --------------------------------------------------
+    def _project(self, lat, lon):
+        return (lon - self.lon0) * self._kx, (lat - self.lat0) * _M_PER_DEG
+
+    def _search(self, qx, qy, leaf_fn):
+        """Best-first arama. leaf_fn(j, qx, qy, best) → (d², sonuç) ya da None."""
+        top = len(self.levels) - 1
+        heap = [(0.0, top, j) for j in range(len(self.levels[top][0]))]
+        best_d2, best = math.inf, None
+        while heap:
+            d2, lvl, j = heapq.heappop(heap)
+            if d2 >= best_d2:
+                break
+            if lvl == 0:
+                hit = leaf_fn(j, qx, qy, best_d2)
+                if hit is not None:
+                    best_d2, best = hit
+                continue
+            x0, y0, x1, y1 = self.levels[lvl - 1]
+            for c in range(j * self.FANOUT, min((j + 1) * self.FANOUT, len(x0))):
+                dx = x0[c] - qx if qx < x0[c] else qx - x1[c] if qx > x1[c] else 0.0
+                dy = y0[c] - qy if qy < y0[c] else qy - y1[c] if qy > y1[c] else 0.0
+                cd2 = dx * dx + dy * dy
+                if cd2 < best_d2:
+                    heapq.heappush(heap, (cd2, lvl - 1, c))
+        return best_d2, best
+
+    def _leaf_points(self, j, qx, qy, best_d2):
+        xs, ys = self.xs, self.ys
+        a = j * self.LEAF
+        found = None
+        for i in range(a, min(a + self.LEAF + 1, self.n)):
+            dx, dy = xs[i] - qx, ys[i] - qy
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_d2, found = d2, (d2, i)
+        return found
+
+    def _leaf_segments(self, j, qx, qy, best_d2):
+        xs, ys = self.xs, self.ys
+        a = j * self.LEAF
+        found = None
+        if self.n == 1:
+            dx, dy = xs[0] - qx, ys[0] - qy
+            return dx * dx + dy * dy, (0, 0.0)
+        for i in range(a, min(a + self.LEAF, self.n - 1)):
+            ax, ay = xs[i], ys[i]
+            sx, sy = xs[i + 1] - ax, ys[i + 1] - ay
+            seg2 = sx * sx + sy * sy
+            t = ((qx - ax) * sx + (qy - ay) * sy) / seg2 if seg2 else 0.0
+            tc = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+            dx, dy = ax + tc * sx - qx, ay + tc * sy - qy
+            d2 = dx * dx + dy * dy
+            if d2 < best_d2:
+                best_d2, found = d2, (d2, (i, t))
+        return found
+
+    # --------------------------------------------------
+    def nearest_point(self, lat, lon):
+        """En yakın rota noktası → (indeks, mesafe_m)."""
+        qx, qy = self._project(lat, lon)
+        d2, i = self._search(qx, qy, self._leaf_points)
+        return i, math.sqrt(d2)
+
+    def nearest_segment(self, lat, lon):
+        """En yakın segment → (i, t, mesafe_m); segment i → i+1 arasıdır,
+        t izdüşüm oranıdır (0 = i. nokta, 1 = i+1. nokta; sınır dışı olabilir).
+        """
+        qx, qy = self._project(lat, lon)
+        d2, (i, t) = self._search(qx, qy, self._leaf_segments)
+        return i, t, math.sqrt(d2)
+
+    def join_index(self, lat, lon):
+        """Rotaya katılınacak nokta: üzerinde bulunulan segmentin ucu."""
+        i, t, _ = self.nearest_segment(lat, lon)
+        return min(i + 1, self.n - 1) if t > 0.0 else i
@@ -0,0 +1,195 @@
+import threading
+import time
+
+from core.clock import REAL_CLOCK
+
+
+class CancelToken:
+    """Bir görevin iptal işareti. sleep() kesilebilir beklemedir: iptal
+    anında (ms içinde) döner. link() ile bağlanan olaylar da iptalde set
+    edilir; böylece tetikleyici beklemeleri (TriggerEngine.wait_for) aynı
+    anda uyanır.
+    """
+
+    def __init__(self, clock=None):
+        self.clock = clock or REAL_CLOCK
+        self._event = self.clock.event()
+        self._linked = []
+        self._lock = threading.Lock()
+        self.cancelled_at = None         # iptal anı (perf_counter)
+
+    def is_set(self):
+        return self._event.is_set()
+
+    cancelled = property(is_set)
+
+    def cancel(self):
+        with self._lock:
+            if self.cancelled_at is None:
+                self.cancelled_at = time.perf_counter()
+            linked = list(self._linked)
+        self._event.set()
+        for ev in linked:
+            ev.set()
+
+    set = cancel                         # threading.Event uyumluluğu (stop.set())
+
+    def sleep(self, seconds):
+        """seconds kadar bekle; iptal edildiyse hemen True döner."""
+        return self.clock.wait(self._event, seconds)
+
+    def link(self, event):
+        with self._lock:
+            self._linked.append(event)
+            cancelled = self.cancelled_at is not None
+        if cancelled:
+            event.set()
+
+    def unlink(self, event):
+        with self._lock:
+            if event in self._linked:
+                self._linked.remove(event)
+
+
+class _Task:
+    __slots__ = ("name", "token", "threads", "started", "pending", "done")
+
+    def __init__(self, name, token, clock):
+        self.name = name
+        self.token = token
+        self.threads = []
+        self.started = time.perf_counter()
+        self.pending = 0                 # bitmemiş iş parçacığı sayısı
+        self.done = clock.event()        # pending 0'a inince set (saat olayı)
+
+    @property
+    def main(self):
+        return self.threads[0] if self.threads else None
+
+    def alive(self):
+        return any(t.is_alive() for t in self.threads)
+
+
+class FlightTaskManager:
+    """Tüm uçuş işlemlerinin (NAV, senaryo, veri takibi, ışınlama, kalkış)
+    sahibi. Aynı anda tek etkin görev vardır: start() önce eski görevi
+    iptal eder ve iş parçacıklarının (yan iş parçacıkları ve gecikmeli
+    çağrılar dahil) bitmesini bekler, sonra yenisini başlatır. Böylece
+    iki döngü otopilot için yarışmaz.
+
+    Görev gövdeleri iptali token.sleep() / token.is_set() ile görür.
+    Geçiş gecikmesi (iptal → eski görevin tamamen bitişi) ölçülür.
+    """
+
+    def __init__(self, clock=None, join_timeout=2.0):
+        self.clock = clock or REAL_CLOCK
+        self.join_timeout = join_timeout
+        self.current = None
+        self._lock = threading.Lock()            # current / threads
+        self._switch = threading.RLock()         # start/cancel sıralaması
+        self.switches = 0
+        self.last_switch_ms = self.max_switch_ms = 0.0
+        self.stuck = 0                   # join_timeout içinde bitmeyen görev sayısı
+
+    # --------------------------------------------------
+    @property
+    def token(self):
+        """Etkin görevin token'ı; görev yoksa iptal edilmiş bir token."""
+        task = self.current
+        if task is None:
+            t = CancelToken(self.clock)
+            t.cancel()
+            return t
+        return task.token
+
+    @property
+    def active(self):
+        task = self.current
+        return task is not None and task.alive()
+
+    @property
+    def thread(self):
+        task = self.current
+        return task.main if task is not None else None
+
+    # --------------------------------------------------
+    def cancel(self):
+        """Etkin görevi iptal et ve bitmesini bekle; geçiş süresini (ms) döndürür."""
+        with self._switch:
+            with self._lock:
+                task, self.current = self.current, None
+            if task is None:
+                return 0.0
+            task.token.cancel()
+            me = threading.current_thread()
+            with self._lock:
+                threads = [t for t in task.threads if t is not me]
+                own = len(threads) != len(task.threads)
+            if own:
+                # Görev kendini kesiyor: yalnızca diğer iş parçacıklarını bekle
+                deadline = time.perf_counter() + self.join_timeout
+                for t in threads:
+                    t.join(max(0.0, deadline - time.perf_counter()))
+                finished = not any(t.is_alive() for t in threads)
+            else:
+                # Saat üzerinden bekle: SimClock'ta bekleyen iş parçacığı
+                # koşuyor sayılmaz, iptal edilen görev zamanı ilerletebilir
+                finished = self.clock.wait(task.done, self.join_timeout)
+            ms = (time.perf_counter() - task.token.cancelled_at) * 1000
+            if not finished:
+                self.stuck += 1
+            self.switches += 1
+            self.last_switch_ms = ms
+            self.max_switch_ms = max(self.max_switch_ms, ms)
+            return ms
+
+    def start(self, name, target, *args):
+        """Eski görevi iptal edip target(token, *args)'ı yeni görev olarak başlat."""
+        with self._switch:
+            self.cancel()
+            task = _Task(name, CancelToken(self.clock), self.clock)
+            with self._lock:
+                self.current = task
+                self._spawn(task, target, name, *args)
+            return task
+
+    def run(self, name, target, *args):
+        """start() + görevin (yan iş parçacıklarıyla) bitmesini bekle."""
+        task = self.start(name, target, *args)
+        self.clock.wait(task.done)
+        return task
+
+    def _spawn(self, task, target, name, *args):
+        def _run(*a):
+            try:
+                target(task.token, *a)
+            finally:
+                with self._lock:
+                    task.pending -= 1
+                    last = not task.pending
+                if last:
+                    task.done.set()
+        task.pending += 1                # _lock altında çağrılır
+        t = self.clock.spawn(_run, *args, name=name)
+        task.threads.append(t)
+        return t
+
+    def spawn(self, token, target, *args):
+        """token'ın görevine bağlı yan iş parçacığı: target(token, *args).
+        Görev iptal edildiyse (ya da artık etkin değilse) başlatılmaz."""
+        with self._lock:
+            task = self.current
+            if task is None or task.token is not token or token.is_set():
+                return None
+            return self._spawn(task, target, None, *args)
+
+    def call_later(self, token, delay, fn, *args):
+        """delay sonra fn(*args) — görev o ana dek iptal edilmediyse."""
+        def _run(tok):
+            if not tok.sleep(delay):
+                fn(*args)
+        return self.spawn(token, _run)
+
+    def summary(self):
+        return (f"{self.switches} geçiş  son {self.last_switch_ms:.1f} ms  "
+                f"en kötü {self.max_switch_ms:.1f} ms")
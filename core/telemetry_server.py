@@ -0,0 +1,299 @@
+import socket
+import struct
+import threading
+import time
+
+
+# PFD'nin okuduğu SimVar'lar; paket bu sırayla float64 taşır
+TELEMETRY_VARS = (
+    "AIRSPEED_INDICATED",
+    "PLANE_ALTITUDE",
+    "VERTICAL_SPEED",
+    "PLANE_HEADING_DEGREES_TRUE",
+    "PLANE_PITCH_DEGREES",
+    "PLANE_BANK_DEGREES",
+    "PLANE_LATITUDE",
+    "PLANE_LONGITUDE",
+)
+
+# magic, sıra no, gönderim zamanı (time.time), değerler (okunamayan = NaN)
+_MAGIC = b"USTM"
+SNAPSHOT = struct.Struct("<4sId" + "d" * len(TELEMETRY_VARS))
+_NAN = float("nan")
+
+SUBSCRIBE   = b"SUB"
+UNSUBSCRIBE = b"UNSUB"
+
+
+class _TcpSub:
+    __slots__ = ("sock", "pending")
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.pending = b""           # yarım gönderilmiş paketin kalanı
+
+
+class TelemetryServer:
+    """PFD değişkenlerini sabit hızda paketleyip yerel ağa yayınlar.
+
+    Sim tek yerden (aq) rate_hz ile okunur; anlık görüntü önceden ayrılmış
+    tampona (pack_into) yazılır ve tüm abonelere aynı bayt dizisi gider.
+      • UDP: istemci udp_port'a "SUB" gönderir (her birkaç saniyede bir
+        yeniler); sub_ttl saniye yenilenmeyen abone düşer, "UNSUB" ile çıkar.
+      • TCP: tcp_port'a bağlanan her istemci abonedir. Gönderim bloklamaz;
+        yetişemeyen istemci için o kare atlanır, kopan istemci silinir.
+    Böylece ek kokpit ekranları kendi SimConnect oturumlarını açmaz.
+    host varsayılanı 127.0.0.1'dir (yalnızca bu makine); başka makinedeki
+    PFD'ler için "0.0.0.0" ya da ağ arabiriminin adresi verilir.
+    """
+
+    def __init__(self, aq, rate_hz=30.0, host="127.0.0.1", udp_port=49010, tcp_port=49011,
+                 sub_ttl=10.0):
+        self.aq = aq
+        self.rate_hz = rate_hz
+        self.host = host
+        self.udp_port, self.tcp_port = udp_port, tcp_port
+        self.sub_ttl = sub_ttl
+
+        self._buf = bytearray(SNAPSHOT.size)
+        self._vals = [0.0] * len(TELEMETRY_VARS)
+        self._udp_subs = {}              # adres → son SUB zamanı
+        self._tcp_subs = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._udp = self._tcp = None
+
+        self.seq = 0
+        self.sent = self.skipped = 0
+        self.send_us = 0.0               # kare başına ortalama okuma+yayın süresi (µs)
+
+    # --------------------------------------------------
+    def start(self):
+        if self.udp_port is not None:
+            u = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            u.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            u.bind((self.host, self.udp_port))
+            u.settimeout(0.2)
+            self.udp_port = u.getsockname()[1]
+            self._udp = u
+            self._spawn(self._udp_control_loop)
+        if self.tcp_port is not None:
+            t = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            t.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            t.bind((self.host, self.tcp_port))
+            t.listen(16)
+            t.settimeout(0.2)
+            self.tcp_port = t.getsockname()[1]
+            self._tcp = t
+            self._spawn(self._tcp_accept_loop)
+        self._spawn(self._publish_loop)
+        return self
+
+    def stop(self):
+        self._stop.set()
+        for t in self._threads:
+            t.join(1.0)
+        with self._lock:
+            for sub in self._tcp_subs:
+                sub.sock.close()
+            self._tcp_subs.clear()
+            self._udp_subs.clear()
+        for s in (self._udp, self._tcp):
+            if s is not None:
+                s.close()
+
+    @property
+    def subscribers(self):
+        with self._lock:
+            return len(self._udp_subs) + len(self._tcp_subs)
+
+    def _spawn(self, fn):
+        t = threading.Thread(target=fn, daemon=True)
+        t.start()
+        self._threads.append(t)
+
+    # --------------------------------------------------
+    def _udp_control_loop(self):
+        while not self._stop.is_set():
+            try:
+                msg, addr = self._udp.recvfrom(64)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            with self._lock:
+                if msg.startswith(UNSUBSCRIBE):
+                    self._udp_subs.pop(addr, None)
+                elif msg.startswith(SUBSCRIBE):
+                    self._udp_subs[addr] = time.monotonic()
+
+    def _tcp_accept_loop(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._tcp.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            conn.setblocking(False)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            with self._lock:
+                self._tcp_subs.append(_TcpSub(conn))
+
+    # --------------------------------------------------
+    def _sample(self):
+        """Sim'den tek okuma turu → önceden ayrılmış tampona paketle."""
+        aq, vals = self.aq, self._vals
+        for i, name in enumerate(TELEMETRY_VARS):
+            try:
+                v = aq.get(name) if aq is not None else None
+            except Exception:
+                v = None
+            vals[i] = _NAN if v is None else v
+        SNAPSHOT.pack_into(self._buf, 0, _MAGIC, self.seq & 0xFFFFFFFF, time.time(), *vals)
+        self.seq += 1
+
+    def _publish_loop(self):
+        dt = 1.0 / self.rate_hz
+        nxt = time.perf_counter()
+        busy = 0.0
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            with self._lock:
+                has_subs = bool(self._udp_subs or self._tcp_subs)
+            if has_subs:
+                self._sample()
+                self._broadcast(self._buf)
+                busy += time.perf_counter() - t0
+                self.send_us = busy / self.seq * 1e6
+            nxt += dt
+            delay = nxt - time.perf_counter()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                nxt = time.perf_counter()        # geride kaldık: birikmiş kareleri yayınlama
+
+    def _broadcast(self, data):
+        now = time.monotonic()
+        with self._lock:
+            for addr, seen in list(self._udp_subs.items()):
+                if now - seen > self.sub_ttl:
+                    del self._udp_subs[addr]
+                    continue
+                try:
+                    self._udp.sendto(data, addr)
+                    self.sent += 1
+                except OSError:
+                    del self._udp_subs[addr]
+            alive = []
+            for sub in self._tcp_subs:
+                try:
+                    if sub.pending:                  # önce yarım kalan paketi tamamla
+                        n = sub.sock.send(sub.pending)
+                        sub.pending = sub.pending[n:]
+                        if sub.pending:
+                            self.skipped += 1
+                            alive.append(sub)
+                            continue
+                    n = sub.sock.send(data)
+                    if n < len(data):
+                        sub.pending = data[n:]
+                    self.sent += 1
+                    alive.append(sub)
+                except BlockingIOError:
+                    self.skipped += 1                # istemci yetişemiyor: bu kare atlanır
+                    alive.append(sub)
+                except OSError:
+                    sub.sock.close()                 # istemci koptu
+            self._tcp_subs = alive
+
+
+class TelemetryClient:
+    """TelemetryServer abonesi. Son anlık görüntüyü tutar ve aq gibi
+    get(name, default) sunar; PFDWindow'a veri kaynağı olarak verilebilir
+    (salt okunur: set() yok sayılır).
+    """
+
+    def __init__(self, proto="udp", host="127.0.0.1", port=49010, resub_s=2.0):
+        self.proto, self.host, self.port = proto, host, port
+        self.resub_s = resub_s
+        self.values = dict.fromkeys(TELEMETRY_VARS)
+        self.seq = None
+        self.stamp = 0.0                 # sunucunun gönderim zamanı (time.time)
+        self.received = 0
+        self._stop = threading.Event()
+        self._sock = None
+        self._thread = None
+
+    def start(self):
+        if self.proto == "udp":
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            s.sendto(SUBSCRIBE, (self.host, self.port))
+        else:
+            s = socket.create_connection((self.host, self.port))
+        s.settimeout(0.2)
+        self._sock = s
+        self._thread = threading.Thread(target=self._rx_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self):
+        self._stop.set()
+        if self._sock is not None:
+            if self.proto == "udp":
+                try:
+                    self._sock.sendto(UNSUBSCRIBE, (self.host, self.port))
+                except OSError:
+                    pass
+            self._sock.close()
+
+    # aq arayüzü --------------------------------------------------
+    def get(self, name, default=None):
+        v = self.values.get(name)
+        return default if v is None else v
+
+    def set(self, name, value):
+        pass
+
+    # --------------------------------------------------
+    def _apply(self, buf, off):
+        rec = SNAPSHOT.unpack_from(buf, off)
+        if rec[0] != _MAGIC:
+            return
+        self.seq, self.stamp = rec[1], rec[2]
+        values = self.values
+        for i, name in enumerate(TELEMETRY_VARS, start=3):
+            v = rec[i]
+            values[name] = None if v != v else v
+        self.received += 1
+
+    def _rx_loop(self):
+        size = SNAPSHOT.size
+        buf = bytearray(size * 16)
+        view = memoryview(buf)
+        have = 0
+        last_sub = time.monotonic()
+        while not self._stop.is_set():
+            try:
+                if self.proto == "udp":
+                    if time.monotonic() - last_sub > self.resub_s:
+                        self._sock.sendto(SUBSCRIBE, (self.host, self.port))
+                        last_sub = time.monotonic()
+                    n = self._sock.recv_into(buf)
+                    if n >= size:
+                        self._apply(buf, 0)
+                    continue
+                n = self._sock.recv_into(view[have:])
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            if not n:
+                return                               # sunucu kapandı
+            have += n
+            whole = have - have % size
+            if whole:
+                self._apply(buf, whole - size)       # yalnızca en taze kayıt önemli
+                buf[:have - whole] = buf[whole:have]
+                have -= whole
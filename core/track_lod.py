@@ -0,0 +1,97 @@
+import math
+from array import array
+
+from core.route_simplify import _M_PER_DEG
+
+
+class TrackLOD:
+    """Harita çizimi için çok seviyeli (LOD) iz.
+
+    Noktalar yerel eşdikdörtgen izdüşümle metreye çevrilir. Seviye k,
+    seviye k-1'de tutulan noktalardan bir öncekine en az base_m·2^k
+    metre uzak olanları tutar (radyal ayıklama). Her seviye bir öncekinin
+    alt kümesi olduğundan ekleme amortize O(1)'dir: nokta bir seviyeyi
+    geçemezse üst seviyelere hiç bakılmaz. Harita yakınlaştırmasına göre
+    toleransı bir pikselin altında kalan en kaba seviye çizilir.
+    """
+
+    def __init__(self, lat0, base_m=1.0, levels=20):
+        self.lat0 = lat0                 # izdüşüm enlemi (aynı haritadaki izler paylaşır)
+        self.kx = _M_PER_DEG * math.cos(math.radians(lat0))
+        self.base_m = base_m
+        self.levels = levels
+        self.xs = [array("d") for _ in range(levels)]
+        self.ys = [array("d") for _ in range(levels)]
+        self._tol2 = [(base_m * 2 ** k) ** 2 for k in range(levels)]
+        self.count = 0                   # eklenen ham nokta sayısı
+        self.last = None                 # son ham nokta (x, y) — seviyelere girmemiş olabilir
+
+    @classmethod
+    def from_waypoints(cls, waypoints, lat0=None, **kw):
+        """lat0 verilirse bu izdüşüm enlemi kullanılır (mevcut izle aynı harita)."""
+        cols = getattr(waypoints, "cols", None)     # PackedScenario: sütunlardan oku
+        lats = cols["lat"] if cols else [wp.lat for wp in waypoints]
+        lons = cols["lon"] if cols else [wp.lon for wp in waypoints]
+        if lat0 is None:
+            lat0 = lats[0] if len(lats) else 0.0
+        lod = cls(lat0, **kw)
+        lod.extend(lats, lons)
+        return lod
+
+    def project(self, lat, lon):
+        return lon * self.kx, lat * _M_PER_DEG
+
+    # --------------------------------------------------
+    def append(self, lat, lon):
+        return self.append_xy(lon * self.kx, lat * _M_PER_DEG)
+
+    def append_xy(self, x, y):
+        """Noktayı ekle; girdiği seviye sayısını döndürür."""
+        self.count += 1
+        self.last = (x, y)
+        xs, ys, tol2 = self.xs, self.ys, self._tol2
+        for k in range(self.levels):
+            lx, ly = xs[k], ys[k]
+            if lx:
+                dx, dy = x - lx[-1], y - ly[-1]
+                if dx * dx + dy * dy < tol2[k]:
+                    return k
+            lx.append(x)
+            ly.append(y)
+        return self.levels
+
+    def extend(self, lats, lons):
+        kx, ky = self.kx, _M_PER_DEG
+        append_xy = self.append_xy
+        for lat, lon in zip(lats, lons):
+            append_xy(lon * kx, lat * ky)
+
+    # --------------------------------------------------
+    def level_for(self, m_per_px, px_tol=1.0, max_points=None):
+        """Toleransı px_tol pikseli aşmayan en kaba seviye; max_points
+        verilirse nokta sayısı bu sınırın altına inene dek kabalaşır."""
+        k, tol = 0, m_per_px * px_tol
+        while k + 1 < self.levels and self.base_m * 2 ** (k + 1) <= tol:
+            k += 1
+        if max_points:
+            while k + 1 < self.levels and len(self.xs[k]) > max_points:
+                k += 1
+        return k
+
+    def size(self, k):
+        return len(self.xs[k])
+
+    def runs(self, k, x0, y0, x1, y1):
+        """Seviye k'da kutuya giren ardışık nokta aralıkları [(i, j), ...].
+        Kutunun hemen dışındaki komşular da dahildir; çizgi kenarda kesilmez."""
+        out, start = [], None
+        for i, (x, y) in enumerate(zip(self.xs[k], self.ys[k])):
+            if x0 <= x <= x1 and y0 <= y <= y1:
+                if start is None:
+                    start = max(i - 1, 0)
+            elif start is not None:
+                out.append((start, i + 1))
+                start = None
+        if start is not None:
+            out.append((start, len(self.xs[k])))
+        return out
@@ -0,0 +1,188 @@
+import threading
+
+from core.clock import REAL_CLOCK
+from core.geo import _haversine_nm
+from core.log import get_logger
+
+log = get_logger("triggers")
+
+
+class Condition:
+    """Telemetri koşulu: hangi SimVar'lara baktığı + anlık görüntü (snapshot)
+    üzerinde çalışan doğruluk fonksiyonu. Değerlerden biri None ise koşul
+    sağlanmamış sayılır.
+    """
+
+    __slots__ = ("vars", "fn", "label")
+
+    def __init__(self, vars, fn, label=""):
+        self.vars = tuple(vars)
+        self.fn = fn
+        self.label = label
+
+    def __call__(self, snap):
+        vals = [snap.get(v) for v in self.vars]
+        if None in vals:
+            return False
+        return self.fn(*vals)
+
+    def __repr__(self):
+        return f"Condition({self.label or self.vars})"
+
+
+def ge(var, threshold):
+    """var ≥ threshold  (ör. IAS ≥ 70)"""
+    return Condition((var,), lambda v: v >= threshold, f"{var} ≥ {threshold}")
+
+
+def le(var, threshold):
+    """var ≤ threshold"""
+    return Condition((var,), lambda v: v <= threshold, f"{var} ≤ {threshold}")
+
+
+def near(var, target, tol):
+    """|var − target| < tol  (ör. |alt − hedef| < 50)"""
+    return Condition((var,), lambda v: abs(v - target) < tol, f"|{var} − {target}| < {tol}")
+
+
+def within_nm(lat, lon, nm):
+    """Uçak (lat, lon) noktasına nm deniz milinden yakın."""
+    return Condition(("PLANE_LATITUDE", "PLANE_LONGITUDE"),
+                     lambda a, b: _haversine_nm(a, b, lat, lon) < nm, f"dist < {nm} NM")
+
+
+class _Waiter:
+    __slots__ = ("conds", "stop", "event", "fired", "poll")
+
+    def __init__(self, conds, stop, event, poll):
+        self.conds = conds
+        self.stop = stop
+        self.event = event
+        self.fired = None
+        self.poll = poll
+
+
+class TriggerEngine:
+    """Merkezi koşul tetikleyicisi.
+    Görevler wait_for() ile koşul kaydeder ve biri sağlanana kadar bekler.
+    Koşullar her telemetri güncellemesinde (update) tek yerde
+    değerlendirilir; güncellemeyi kim okursa (görev döngüsü, telemetri
+    yayıncısı) o besler.
+
+    Yoklama yalnızca poll=True bekleyenler içindir (ör. kalkış): arka plan
+    iş parçacığı rate_hz ile bu koşulların SimVar'larından son periyotta
+    başka bir okumayla tazelenmemiş olanları okur; bekleyen kalmayınca
+    durur. rate_hz kaynağın tazelenme hızından yüksek seçilmemeli (önbellekli
+    aq'da daha sık okumak tepkiyi hızlandırmaz). Bekleme ve yoklama aralığı
+    clock üzerinden yürür (bkz. core.clock).
+    """
+
+    def __init__(self, aq=None, rate_hz=10.0, clock=None):
+        self.aq = aq
+        self.rate_hz = rate_hz
+        self.clock = clock or REAL_CLOCK
+        self.snapshot = {}
+        self.reads = 0                   # aq.get sayısı (ölçüm için)
+        self._stamp = {}                 # SimVar → son güncelleme zamanı (clock)
+        self._waiters = []
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # --------------------------------------------------
+    def update(self, values):
+        """Yeni telemetri değerlerini yayınla ve tüm koşulları değerlendir."""
+        now = self.clock.now()
+        with self._lock:
+            self.snapshot.update(values)
+            for n in values:
+                self._stamp[n] = now
+            snap = dict(self.snapshot)
+            waiters = list(self._waiters)
+        for w in waiters:
+            if w.stop is not None and w.stop.is_set():
+                self._fire(w, None)
+                continue
+            for i, cond in enumerate(w.conds):
+                if cond(snap):
+                    self._fire(w, i)
+                    break
+
+    def read(self, names):
+        """SimVar'ları sim'den oku, yayınla (update) ve sözlük olarak döndür."""
+        aq = self.aq
+        values = {n: aq.get(n) for n in names}
+        self.reads += len(names)
+        self.update(values)
+        return values
+
+    @property
+    def period(self):
+        return 1.0 / self.rate_hz
+
+    def fresh(self, names, max_age=None):
+        """SimVar değerleri; son max_age (varsayılan: yoklama periyodu)
+        içinde güncellenmiş olanlar anlık görüntüden alınır, yalnızca
+        bayatlar sim'den okunur."""
+        limit = self.clock.now() - (self.period if max_age is None else max_age)
+        with self._lock:
+            out = {n: self.snapshot.get(n) for n in names
+                   if self._stamp.get(n, limit) > limit and self.snapshot.get(n) is not None}
+        stale = [n for n in names if n not in out]
+        if stale:
+            out.update(self.read(stale))
+        return out
+
+    def _fire(self, waiter, idx):
+        with self._lock:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            else:
+                return
+        waiter.fired = idx
+        waiter.event.set()
+
+    # --------------------------------------------------
+    def wait_for(self, *conds, timeout=None, stop=None, poll=True):
+        """Koşullardan biri sağlanana kadar bekle.
+        Sağlanan koşulun sırasını, zaman aşımı / stop durumunda None döndürür.
+        poll=False: ek okuma yapılmaz; koşullar yalnızca başkalarının
+        okumalarıyla (update) değerlendirilir. Kendi okumasını zaten yapan
+        döngüler bununla bekler.
+        """
+        w = _Waiter(conds, stop, self.clock.event(), poll)
+        link = getattr(stop, "link", None)
+        if link is not None:
+            link(w.event)                # CancelToken: iptal anında uyan
+        with self._lock:
+            self._waiters.append(w)
+            if poll and (self._thread is None or not self._thread.is_alive()):
+                self._thread = self.clock.spawn(self._poll_loop)
+        try:
+            self.clock.wait(w.event, timeout)
+        finally:
+            if link is not None:
+                stop.unlink(w.event)
+            self._fire(w, None)          # zaman aşımı / iptal: kaydı kaldır
+        return w.fired
+
+    def _poll_loop(self):
+        dt = self.period
+        while True:
+            with self._lock:
+                polled = [w for w in self._waiters if w.poll]
+                if not polled:
+                    self._thread = None
+                    return
+                names = {v for w in polled for c in w.conds for v in c.vars}
+            try:
+                reads = self.reads
+                if self.aq is not None:
+                    self.fresh(sorted(names))    # başka okumayla tazelenenler tekrar okunmaz
+                if self.reads == reads:
+                    self.update({})              # okuma yok: yeni bekleyenler de değerlendirilsin
+            except Exception as e:
+                log.debug("Tetikleyici okuma hatası: %s", e)   # bir sonraki turda tekrar dene
+            self.clock.sleep(dt)
+
+
+POSITION_VARS = ("PLANE_LATITUDE", "PLANE_LONGITUDE", "PLANE_ALTITUDE")
@@ -10,6 +10,7 @@ start_alt = 1000
 # Parametreler
 step_distance_m = 20  
 step_altitude_m = 10
+step_time_s = 0.1          # kayıt zamanı aralığı ("t" alanı, zaman damgalı oynatma)
 num_points = 600
 R = 6371000
 
@@ -44,6 +45,7 @@ for i in range(num_points):
     attitude = random_attitude()
 
     waypoints.append({
+        "t": round(i * step_time_s, 3),
         "latitude": round(lat, 6),
         "longitude": round(lon, 6),
         "altitude_m": round(alt, 2),
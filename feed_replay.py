@@ -0,0 +1,39 @@
+"""JSON senaryoyu canlı kaynak (LiveFeed) formatında UDP/TCP üzerinden
+sabit hızda gönderir; HIL düzeneği yokken 🛰️ Canlı Kaynak'ı denemek için.
+
+Örnek:
+    python feed_replay.py scenarios/ucus.json --to udp:49005 --hz 50
+    python feed_replay.py kayit.json --timed          # kayıttaki zaman damgalarıyla
+"""
+import argparse
+import sys
+import time
+
+from core.live_feed import parse_address, send_frames
+from core.scenario import load_scenario
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Senaryoyu canlı kaynak olarak gönder.")
+    ap.add_argument("scenario", help="JSON senaryo dosyası")
+    ap.add_argument("--to", default="udp:49005", help="hedef (udp:PORT, tcp:HOST:PORT)")
+    ap.add_argument("--hz", type=float, default=50.0, help="gönderim hızı (kare/s)")
+    ap.add_argument("--loop", action="store_true", help="bitince baştan başla")
+    ap.add_argument("--timed", action="store_true",
+                    help="kareleri kayıttaki zaman damgalarıyla (t) gönder; --hz yok sayılır")
+    args = ap.parse_args(argv)
+
+    proto, host, port = parse_address(args.to)
+    waypoints = load_scenario(args.scenario)
+    rate = "zaman damgalı" if args.timed else f"@ {args.hz:g} Hz"
+    print(f"📤 {len(waypoints)} kare → {proto.upper()} {host}:{port} {rate}")
+    while True:
+        t0 = time.perf_counter()
+        send_frames(waypoints, proto, host, port, args.hz, timed=args.timed)
+        print(f"— {len(waypoints)} kare gönderildi, {time.perf_counter() - t0:.1f} s")
+        if not args.loop:
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
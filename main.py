@@ -1,15 +1,64 @@
+import time
+_T0 = time.perf_counter()          # açılış süresi ölçümü (import'lardan önce)
+
+import argparse
 from tkinter import Tk
 from core.simconnect_manager import SimConnectManager
 from core.autopilot_controller import AutopilotController
 from core.flight_controller import FlightController
+from core.log import setup_logging
+from core.task_manager import FlightTaskManager
+from core.triggers import TriggerEngine
 from ui.main_window import MainWindow
 
+_T_IMPORT = time.perf_counter()
+
+
+def _report_startup(app):
+    """İlk boşta (idle) anına kadar geçen süreyi ölç ve yazdır."""
+    total_ms  = (time.perf_counter() - _T0) * 1000
+    import_ms = (_T_IMPORT - _T0) * 1000
+    app.startup_ms = total_ms
+    print(f"⏱️ Açılış: {total_ms:.0f} ms  (import {import_ms:.0f} ms, "
+          f"UI {total_ms - import_ms:.0f} ms)")
+
 
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="MSFS otomatik kalkış & NAV paneli")
+    ap.add_argument("--split", action="store_true",
+                    help="sim G/Ç + uçuş denetimini ayrı süreçte çalıştır (paylaşılan bellek)")
+    ap.add_argument("--backend", choices=("simconnect", "fake"), default="simconnect",
+                    help="--split ile sim süreci arka ucu (fake: SimConnect'siz deneme)")
+    ap.add_argument("--log-level", default="WARNING", type=str.upper,
+                    choices=("DEBUG", "INFO", "WARNING", "ERROR"),
+                    help="günlük seviyesi (DEBUG ayrıntılı tanılama; hız sınırlı)")
+    ap.add_argument("--log-jsonl", metavar="DOSYA",
+                    help="günlükleri ayrıca JSONL dosyasına yaz (--split: sim süreci DOSYA.sim)")
+    args = ap.parse_args()
+    setup_logging(args.log_level, jsonl=args.log_jsonl)
+
     root = Tk()
 
-    sim_manager = SimConnectManager()          # SimConnect sarmalayıcısı
-    autopilot   = AutopilotController(None, None)
-    flight      = FlightController(None, None)
+    sim_proc = None
+    if args.split:
+        from core.sim_process import SimProcess
+        log_cfg = {"level": args.log_level,
+                   "jsonl": args.log_jsonl and args.log_jsonl + ".sim"}
+        sim_proc = SimProcess(backend=args.backend, log_cfg=log_cfg).start()
+        sim_manager = sim_proc.sim_manager
+        autopilot   = sim_proc.autopilot
+        flight      = sim_proc.flight
+    else:
+        sim_manager = SimConnectManager()          # SimConnect sarmalayıcısı
+        # kalkış + NAV ortak koşul motoru; yoklama AircraftRequests önbelleğinden sık değil
+        triggers    = TriggerEngine(rate_hz=1000.0 / SimConnectManager.CACHE_MS)
+        tasks       = FlightTaskManager()          # kalkış / NAV / senaryo: tek etkin görev
+        autopilot   = AutopilotController(None, None, triggers=triggers, tasks=tasks)
+        flight      = FlightController(None, None, triggers=triggers, tasks=tasks)
     app = MainWindow(root, sim_manager, autopilot, flight)
-    root.mainloop()
+    root.after_idle(_report_startup, app)
+    try:
+        root.mainloop()
+    finally:
+        if sim_proc is not None:
+            sim_proc.shutdown()
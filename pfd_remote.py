@@ -0,0 +1,51 @@
+"""Telemetri yayınına (📤 Telemetri Yayını / TelemetryServer) abone olup
+PFD'yi ayrı bir süreçte ya da makinede gösterir; SimConnect gerekmez.
+
+Başka makineden izlemek için yayın tarafında "Yayın adresi" 0.0.0.0
+(ya da o makinenin ağ adresi) olmalıdır; varsayılan 127.0.0.1 yalnızca
+aynı makineden erişilebilir.
+
+Örnek:
+    python pfd_remote.py --from udp:192.168.1.20:49010
+"""
+import argparse
+import sys
+from tkinter import Tk
+
+from core.live_feed import parse_address
+from core.telemetry_server import TelemetryClient
+from ui.pfd_window import PFDWindow
+
+
+class _RemoteSource:
+    """PFDWindow flight_ctrl.aq bekler; istemciyi aq olarak sunar."""
+
+    def __init__(self, aq):
+        self.aq = aq
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Uzak telemetriden PFD göster.")
+    ap.add_argument("--from", dest="src", default="udp:127.0.0.1:49010",
+                    help="yayın adresi (udp:HOST:PORT, tcp:HOST:PORT)")
+    args = ap.parse_args(argv)
+
+    proto, host, port = parse_address(args.src, default_port=49010)
+    client = TelemetryClient(proto, host, port).start()
+
+    root = Tk()
+    root.withdraw()
+    pfd = PFDWindow(root, _RemoteSource(client))
+    pfd.top.title(f"PFD – {proto.upper()} {host}:{port}")
+
+    def _close():
+        pfd._on_close()
+        client.close()
+        root.destroy()
+    pfd.top.protocol("WM_DELETE_WINDOW", _close)
+    root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Senaryo dizinini toplu ön-işleme: doğrula, birimleri normalize et,
+rota istatistiklerini çıkar, .scn (sıkıştırılmış) dosyalara çevir ve
+arayüzün anında listeleyebileceği index.json'u üret.
+
+Örnek:
+    python preprocess_scenarios.py scenarios/ --jobs 8
+"""
+import argparse
+import os
+import sys
+import time
+
+from core.scenario_preprocess import preprocess_dir
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Senaryo dizinini paralel ön-işle.")
+    ap.add_argument("src", help="JSON senaryo dizini")
+    ap.add_argument("--out", help="çıktı dizini (varsayılan: kaynak dizin)")
+    ap.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="paralel süreç sayısı")
+    ap.add_argument("--simplify", type=float, default=15.0,
+                    help="bacak sayısı için sadeleştirme toleransı (m)")
+    ap.add_argument("--force", action="store_true", help="değişmemiş dosyaları da yeniden işle")
+    args = ap.parse_args(argv)
+
+    failed = 0
+
+    def _progress(e):
+        nonlocal failed
+        if e["error"]:
+            failed += 1
+            print(f"❌ {e['file']}: {e['error']}")
+        else:
+            print(f"✅ {e['file']}: {e['points']} nokta  {e['length_nm']:.2f} NM  "
+                  f"+{e['climb_ft']:.0f} ft  {e['legs']} bacak  ({e['ms']:.0f} ms)")
+
+    t0 = time.perf_counter()
+    index = preprocess_dir(args.src, args.out, jobs=args.jobs, simplify_tol_m=args.simplify,
+                           force=args.force, progress=_progress)
+    total = len(index["scenarios"])
+    print(f"— {total} senaryo indekslendi, {failed} hata, {time.perf_counter() - t0:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
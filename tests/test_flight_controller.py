@@ -0,0 +1,53 @@
+from core.fake_sim import FakeSim
+from core.flight_controller import FlightController
+from core.scenario import Frame
+from core.spatial_index import RouteIndex
+
+
+def _route():
+    return RouteIndex.from_waypoints([Frame(lat=40.0 + i * 0.01, lon=29.0) for i in range(20)])
+
+
+def test_join_index_without_connection_starts_from_beginning():
+    flight = FlightController(None, None)
+    assert flight.join_index(_route()) == 0
+
+
+def test_join_index_uses_aircraft_position():
+    sim = FakeSim(lat=40.10, lon=29.0)
+    flight = FlightController(sim.aq, sim.ae)
+    assert flight.join_index(_route()) >= 10
+
+
+def test_follow_stream_survives_bad_frames():
+    sim = FakeSim(lat=40.0, lon=29.0)
+    flight = FlightController(sim.aq, sim.ae)
+    applied = []
+    flight.frame_applied = applied.append
+    stream = [{"lat": 40.1, "lon": 29.1, "alt": 1500}, None, "bozuk", {"lat": "x"},
+              {"heading": 90}, {"lat": 40.2, "lon": 29.2, "alt": 2000}]
+    flight.follow_stream(iter(stream), interval=0)
+    flight.tasks.thread.join(5.0)
+    assert [f.lat for f in applied] == [40.1, None, 40.2]
+    assert sim.aq.get("PLANE_LATITUDE") == 40.2
+
+
+def test_fly_scenario_flies_a_snapshot_of_the_list():
+    from core.clock import SimClock
+    from core.scenario import PackedScenario
+    from core.task_manager import FlightTaskManager
+    clock = SimClock()
+    sim = FakeSim(lat=40.0, lon=29.0, alt=1000.0, ias=120.0, clock=clock)
+    msgs = []
+    flight = FlightController(sim.aq, sim.ae, msgs.append, clock=clock,
+                              tasks=FlightTaskManager(clock))
+    route = PackedScenario()
+    for i in range(1, 4):
+        route.append(Frame(lat=40.0 + i * 0.01, lon=29.0, alt=1000.0, spd=120.0))
+    flight.fly_scenario(route)
+    clock.sleep(20.0)
+    route.clear()                        # UI listeyi görev sürerken değiştirir
+    route.append(Frame(lat=45.0, lon=35.0, alt=9000.0))
+    assert flight.tasks.current.done.wait(3600.0)
+    assert not any(m.startswith("❌") for m in msgs), msgs
+    assert "✅ Nokta 3 tamamlandı" in msgs
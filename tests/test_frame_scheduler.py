@@ -0,0 +1,53 @@
+import math
+
+from ui.frame_scheduler import FrameScheduler
+
+
+def _sample(hdg_deg=90.0, bank_deg=0.0, pitch_deg=0.0):
+    # SimConnect açıları radyan bildirir
+    return {"PLANE_HEADING_DEGREES_TRUE": math.radians(hdg_deg),
+            "PLANE_BANK_DEGREES": math.radians(bank_deg),
+            "PLANE_PITCH_DEGREES": math.radians(pitch_deg),
+            "AIRSPEED_INDICATED": 120.0, "PLANE_ALTITUDE": 3000.0, "VERTICAL_SPEED": 0.0}
+
+
+def test_standard_turn_with_roll_in_runs_fast():
+    s = FrameScheduler(min_hz=2.0, max_hz=30.0)
+    s.observe(_sample(), now=0.0)
+    s.observe(_sample(hdg_deg=90.3, bank_deg=1.0), now=0.1)   # 3°/s dönüş, 10°/s yatış
+    assert s.activity > 0.9
+    assert s.hz > 25.0
+
+
+def test_steady_turn_is_above_idle():
+    s = FrameScheduler(min_hz=2.0, max_hz=30.0)
+    s.observe(_sample(bank_deg=25.0), now=0.0)
+    s.observe(_sample(hdg_deg=90.3, bank_deg=25.0), now=0.1)  # yalnızca 3°/s dönüş
+    assert 0.4 < s.activity < 0.6
+    assert s.hz > 10.0
+
+
+def test_heading_wrap_is_small_change():
+    s = FrameScheduler(min_hz=2.0, max_hz=30.0)
+    s.observe(_sample(hdg_deg=359.9), now=0.0)
+    s.observe(_sample(hdg_deg=0.1), now=1.0)                  # 0.2°/s
+    assert s.activity < 0.05
+
+
+def test_idle_decays_and_skips():
+    s = FrameScheduler(min_hz=2.0, max_hz=30.0, release_s=1.0)
+    s.observe(_sample(), now=0.0)
+    s.observe(_sample(bank_deg=5.0), now=0.1)
+    fast = s.hz
+    for i in range(2, 40):
+        s.observe(_sample(bank_deg=5.0), now=i * 0.1)
+    assert not s.should_render
+    assert s.hz < fast and s.hz < 3.0
+
+
+def test_render_budget_caps_rate():
+    s = FrameScheduler(min_hz=2.0, max_hz=30.0, budget=0.5)
+    s.frame_done(0.05)                                        # 50 ms çizim → ≤ 10 Hz
+    s.observe(_sample(), now=0.0)
+    s.observe(_sample(bank_deg=5.0), now=0.1)
+    assert s.hz <= 10.0 and s.backoffs == 1
@@ -0,0 +1,95 @@
+import threading
+import time
+
+from core.live_feed import LiveFeed, send_frames
+from core.scenario import Frame
+from core.task_manager import CancelToken
+
+
+def _feed(**kw):
+    return LiveFeed("udp", "127.0.0.1", 0, **kw).start()
+
+
+def test_idle_timer_starts_after_first_frame():
+    feed = _feed(idle_timeout=0.3)
+    try:
+        threading.Timer(0.6, send_frames, ([Frame(lat=40.0, lon=29.0, alt=1000.0)],),
+                        {"port": feed.port}).start()
+        t0 = time.monotonic()
+        fr = next(feed)                       # kaynak idle_timeout'tan geç başladı
+        assert fr.lat == 40.0 and time.monotonic() - t0 >= 0.5
+        t0 = time.monotonic()
+        assert next(feed, None) is None       # ilk kareden sonra boşta: akış biter
+        assert 0.2 < time.monotonic() - t0 < 1.0
+    finally:
+        feed.close()
+
+
+def test_cancel_wakes_waiting_consumer():
+    feed = _feed(idle_timeout=None)
+    token = CancelToken()
+    feed.bind_stop(token)
+    out = []
+    th = threading.Thread(target=lambda: out.append(next(feed, None)))
+    try:
+        th.start()
+        time.sleep(0.1)
+        t0 = time.monotonic()
+        token.cancel()
+        th.join(1.0)
+        assert not th.is_alive() and out == [None]
+        assert time.monotonic() - t0 < 0.1
+    finally:
+        feed.close()
+
+
+def _v1_record(seq, lat):
+    import struct
+    from core.live_feed import _V1_FIELDS
+    vals = [lat if f == "lat" else 29.0 if f == "lon" else 1000.0 if f == "alt" else float("nan")
+            for f in _V1_FIELDS]
+    return struct.pack("<4sI" + "d" * len(_V1_FIELDS), b"USLF", seq, *vals)
+
+
+def _wait_for(cond, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return cond()
+
+
+def test_udp_accepts_old_records_and_counts_bad_datagrams():
+    import socket
+    from core.live_feed import encode_frame
+    feed = _feed(idle_timeout=None)
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        addr = ("127.0.0.1", feed.port)
+        for i in range(3):
+            s.sendto(_v1_record(i, 40.0 + i), addr)                   # sürüm 1 (t yok)
+        s.sendto(encode_frame(Frame(lat=41.0, lon=29.0, alt=1.0, t=5.0), 3), addr)
+        s.sendto(encode_frame(Frame(lat=42.0), 4)[:-8], addr)         # kesik kayıt
+        s.sendto(b"XXXX" + bytes(92), addr)                           # bilinmeyen magic
+        assert _wait_for(lambda: feed.received == 4 and feed.bad == 2)
+        fr = [next(feed) for _ in range(4)][-1]
+        assert fr.lat == 41.0 and fr.t == 5.0
+    finally:
+        s.close()
+        feed.close()
+
+
+def test_tcp_resyncs_after_garbage():
+    import socket
+    from core.live_feed import encode_frame
+    feed = LiveFeed("tcp", "127.0.0.1", 0, maxlen=16, idle_timeout=None).start()
+    try:
+        with socket.create_connection(("127.0.0.1", feed.port)) as s:
+            s.sendall(_v1_record(0, 40.0) + b"bozuk veri" +
+                      encode_frame(Frame(lat=41.0, t=1.0), 1) + _v1_record(2, 42.0))
+            assert _wait_for(lambda: feed.received == 3)
+        assert feed.bad == 1
+        got = [next(feed) for _ in range(3)]
+        assert [f.lat for f in got] == [40.0, 41.0, 42.0]
+        assert [f.t for f in got] == [None, 1.0, None]
+    finally:
+        feed.close()
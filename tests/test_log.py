@@ -0,0 +1,27 @@
+import logging
+
+import pytest
+
+from core import log
+
+
+def test_unknown_level_fails_before_handlers_are_attached():
+    root = logging.getLogger(log.ROOT)
+    before = list(root.handlers)
+    with pytest.raises(ValueError):
+        log.setup_logging("verbose", console=False)
+    assert root.handlers == before
+    assert log._listener is None
+
+
+def test_repeated_setup_registers_atexit_once(monkeypatch):
+    calls = []
+    monkeypatch.setattr(log.atexit, "register", calls.append)
+    monkeypatch.setattr(log, "_atexit_registered", False)
+    try:
+        log.setup_logging("info", console=False)
+        log.setup_logging("DEBUG", console=False)
+        assert logging.getLogger(log.ROOT).level == logging.DEBUG
+    finally:
+        log.shutdown_logging()
+    assert calls == [log.shutdown_logging]
@@ -0,0 +1,46 @@
+import math
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from core.track_lod import TrackLOD
+from ui.map_window import MapWindow
+
+
+class _Canvas:
+    def __init__(self):
+        self.items = {}
+
+    def coords(self, item, *pts):
+        self.items[item] = pts
+
+
+def _window():
+    w = MapWindow.__new__(MapWindow)     # Tk penceresi açmadan çizim geometrisi
+    w.cv = _Canvas()
+    w.m_per_px = 10.0
+    w.ox = w.oy = 0.0
+    w.track = TrackLOD(40.0)
+    w._level = 0
+    w._tail, w._plane = "tail", "plane"
+    return w
+
+
+@pytest.mark.parametrize("hdg_deg, nose", [(0, (0, -10)), (90, (10, 0)), (180, (0, 10)), (270, (-10, 0))])
+def test_plane_symbol_points_along_radian_heading(hdg_deg, nose):
+    w = _window()
+    w._draw_plane(0.0, 0.0, math.radians(hdg_deg))
+    nx, ny = w.cv.items["plane"][:2]
+    assert nx - w.W / 2 == pytest.approx(nose[0], abs=1e-9)
+    assert ny - w.H / 2 == pytest.approx(nose[1], abs=1e-9)
+
+
+def test_set_route_keeps_track_projection():
+    from core.scenario import Frame
+    w = _window()
+    w.ox = None                          # henüz çizilmedi: yalnızca seviyeler kurulur
+    w.set_route([Frame(lat=50.0 + i * 1e-3, lon=10.0) for i in range(10)])
+    assert w.route.lat0 == 40.0 and w.route.count == 10
+    w.set_route([])
+    assert w.route is None
@@ -0,0 +1,71 @@
+from core.clock import SimClock
+from core.playback import TimedPlayback, frame_times, has_timestamps
+from core.scenario import Frame
+from core.task_manager import CancelToken
+
+
+def _frames(times):
+    return [Frame(lat=40.0, lon=29.0, alt=1000.0 + i, t=t) for i, t in enumerate(times)]
+
+
+def _run(clock, fn):
+    out = []
+    clock.spawn(lambda: out.append(fn())).join(5.0)
+    return out[0]
+
+
+def test_frame_times_fill_and_monotonic():
+    times = frame_times(_frames([None, 1.0, None, 0.5, 3.0]), default_dt=0.1)
+    assert list(times) == [0.0, 1.0, 1.1, 1.1, 3.0]
+    assert has_timestamps(_frames([None, 2.0]))
+    assert not has_timestamps(_frames([None, None]))
+
+
+def test_irregular_timestamps_replayed_on_time():
+    clock = SimClock(start=100.0)
+    times = [5.0, 5.1, 5.15, 7.0, 7.02]
+    pb = TimedPlayback(_frames(times), clock=clock)
+
+    def consume():
+        return [(clock.now() - 100.0, fr.t) for fr in pb]
+    got = _run(clock, consume)
+    assert [t for _, t in got] == times
+    assert all(abs(at - (t - 5.0)) < 1e-9 for at, t in got)
+    assert pb.skipped == 0 and pb.stats()["timing_err_max_ms"] < 1e-6
+
+
+def test_slow_consumer_skips_to_newest_due_frame():
+    clock = SimClock()
+    pb = TimedPlayback(_frames([i * 0.1 for i in range(21)]), clock=clock)
+
+    def consume():
+        seen = []
+        for fr in pb:
+            seen.append((clock.now(), fr.t))
+            clock.sleep(0.35)            # tüketici kareden yavaş
+        return seen
+    seen = _run(clock, consume)
+    assert seen[-1][1] == 2.0
+    assert pb.frames == len(seen) and pb.skipped + pb.frames == 21
+    for now, t in seen:                  # verilen kare, zamanı gelmişlerin en yenisi
+        assert t <= now + 1e-9 and (now < t + 0.1 or t == 2.0)
+
+
+def test_speed_scales_schedule():
+    clock = SimClock()
+    pb = TimedPlayback(_frames([0.0, 10.0]), clock=clock, speed=4.0)
+    _run(clock, lambda: list(pb))
+    assert clock.now() == 2.5
+
+
+def test_cancel_during_long_gap_stops_immediately():
+    clock = SimClock()
+    token = CancelToken(clock)
+    pb = TimedPlayback(_frames([0.0, 600.0]), clock=clock)
+    pb.bind_stop(token)
+    clock.call_later(1.0, token.cancel)
+
+    def consume():
+        return [fr.t for fr in pb]
+    assert _run(clock, consume) == [0.0]
+    assert clock.now() == 1.0
@@ -0,0 +1,34 @@
+import pytest
+
+from core.route_simplify import simplify_route, compression_ratio
+from core.scenario import Frame, PackedScenario
+
+
+def _line(n=100):
+    return [Frame(lat=40.0 + i * 1e-4, lon=29.0, alt=1000.0) for i in range(n)]
+
+
+def test_straight_line_keeps_endpoints():
+    wps = _line()
+    legs = simplify_route(wps, 15.0)
+    assert legs == [wps[0], wps[-1]]
+    assert compression_ratio(wps, legs) == 50.0
+
+
+def test_corner_is_kept():
+    wps = _line(50) + [Frame(lat=40.0049, lon=29.0 + i * 1e-4, alt=1000.0) for i in range(1, 50)]
+    legs = simplify_route(wps, 15.0)
+    assert len(legs) == 3
+
+
+def test_packed_scenario_input():
+    packed = PackedScenario()
+    for wp in _line():
+        packed.append(wp)
+    assert len(simplify_route(packed, 15.0)) == 2
+
+
+@pytest.mark.parametrize("tol", [0, 0.0, -5.0, float("nan")])
+def test_non_positive_tolerance_rejected(tol):
+    with pytest.raises(ValueError):
+        simplify_route(_line(), tol)
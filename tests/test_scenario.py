@@ -0,0 +1,89 @@
+import os
+
+from core.scenario import Frame, PackedScenario, pack, save_packed, load_packed
+
+
+def _frames(n=10):
+    return [Frame(lat=40.0 + i * 1e-3, lon=29.0, alt=1000.0 + i, spd=250.0) for i in range(n)]
+
+
+def test_save_load_roundtrip(tmp_path):
+    path = str(tmp_path / "a.scn")
+    cols = pack(_frames())
+    save_packed(path, cols, (123, 456))
+    assert os.listdir(tmp_path) == ["a.scn"]            # geçici dosya kalmaz
+    back = load_packed(path, (123, 456))
+    assert list(back["alt"]) == list(cols["alt"])
+    assert load_packed(path, (1, 2)) is None
+
+
+def test_save_packed_replaces_atomically(tmp_path, monkeypatch):
+    path = str(tmp_path / "a.scn")
+    save_packed(path, pack(_frames(5)), (1, 1))
+    before = open(path, "rb").read()
+
+    def boom(*args):
+        raise OSError("disk dolu")
+    monkeypatch.setattr(os, "replace", boom)
+    try:
+        save_packed(path, pack(_frames(50)), (2, 2))
+    except OSError:
+        pass
+    assert open(path, "rb").read() == before            # eski dosya bozulmadı
+    assert os.listdir(tmp_path) == ["a.scn"]
+
+
+def test_from_mapping_skips_bad_frames():
+    assert Frame.from_mapping({"latitude": 40.0, "altitude_m": 100.0}).alt == 100.0 * 3.28084
+    assert Frame.from_mapping("bozuk") is None
+    assert Frame.from_mapping({"lat": "kuzey"}) is None
+    assert Frame.from_mapping({"lat": [1]}) is None
+
+
+def _packed(n=10):
+    p = PackedScenario()
+    for fr in _frames(n):
+        p.append(fr)
+    return p
+
+
+def test_offset_and_delete_ranges():
+    p = _packed()
+    p.offset("alt", 500.0, 2, 5)
+    assert list(p.cols["alt"][:6]) == [1000.0, 1001.0, 1502.0, 1503.0, 1504.0, 1005.0]
+    p.delete(0, 3)
+    assert len(p) == 7 and p[0].alt == 1503.0
+    assert all(len(c) == 7 for c in p.cols.values())
+
+
+def test_offset_keeps_missing_values():
+    p = PackedScenario()
+    p.append(Frame(lat=40.0, lon=29.0, alt=1000.0))
+    p.offset("spd", 10.0)
+    assert p[0].spd is None
+
+
+def test_shared_columns_are_copied_on_first_edit():
+    base = _packed()
+    shared = PackedScenario(base.cols, shared=True)
+    shared.offset("alt", 100.0)
+    shared.delete(0, 2)
+    shared.append(Frame(lat=41.0, lon=29.0, alt=0.0))
+    assert not shared.shared
+    assert len(base) == 10 and base.cols["alt"][0] == 1000.0
+    assert len(shared) == 9 and shared[0].alt == 1102.0
+
+
+def test_cache_hits_are_isolated_from_edits(tmp_path):
+    import json
+    from core.scenario_cache import ScenarioCache
+    path = tmp_path / "s.json"
+    path.write_text(json.dumps([{"lat": 40.0 + i * 1e-3, "lon": 29.0, "alt": 1000.0}
+                                for i in range(5)]))
+    cache = ScenarioCache()
+    first = cache.load(str(path))
+    first.delete(0, 4)
+    first.offset("alt", 1.0)
+    again = cache.load(str(path))
+    assert cache.hits == 1
+    assert len(again) == 5 and again[0].alt == 1000.0
@@ -0,0 +1,67 @@
+import queue
+import time
+
+import pytest
+
+from core.scenario import FIELDS
+from core.shared_telemetry import SHARED_VARS, SharedTelemetry, _SEQ
+from core.sim_process import _FrameRouter, _QueueStream
+
+
+def _vals(lat):
+    return tuple(lat if f == "lat" else None for f in FIELDS)
+
+
+def test_old_stream_hands_newer_frames_to_new_follow():
+    q = queue.Queue()
+    router = _FrameRouter(q)
+    old = _QueueStream(router, 1)
+    q.put((1, _vals(1.0)))
+    q.put((2, _vals(2.0)))               # yeni takibin kareleri komuttan önce geldi
+    q.put((2, _vals(2.1)))
+    assert next(old).lat == 1.0
+    assert next(old, None) is None       # yeni nesil görüldü: eski akış biter
+
+    router.begin(2)
+    new = _QueueStream(router, 2)
+    q.put((1, _vals(1.5)))               # eski takipten geç kalan kare atılır
+    q.put((2, None))
+    assert [fr.lat for fr in new] == [2.0, 2.1]
+
+
+def test_begin_ends_old_stream_immediately():
+    q = queue.Queue()
+    router = _FrameRouter(q)
+    old = _QueueStream(router, 1)
+    router.begin(2)
+    q.put((2, _vals(2.0)))
+    assert next(old, None) is None
+    assert q.qsize() == 1                # yeni kareye dokunulmadı
+
+
+def test_stream_stops_on_cancel():
+    class _Stop:
+        def is_set(self):
+            return True
+    stream = _QueueStream(_FrameRouter(queue.Queue()), 1)
+    stream.bind_stop(_Stop())
+    assert next(stream, None) is None
+
+
+def test_read_raw_bounded_when_writer_dies_mid_write():
+    writer = SharedTelemetry(create=True)
+    reader = SharedTelemetry(writer.name)
+    try:
+        with pytest.raises(TimeoutError):
+            _SEQ.pack_into(writer._buf, 0, 1)            # hiç tutarlı görüntü yok
+            reader.read_raw()
+        writer.write([1.0] * len(SHARED_VARS))
+        assert reader.get("PLANE_ALTITUDE") == 1.0
+        _SEQ.pack_into(writer._buf, 0, 5)                # yazar seq tekken öldü
+        t0 = time.monotonic()
+        assert reader.get("PLANE_ALTITUDE") == 1.0       # son tutarlı görüntü
+        assert time.monotonic() - t0 < 0.5
+        assert reader.stale == 1
+    finally:
+        reader.close()
+        writer.close()
@@ -0,0 +1,33 @@
+import time
+
+import pytest
+
+from core.telemetry_server import TelemetryClient, TelemetryServer
+
+
+class _Aq:
+    def __init__(self, **values):
+        self.values = values
+
+    def get(self, name):
+        return self.values.get(name)
+
+
+def _wait(client, name, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while client.get(name) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return client.get(name)
+
+
+@pytest.mark.parametrize("proto", ["udp", "tcp"])
+def test_all_interfaces_bind_is_reachable(proto):
+    server = TelemetryServer(_Aq(PLANE_ALTITUDE=1234.0), host="0.0.0.0",
+                             udp_port=0, tcp_port=0).start()
+    port = server.udp_port if proto == "udp" else server.tcp_port
+    client = TelemetryClient(proto, "127.0.0.1", port).start()
+    try:
+        assert _wait(client, "PLANE_ALTITUDE") == 1234.0
+    finally:
+        client.close()
+        server.stop()
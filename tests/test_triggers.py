@@ -0,0 +1,72 @@
+from core.clock import SimClock
+from core.fake_sim import FakeSim
+from core.flight_controller import FlightController
+from core.task_manager import FlightTaskManager
+from core.triggers import TriggerEngine, ge, near
+
+
+class _RampAq:
+    """IAS = 10·t kt; her get sayılır."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.gets = 0
+
+    def get(self, name):
+        self.gets += 1
+        return 10.0 * self.clock.now()
+
+
+def test_polled_wait_fires_within_one_period():
+    clock = SimClock()
+    aq = _RampAq(clock)
+    trig = TriggerEngine(aq, rate_hz=2.0, clock=clock)
+    assert trig.wait_for(ge("AIRSPEED_INDICATED", 70)) == 0
+    assert 7.0 <= clock.now() <= 7.5
+    assert aq.gets == trig.reads <= 16        # 2 Hz × 7 s (+ ilk okuma)
+
+
+def test_passive_wait_does_not_read():
+    clock = SimClock()
+    aq = _RampAq(clock)
+    trig = TriggerEngine(aq, clock=clock)
+    assert trig.wait_for(ge("AIRSPEED_INDICATED", 70), timeout=3.0, poll=False) is None
+    assert aq.gets == 0
+    assert clock.now() == 3.0
+
+
+def test_fresh_updates_replace_polling_reads():
+    clock = SimClock()
+    aq = _RampAq(clock)
+    trig = TriggerEngine(aq, rate_hz=2.0, clock=clock)
+    result = []
+
+    def _task():
+        result.append(trig.wait_for(near("PLANE_ALTITUDE", 500.0, 5.0)))
+
+    def _publisher():                         # paylaşılan telemetri kaynağı (10 Hz)
+        while not result:
+            trig.update({"PLANE_ALTITUDE": 100.0 * clock.now()})
+            clock.sleep(0.1)
+
+    task = clock.spawn(_task)                 # ikisi de saat katılımcısı: zaman birlikte ilerler
+    pub = clock.spawn(_publisher)
+    task.join(5.0)
+    pub.join(5.0)
+    assert result == [0]
+    assert 4.95 < clock.now() < 5.2           # yayının çözünürlüğüyle uyanır
+    assert aq.gets <= 1                       # yalnızca ilk yayından önceki okuma
+
+
+def test_nav_loop_reads_once_per_tick():
+    clock = SimClock()
+    sim = FakeSim(lat=40.0, lon=29.0, alt=1000.0, ias=120.0, clock=clock)
+    trig = TriggerEngine(clock=clock)
+    flight = FlightController(sim.aq, sim.ae, triggers=trig, clock=clock,
+                              tasks=FlightTaskManager(clock))
+    flight.fly_to(40.05, 29.0, 1000.0, 120.0)
+    clock.sleep(30.0)
+    flight.stop_nav()
+    ticks = flight.loop_count
+    assert ticks >= 25
+    assert trig.reads <= 3 * ticks            # konum (3 SimVar) tik başına bir kez
@@ -0,0 +1,113 @@
+import math
+import time
+
+
+# Değişken başına "tam ölçek" değişim hızı (birim/s): bu hızda ve üstünde
+# hedef yenileme max_hz olur. Birimler SimConnect'in bildirdiği birimlerdir:
+# açılar (adlarında DEGREES olsa da) radyandır.
+FULL_SCALE = {
+    "PLANE_PITCH_DEGREES":        math.radians(5.0),     # 5 °/s
+    "PLANE_BANK_DEGREES":         math.radians(10.0),    # 10 °/s
+    "PLANE_HEADING_DEGREES_TRUE": math.radians(6.0),     # 6 °/s (standart dönüş 3°/s)
+    "AIRSPEED_INDICATED":         5.0,     # kt/s
+    "PLANE_ALTITUDE":             50.0,    # ft/s (3000 fpm)
+    "VERTICAL_SPEED":             500.0,   # fpm/s
+}
+
+
+class FrameScheduler:
+    """PFD için uyarlanır yenileme zamanlayıcısı.
+
+    Her örnekte telemetri değişim hızından (FULL_SCALE'e göre en hızlı
+    değişken) bir etkinlik (0‥1) çıkarılır ve hedef hız min_hz ile max_hz
+    arasında seçilir. Hız artışı anında, düşüş release_s boyunca yumuşak
+    olur; böylece manevra başında ekran hemen hızlanır, bitince titremeden
+    yavaşlar. Değerler değişmediyse çizim atlanır (should_render False).
+
+    Bütçe: çizim süresi (EMA) kare periyodunun budget oranını aşarsa hız
+    budget / çizim_süresi ile sınırlandırılır; ağır kareler UI'yi
+    boğmaz.
+    """
+
+    def __init__(self, min_hz=2.0, max_hz=30.0, budget=0.5, release_s=2.0, idle_eps=0.02,
+                 full_scale=None):
+        self.min_hz, self.max_hz = min_hz, max_hz
+        self.budget = budget
+        self.release_s = release_s
+        self.idle_eps = idle_eps
+        self.full_scale = full_scale or FULL_SCALE
+
+        self.hz = min_hz
+        self.activity = 0.0
+        self.render_ms = 0.0             # çizim süresi EMA (ms)
+        self.frames = self.skipped = self.backoffs = 0
+        self._prev = None
+        self._prev_t = None
+        self.should_render = True
+
+    # --------------------------------------------------
+    def observe(self, values, now=None):
+        """Yeni telemetri örneği → hedef hızı güncelle, çizim gerekip
+        gerekmediğini should_render'a yaz."""
+        now = time.perf_counter() if now is None else now
+        prev, dt = self._prev, (now - self._prev_t) if self._prev_t is not None else 0.0
+        self._prev, self._prev_t = dict(values), now
+
+        if prev is None or dt <= 0:
+            self.should_render = True
+            return self.hz
+
+        act = 0.0
+        changed = False
+        for name, scale in self.full_scale.items():
+            a, b = values.get(name), prev.get(name)
+            if a is None or b is None:
+                changed |= a is not b
+                continue
+            d = a - b
+            if name == "PLANE_HEADING_DEGREES_TRUE":
+                d = (d + math.pi) % (2 * math.pi) - math.pi   # 2π → 0 geçişi
+            if d:
+                changed = True
+                act = max(act, abs(d) / dt / scale)
+        for name, v in values.items():                   # ölçeği olmayanlar (ör. konum)
+            if name not in self.full_scale and v != prev.get(name):
+                changed = True
+        self.activity = act = min(act, 1.0)
+        self.should_render = changed
+
+        target = self.min_hz if act < self.idle_eps else \
+            self.min_hz + (self.max_hz - self.min_hz) * act
+        if target >= self.hz:
+            self.hz = target                             # hızlan: anında
+        else:
+            self.hz += (target - self.hz) * min(1.0, dt / self.release_s)
+
+        cap = self.max_hz
+        if self.render_ms > 0:
+            cap = min(cap, self.budget * 1000.0 / self.render_ms)
+        if self.hz > cap:
+            self.hz = max(self.min_hz, cap)
+            self.backoffs += 1
+        return self.hz
+
+    def frame_done(self, render_s):
+        """Çizim süresini bildir (yalnızca çizilen karelerde)."""
+        ms = render_s * 1000.0
+        self.render_ms = ms if not self.frames else self.render_ms * 0.8 + ms * 0.2
+        self.frames += 1
+
+    def skip(self):
+        self.skipped += 1
+
+    @property
+    def delay_s(self):
+        return 1.0 / self.hz
+
+    @property
+    def interval_ms(self):
+        return max(1, int(1000.0 / self.hz))
+
+    def summary(self):
+        return (f"{self.hz:4.1f} Hz  etkinlik {self.activity:.2f}  çizim {self.render_ms:.1f} ms  "
+                f"{self.frames} kare / {self.skipped} atlandı")
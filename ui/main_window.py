@@ -1,19 +1,35 @@
 from tkinter import *
+from ui.map_window import MapWindow
 from ui.pfd_window import PFDWindow
-from tkinter import filedialog     
-import json, time, threading       
+from ui.scenario_table import ScenarioTable
+from tkinter import filedialog
+from core.scenario import stream_frames, Frame, PackedScenario
+from core.scenario_cache import ScenarioCache
+from core.spatial_index import RouteIndex
+from core.route_simplify import simplify_route, compression_ratio
+from core.scenario_preprocess import read_index, load_indexed
+from core.live_feed import LiveFeed, parse_address
+from core.playback import TimedPlayback, has_timestamps
+from core.telemetry_server import TelemetryServer
+import os, threading, time
 
 
 class MainWindow:
-    def __init__(self, root, sim_manager, autopilot, flight):
+    def __init__(self, root, sim_manager, autopilot, flight, scenario_cache=None):
         self.root        = root
         self.sim_manager = sim_manager
         self.autopilot   = autopilot
         self.flight      = flight
+        self.scenario_cache = scenario_cache or ScenarioCache()
 
-        self.scenario     = []
+        self.scenario     = PackedScenario()
         self.entries      = {}
         self.data_stream  = None      # dış veri kaynağı
+        self.json_waypoints = None    # yüklenen JSON senaryo noktaları
+        self.route_index  = None      # JSON senaryonun mekânsal indeksi
+        self.live_feed    = None      # UDP/TCP canlı kaynak (LiveFeed)
+        self.telemetry    = None      # harici ekranlara yayın (TelemetryServer)
+        self.map_windows  = []        # açık haritalar (rota düzenlenince yenilenir)
         self._build_ui()
 
     # --------------------------------------------------
@@ -45,25 +61,87 @@ class MainWindow:
                                  command=self.follow_data, state=DISABLED)
         self.follow_btn.grid(row=1, column=6, padx=6)
 
+        # Ön-işlenmiş senaryo dizini (preprocess_scenarios.py → index.json)
+        Button(self.root, text="🗂️ Senaryo Dizini",
+               command=self.open_scenario_dir).grid(row=1, column=7, padx=6)
+
+        # Canlı UDP/TCP kaynak (ör. HIL düzeneği) → 📡 ile izlenir
+        Button(self.root, text="🛰️ Canlı Kaynak",
+               command=self.start_live_feed).grid(row=1, column=8, padx=6)
+        Label(self.root, text="Kaynak adresi").grid(row=3, column=3)
+        self.feed_entry = Entry(self.root, width=22)
+        self.feed_entry.insert(0, "udp:49005")
+        self.feed_entry.grid(row=3, column=4)
+        self.latest_var = BooleanVar(value=True)
+        Checkbutton(self.root, text="Yalnızca en taze kare",
+                    variable=self.latest_var).grid(row=4, column=3, columnspan=2)
+
+        # Harici PFD'ler için telemetri yayını (pfd_remote.py ile izlenir)
+        self.telemetry_btn = Button(self.root, text="📤 Telemetri Yayını",
+                                    command=self.toggle_telemetry)
+        self.telemetry_btn.grid(row=1, column=9, padx=6)
+        # Dinleme adresi: 127.0.0.1 yalnızca bu makine, 0.0.0.0 yerel ağ (uzak PFD)
+        Label(self.root, text="Yayın adresi").grid(row=2, column=5)
+        self.telemetry_entry = Entry(self.root, width=16)
+        self.telemetry_entry.insert(0, "127.0.0.1")
+        self.telemetry_entry.grid(row=2, column=6)
+
+        # Etkin görevi (kalkış / NAV / senaryo / takip / ışınlama) anında kes
+        Button(self.root, text="⏹️ Durdur",
+               command=self.stop_task).grid(row=1, column=10, padx=6)
+
+        # Rota + uçulan iz (yüklü JSON rota, yoksa senaryo listesi)
+        Button(self.root, text="🗺️ Harita",
+               command=self.open_map).grid(row=1, column=11, padx=6)
+
         # Girdi alanları
         Label(self.root, text="Koordinat (LAT,LON)").grid(row=2, column=0)
         self.coord_entry = Entry(self.root, width=28)
         self.coord_entry.grid(row=2, column=1, columnspan=2)
 
+        # JSON yüklerken isteğe bağlı rota sadeleştirme toleransı (boş = kapalı)
+        Label(self.root, text="Sadeleştirme (m)").grid(row=2, column=3)
+        self.simplify_entry = Entry(self.root, width=8)
+        self.simplify_entry.grid(row=2, column=4)
+
         for i, label in enumerate(["ALT (ft)", "SPD (knot)", "HDG (°)"]):
             Label(self.root, text=label).grid(row=3+i, column=0)
             entry = Entry(self.root)
             entry.grid(row=3+i, column=1)
             self.entries[label] = entry
 
+        # Kayıttaki zaman damgalarıyla (t) oynat; yoksa sabit 10 Hz
+        self.timed_var = BooleanVar(value=True)
+        Checkbutton(self.root, text="⏱️ Zaman damgalı oynat",
+                    variable=self.timed_var).grid(row=5, column=3, columnspan=2)
+
         # Senaryo
         Label(self.root, text="Senaryo Listesi").grid(row=6, column=0, pady=6)
         Button(self.root, text="➕ Ekle", command=self.add_wp).grid(row=6, column=1)
         self.run_scen_btn = Button(self.root, text="▶️ Başlat",
                                    command=self.run_scenario, state=DISABLED)
         self.run_scen_btn.grid(row=6, column=2)
-        self.scen_listbox = Listbox(self.root, height=6, width=58)
-        self.scen_listbox.grid(row=7, column=0, columnspan=4)
+        self.join_var = BooleanVar(value=False)
+        Checkbutton(self.root, text="⏩ En yakın noktadan katıl",
+                    variable=self.join_var).grid(row=6, column=3)
+        # Sanal tablo: yalnızca görünen satırlar çizilir (büyük JSON'lar da)
+        self.scen_table = ScenarioTable(self.root, rows=8)
+        self.scen_table.grid(row=7, column=0, columnspan=6)
+        self.scen_table.set_data(self.scenario)
+
+        # Tabloda gösterilen / düzenlenen veri + toplu işlemler
+        self.view_var = StringVar(value="nav")
+        Radiobutton(self.root, text="📋 NAV senaryosu", variable=self.view_var, value="nav",
+                    command=self._show_table).grid(row=8, column=0)
+        Radiobutton(self.root, text="📄 JSON akışı", variable=self.view_var, value="json",
+                    command=self._show_table).grid(row=8, column=1)
+        Label(self.root, text="ΔALT (ft)").grid(row=8, column=2)
+        self.alt_delta_entry = Entry(self.root, width=8)
+        self.alt_delta_entry.grid(row=8, column=3)
+        Button(self.root, text="⬆️ İrtifa kaydır",
+               command=self.offset_altitude).grid(row=8, column=4)
+        Button(self.root, text="🗑️ Seçimi sil",
+               command=self.delete_selection).grid(row=8, column=5)
 
     # --------------------------------------------------
     def _status(self, msg):
@@ -97,20 +175,101 @@ class MainWindow:
     # --------------------------------------------------
     def set_data_stream(self, stream_iter):
         """Haricî 10 Hz veri kaynağını atar (iterator/generator)."""
+        if self.live_feed is not None and stream_iter is not self.live_feed:
+            self.live_feed.close()
+            self.live_feed = self.flight.frame_applied = None
         self.data_stream = stream_iter
+        self.json_waypoints = self.route_index = None
+        if self.view_var.get() == "json":
+            self._show_table()
         self._status("ℹ️ Veri kaynağı alındı – 📡 butonu hazır")
 
     def follow_data(self):
+        if self.json_waypoints:
+            # JSON senaryo her takipte baştan (ya da katılım noktasından) akar
+            start = self.flight.join_index(self.route_index) if self.join_var.get() else 0
+            if self.timed_var.get() and has_timestamps(self.json_waypoints):
+                self.data_stream = TimedPlayback(self.json_waypoints, start,
+                                                 clock=getattr(self.flight, "clock", None))
+            else:
+                self.data_stream = stream_frames(self.json_waypoints, start=start)
         if not self.data_stream:
             self._status("❌ Önce set_data_stream() ile veri kaynağı gir.")
             return
+        # Canlı kaynak ve zaman damgalı oynatma kendi hızında akar: ek bekleme yok
+        timed = isinstance(self.data_stream, TimedPlayback)
+        interval = 0 if self.data_stream is self.live_feed or timed else 0.1
         threading.Thread(target=self.flight.follow_stream,
-                         args=(self.data_stream, 0.1), daemon=True).start()
+                         args=(self.data_stream, interval), daemon=True).start()
+        if timed:
+            self.root.after(1000, self._poll_playback, self.data_stream)
+        elif self.live_feed is not None:
+            self.root.after(1000, self._poll_live)
+
+    def start_live_feed(self):
+        """Adres kutusundaki (udp:PORT / tcp:HOST:PORT) soketi dinlemeye başla."""
+        try:
+            proto, host, port = parse_address(self.feed_entry.get())
+            policy = "latest" if self.latest_var.get() else "drop_oldest"
+            feed = LiveFeed(proto, host, port, policy=policy).start()
+        except Exception as e:
+            self._status(f"❌ Canlı kaynak açılamadı: {e}")
+            return
+        self.set_data_stream(feed)
+        self.live_feed = feed
+        self.flight.frame_applied = feed.frame_applied     # alım→sim gecikmesi ölçümü
+        self.follow_btn.config(state=NORMAL)
+        self._status(f"🛰️ {proto.upper()} {host}:{feed.port} dinleniyor ({policy}) – 📡 ile izle")
+
+    def toggle_telemetry(self):
+        """Telemetri yayınını aç/kapat (UDP 49010 abonelik, TCP 49011)."""
+        if self.telemetry is not None:
+            self.telemetry.stop()
+            self.telemetry = None
+            self.telemetry_btn.config(text="📤 Telemetri Yayını")
+            self._status("ℹ️ Telemetri yayını durduruldu")
+            return
+        if self.flight.aq is None:
+            self._status("❌ Önce SimConnect'e bağlan.")
+            return
+        try:
+            host = self.telemetry_entry.get().strip() or "127.0.0.1"
+            self.telemetry = TelemetryServer(self.flight.aq, host=host).start()
+        except OSError as e:
+            self._status(f"❌ Telemetri yayını açılamadı: {e}")
+            return
+        self.telemetry_btn.config(text="⏹️ Yayını Durdur")
+        self._status(f"📤 Telemetri yayında ({self.telemetry.host}): UDP {self.telemetry.udp_port} / "
+                     f"TCP {self.telemetry.tcp_port} @ {self.telemetry.rate_hz:g} Hz")
+
+    def _poll_playback(self, playback):
+        nav = self.flight.nav_thread
+        if nav is not None and nav.is_alive():
+            self.root.after(1000, self._poll_playback, playback)
+        elif playback is self.data_stream:
+            self._status(f"⏱️ Oynatma bitti: {playback.summary()}")
+
+    def _poll_live(self):
+        feed = self.live_feed
+        if feed is None:
+            return
+        nav = self.flight.nav_thread
+        if nav is not None and nav.is_alive():
+            self.root.after(1000, self._poll_live)
+        else:
+            self._status(f"🛰️ Canlı akış bitti: {feed.summary()}")
 
     # --------------------------------------------------
     def start_takeoff(self):
         threading.Thread(target=self.autopilot.takeoff_sequence, daemon=True).start()
 
+    def stop_task(self):
+        ms = self.flight.stop_nav()
+        if ms is None:                   # ayrık süreç: iptal sim sürecinde yapılır
+            self._status("⏹️ Görev durduruldu")
+        else:
+            self._status(f"⏹️ Görev durduruldu ({ms:.1f} ms)")
+
     def teleport(self):
         try:
             lat, lon = map(float, self.coord_entry.get().split(","))
@@ -137,19 +296,109 @@ class MainWindow:
             alt = float(self.entries["ALT (ft)"].get())
             spd = float(self.entries["SPD (knot)"].get())
 
-            wp = {"lat": lat, "lon": lon, "alt": alt, "spd": spd}
-            self.scenario.append(wp)
-
-            self.scen_listbox.insert(END, f"{lat:.4f}, {lon:.4f}  |  {alt} ft  | {spd} kt")
-            self.run_scen_btn.config(state=NORMAL)
+            self._append_wp(Frame(lat=lat, lon=lon, alt=alt, spd=spd))
         except Exception as e:
             self._status(f"❌ Senaryo girişi hatası: {e}")
 
+    def _append_wp(self, wp):
+        self.scenario.append(wp)
+        self.run_scen_btn.config(state=NORMAL)
+        if self.view_var.get() != "nav":
+            self.view_var.set("nav")
+            self.scen_table.set_data(self.scenario)
+        self.scen_table.scroll_to(len(self.scenario))        # son eklenen görünsün
+        if self.json_waypoints is None:
+            self._refresh_maps()                             # harita senaryo listesini gösteriyor
+
+    # -------- Harita --------
+    def _map_route(self):
+        return self.json_waypoints or self.scenario
+
+    def open_map(self):
+        """Rota + uçulan iz (yüklü JSON rota, yoksa senaryo listesi)."""
+        self.map_windows = [w for w in self.map_windows if w.alive]
+        self.map_windows.append(MapWindow(self.root, self.flight, self._map_route()))
+
+    def _refresh_maps(self):
+        """Rota değişince açık haritalara yeni rotayı ver."""
+        self.map_windows = [w for w in self.map_windows if w.alive]
+        route = self._map_route()
+        for w in self.map_windows:
+            w.set_route(route)
+
+    # -------- Tablo + toplu düzenleme --------
+    def _table_data(self):
+        return self.json_waypoints if self.view_var.get() == "json" else self.scenario
+
+    def _show_table(self):
+        data = self._table_data()
+        self.scen_table.set_data(data if data is not None else PackedScenario())
+
+    def _task_running(self):
+        nav = self.flight.nav_thread
+        return nav is not None and nav.is_alive()
+
+    def _editable(self):
+        if self._task_running():
+            self._status("❌ Görev sürerken senaryo düzenlenemez (⏹️ Durdur).")
+            return None
+        data = self._table_data()
+        if not data:
+            self._status("❌ Tabloda düzenlenecek nokta yok.")
+            return None
+        return data
+
+    def offset_altitude(self):
+        """Seçili aralığın (seçim yoksa tümünün) irtifasını ΔALT kadar kaydır."""
+        data = self._editable()
+        if data is None:
+            return
+        try:
+            delta = float(self.alt_delta_entry.get())
+        except ValueError:
+            self._status("❌ ΔALT sayı olmalı (örn. 500 ya da -250).")
+            return
+        start, stop = self.scen_table.selection or (0, len(data))
+        t0 = time.perf_counter()
+        data.offset("alt", delta, start, stop)
+        ms = (time.perf_counter() - t0) * 1000
+        self.scen_table.refresh()
+        self._status(f"✏️ {stop - start} noktada irtifa {delta:+g} ft ({ms:.1f} ms)")
+
+    def delete_selection(self):
+        data = self._editable()
+        if data is None:
+            return
+        sel = self.scen_table.selection
+        if not sel:
+            self._status("❌ Önce tabloda bir aralık seçin (tık + Shift-tık).")
+            return
+        t0 = time.perf_counter()
+        data.delete(*sel)
+        ms = (time.perf_counter() - t0) * 1000
+        if data is self.json_waypoints:
+            if data:
+                # Konumlar değişti: katılım indeksi yeniden kurulur
+                self.route_index = RouteIndex.from_waypoints(data)
+            else:
+                # Hepsi silindi: eski akışla sessizce "takip" edilmesin
+                self.json_waypoints = self.route_index = self.data_stream = None
+                if self.live_feed is None:
+                    self.follow_btn.config(state=DISABLED)
+        elif not data:
+            self.run_scen_btn.config(state=DISABLED)
+        self._refresh_maps()
+        self.scen_table.clear_selection()
+        self._status(f"🗑️ {sel[1] - sel[0]} nokta silindi, {len(data)} kaldı ({ms:.1f} ms)")
+
     def run_scenario(self):
         if not self.scenario:
             self._status("❌ Senaryo boş.")
             return
-        threading.Thread(target=self.flight.fly_scenario, args=(self.scenario,), daemon=True).start()
+        start = 0
+        if self.join_var.get():
+            start = self.flight.join_index(RouteIndex.from_waypoints(self.scenario))
+        threading.Thread(target=self.flight.fly_scenario, args=(self.scenario, start), daemon=True).start()
 
     def load_json_scenario(self):
         """Dosyadan JSON senaryo seç → 10 Hz akışa çevir → follow_stream."""
@@ -160,27 +409,90 @@ class MainWindow:
         if not path:
             return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                waypoints = json.load(f)
-            if not isinstance(waypoints, list):
-                raise ValueError("Liste formatı bekleniyor")
-
-            # --- waypoint listesini 10 Hz jeneratöre sar ---
-            def stream():
-                for wp in waypoints:
-                    yield {
-                        "lat":  wp.get("latitude")  or wp.get("lat"),
-                        "lon":  wp.get("longitude") or wp.get("lon"),
-                        "alt":  wp.get("altitude_m") or wp.get("alt"),
-                        "heading_deg":  wp.get("heading_deg", 0),  
-                        "flaps":   wp.get("flaps", 0),
-                        "elev_trim": wp.get("elev_trim", 0),
-                    }
-                    time.sleep(0.1)
-
-            # Haricî kaynağı ata, butonu aç
-            self.set_data_stream(stream())
-            self.follow_btn.config(state=NORMAL)
-            self._status(f"✅ {len(waypoints)} noktalı senaryo yüklendi")
+            t0 = time.perf_counter()
+            hits = self.scenario_cache.hits
+            waypoints = self.scenario_cache.load(path)
+            load_info = (f"{(time.perf_counter() - t0) * 1000:.0f} ms"
+                         + (", önbellek" if self.scenario_cache.hits > hits else ""))
+            self._use_scenario(waypoints, load_info)
         except Exception as e:
             self._status(f"❌ JSON okuma hatası: {e}")
+
+    def _use_scenario(self, waypoints, load_info):
+        """Yüklenen senaryoyu veri kaynağı yapar (+ istenirse NAV bacaklarına indirir)."""
+        index = RouteIndex.from_waypoints(waypoints) if waypoints else None
+
+        # Haricî kaynağı ata, butonu aç (hızı follow_stream belirler)
+        self.set_data_stream(stream_frames(waypoints))
+        self.json_waypoints, self.route_index = waypoints, index
+        self.follow_btn.config(state=NORMAL)
+        self.view_var.set("json")
+        self.scen_table.set_data(waypoints)
+        self._refresh_maps()
+
+        # İstenirse yoğun izi NAV bacaklarına indir → senaryo listesine
+        tol = self.simplify_entry.get().strip()
+        if tol and waypoints:
+            if self._task_running():
+                self._status(f"⚠️ {len(waypoints)} noktalı senaryo yüklendi ({load_info}); görev "
+                             f"sürerken NAV listesi değiştirilmedi (⏹️ Durdur, sonra yeniden yükle).")
+                return
+            try:
+                legs = simplify_route(waypoints, float(tol))
+            except ValueError as e:
+                self._status(f"❌ {len(waypoints)} noktalı senaryo yüklendi ({load_info}) ama "
+                             f"sadeleştirilemedi: {e}")
+                return
+            self.scenario.clear()
+            for wp in legs:
+                self.scenario.append(wp)
+            self.run_scen_btn.config(state=NORMAL)
+            self._status(f"✅ {len(waypoints)} noktalı senaryo yüklendi ({load_info}) – {len(legs)} "
+                         f"noktaya sadeleştirildi ({compression_ratio(waypoints, legs):.1f}×)")
+            return
+        self._status(f"✅ {len(waypoints)} noktalı senaryo yüklendi ({load_info})")
+
+    # --------------------------------------------------
+    def open_scenario_dir(self):
+        """Ön-işlenmiş dizinin index.json'unu anında listeler; çift tık →
+        .scn dosyası JSON ayrıştırılmadan yüklenir.
+        """
+        folder = filedialog.askdirectory(title="Ön-işlenmiş senaryo dizini seç")
+        if not folder:
+            return
+        index = read_index(folder)
+        if index is None:
+            self._status("❌ index.json bulunamadı – önce preprocess_scenarios.py çalıştırın.")
+            return
+        entries = [e for e in index["scenarios"] if not e.get("error")]
+        bad = len(index["scenarios"]) - len(entries)
+
+        top = Toplevel(self.root)
+        top.title(f"Senaryolar – {len(entries)} geçerli, {bad} hatalı")
+        lb = Listbox(top, width=96, height=24, font=("Consolas", 9))
+        sb = Scrollbar(top, command=lb.yview)
+        lb.config(yscrollcommand=sb.set)
+        lb.pack(side=LEFT, fill=BOTH, expand=True)
+        sb.pack(side=RIGHT, fill=Y)
+        for e in entries:
+            lb.insert(END, f"{e['file'][:36]:<36} {e['points']:>8} nokta {e['length_nm']:>9.2f} NM "
+                           f"+{e['climb_ft']:>7.0f} ft {e['legs']:>5} bacak")
+
+        def _open(_evt=None):
+            sel = lb.curselection()
+            if not sel:
+                return
+            e = entries[sel[0]]
+            try:
+                t0 = time.perf_counter()
+                waypoints = load_indexed(folder, e)
+                src = ".scn"
+                if waypoints is None:           # kaynak değişmiş → JSON'dan
+                    waypoints = self.scenario_cache.load(
+                        os.path.join(folder, e.get("source_dir", ""), e["file"]))
+                    src = "JSON"
+                self._use_scenario(waypoints, f"{(time.perf_counter() - t0) * 1000:.0f} ms, {src}")
+            except Exception as ex:
+                self._status(f"❌ Senaryo açma hatası: {ex}")
+
+        lb.bind("<Double-Button-1>", _open)
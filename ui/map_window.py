@@ -0,0 +1,261 @@
+import math
+import time
+import tkinter as tk
+
+from core.log import get_logger
+from core.track_lod import TrackLOD
+
+log = get_logger("map")
+
+
+class MapWindow:
+    """Hareketli harita: yüklü rota + uçulan iz (kuzey yukarı).
+
+    Rota ve iz TrackLOD ile seviyelere ayrılır; yakınlaştırmaya göre
+    toleransı bir pikselin altında kalan en kaba seviye çizilir, böylece
+    milyon noktalık bir rota da birkaç bin çizgi noktasına iner. Çok
+    yakında seviye MAX_POINTS'i aşarsa rotanın yalnızca görünür bölgesi
+    (±1.5 ekran) çizilir; uçak bu bölgeden çıkınca yeniden kırpılır.
+
+    İz artımlı çizilir: yeni noktalar yalnızca açık (son) çizgi parçasına
+    eklenir, parça CHUNK noktaya ulaşınca kapatılıp yenisi açılır. Uçak
+    merkezden uzaklaşınca harita tek bir Canvas.move ile kaydırılır; tam
+    yeniden çizim yalnızca yakınlaştırma ya da seviye değişiminde olur.
+    Kare süresi böylece uçuşun uzunluğundan bağımsız kalır.
+    """
+
+    W, H = 520, 520
+    RATE_HZ = 5            # konum okuma / çizim hızı
+    CHUNK = 256            # çizgi parçası başına en çok nokta
+    MAX_POINTS = 20000     # bir seviyede çizilecek en çok nokta
+    PX_TOL = 1.0           # LOD toleransı (piksel)
+    RECENTER = 0.25        # uçak merkezden bu oranda uzaklaşınca harita kayar
+
+    ROUTE_COLOR = "#3fa9f5"
+    TRACK_COLOR = "#ff00ff"
+
+    # ────────────────────────────────────────────────────────────────────
+    def __init__(self, root: tk.Tk, flight_ctrl, route=None):
+        self.flight = flight_ctrl
+        self.m_per_px = 50.0
+
+        self.top = tk.Toplevel(root)
+        self.top.title("Hareketli Harita")
+        self.top.resizable(False, False)
+        self.cv = tk.Canvas(self.top, width=self.W, height=self.H, bg="#0b1a10")
+        self.cv.pack()
+
+        # Rota bir kez seviyelere ayrılır; iz aynı izdüşümü kullanır
+        self.route = TrackLOD.from_waypoints(route) if route else None
+        self.track = None
+        self.ox = self.oy = None         # ekran merkezindeki dünya noktası (m)
+
+        self._level = 0                  # izin çizilen seviyesi
+        self._route_level = 0
+        self._cull_at = None             # kırpılmış rota çiziminin merkezi (yoksa None)
+        self._drawn = 0                  # çizilmiş iz noktası (seviye dizisinde)
+        self._chunk = None               # açık iz parçası (Canvas id)
+        self._chunk_pts = []             # açık parçanın dünya koordinatları
+        self.draw_ms = 0.0               # kare süresi EMA (ms)
+        self.redraws = 0
+
+        self._tail = self.cv.create_line(0, 0, 0, 0, fill=self.TRACK_COLOR, dash=(2, 2))
+        self._plane = self.cv.create_polygon(0, 0, 0, 0, 0, 0, fill="yellow", outline="black")
+        self.info = self.cv.create_text(8, 8, anchor="nw", fill="white", font=("Consolas", 9))
+
+        tk.Button(self.top, text="➕", command=lambda: self._zoom(0.5)).pack(side="left")
+        tk.Button(self.top, text="➖", command=lambda: self._zoom(2.0)).pack(side="left")
+        self.cv.bind("<MouseWheel>", lambda e: self._zoom(0.5 if e.delta > 0 else 2.0))
+        self.cv.bind("<Button-4>", lambda e: self._zoom(0.5))
+        self.cv.bind("<Button-5>", lambda e: self._zoom(2.0))
+
+        self.top.protocol("WM_DELETE_WINDOW", self._on_close)
+        self._job = self.top.after(0, self._tick)
+
+    def set_route(self, route):
+        """Rota değişti (düzenleme / yeni yükleme): seviyeleri yeniden kur
+        ve çiz. Uçulan iz varsa onun izdüşümü korunur."""
+        lat0 = self.track.lat0 if self.track is not None else None
+        self.route = TrackLOD.from_waypoints(route, lat0) if route else None
+        if self.ox is not None:
+            self._redraw()
+            self._update_info()
+
+    @property
+    def alive(self):
+        return bool(self.top.winfo_exists())
+
+    # ────────────────────────────────────────────────────────────────────
+    def _to_screen(self, x, y):
+        return (self.W / 2 + (x - self.ox) / self.m_per_px,
+                self.H / 2 - (y - self.oy) / self.m_per_px)
+
+    def _flat(self, xs, ys):
+        """Dünya koordinatları → create_line/coords için düz ekran listesi."""
+        cx, cy, inv = self.W / 2 - self.ox / self.m_per_px, self.H / 2 + self.oy / self.m_per_px, \
+            1.0 / self.m_per_px
+        out = []
+        for x, y in zip(xs, ys):
+            out.append(cx + x * inv)
+            out.append(cy - y * inv)
+        return out
+
+    # ────────────────────────────────────────────────────────────────────
+    def _tick(self):
+        try:
+            pos = self._read()
+            if pos is not None:
+                t0 = time.perf_counter()
+                self._advance(*pos)
+                ms = (time.perf_counter() - t0) * 1000
+                self.draw_ms = ms if not self.draw_ms else self.draw_ms * 0.8 + ms * 0.2
+                self._update_info()
+        except Exception as e:
+            log.exception("Harita hatası: %s", e)
+            self.cv.itemconfigure(self.info, text=f"⚠️ Harita hatası: {e}")
+        self._job = self.top.after(int(1000 / self.RATE_HZ), self._tick)
+
+    def _read(self):
+        aq = self.flight.aq
+        if not aq:
+            return None                  # bağlantı yok: bekle
+        lat, lon = aq.get("PLANE_LATITUDE"), aq.get("PLANE_LONGITUDE")
+        if lat is None or lon is None:
+            return None
+        return lat, lon, aq.get("PLANE_HEADING_DEGREES_TRUE", 0.0) or 0.0   # radyan
+
+    def _advance(self, lat, lon, hdg_rad):
+        if self.track is None:                         # rota varsa onunla aynı izdüşüm
+            self.track = TrackLOD(self.route.lat0 if self.route is not None else lat)
+        x, y = self.track.project(lat, lon)
+        if self.track.last != (x, y):                  # duran uçak izi şişirmesin
+            self.track.append_xy(x, y)
+
+        if self.ox is None:
+            self.ox, self.oy = x, y
+            self._redraw()
+        else:
+            sx, sy = self._to_screen(x, y)
+            if abs(sx - self.W / 2) > self.W * self.RECENTER or \
+                    abs(sy - self.H / 2) > self.H * self.RECENTER:
+                self._pan(x, y)
+            self._draw_new_track()
+        self._draw_plane(x, y, hdg_rad)
+
+    # ────────────────────────────────────────────────────────────────────
+    def _pan(self, x, y):
+        """Haritayı uçak merkeze gelecek şekilde kaydır (tek Canvas.move)."""
+        inv = 1.0 / self.m_per_px
+        self.cv.move("world", (self.ox - x) * inv, (y - self.oy) * inv)
+        self.ox, self.oy = x, y
+        if self._cull_at is not None:
+            cx, cy = self._cull_at
+            if abs(x - cx) * inv > self.W or abs(y - cy) * inv > self.H:
+                self._redraw()           # kırpılmış rotanın kenarına gelindi
+
+    def _zoom(self, factor):
+        mpp = min(max(self.m_per_px * factor, 1.0), 200_000.0)
+        if mpp != self.m_per_px:
+            self.m_per_px = mpp
+            if self.ox is not None:
+                self._redraw()
+                self._update_info()
+
+    def _redraw(self):
+        """Yakınlaştırma / seviye değişiminde tam çizim."""
+        self.redraws += 1
+        cv = self.cv
+        cv.delete("world")
+        self._cull_at = None
+        if self.route is not None:
+            self._draw_route()
+
+        tr = self.track
+        self._level = k = tr.level_for(self.m_per_px, self.PX_TOL, self.MAX_POINTS)
+        xs, ys = tr.xs[k], tr.ys[k]
+        n = len(xs)
+        closed = (max(n - 1, 0) // self.CHUNK) * self.CHUNK   # kapalı parçaların sonu
+        self._draw_chunks(xs[:closed + 1], ys[:closed + 1], self.TRACK_COLOR, "track")
+        self._chunk = None
+        self._chunk_pts = list(zip(xs[closed:], ys[closed:]))
+        self._set_chunk()
+        self._drawn = n
+        for item in (self._tail, self._plane, self.info):
+            cv.tag_raise(item)
+
+    def _draw_route(self):
+        r, mpp = self.route, self.m_per_px
+        k = r.level_for(mpp, self.PX_TOL)
+        if r.size(k) > self.MAX_POINTS:
+            hw, hh = self.W * 1.5 * mpp, self.H * 1.5 * mpp
+            runs = r.runs(k, self.ox - hw, self.oy - hh, self.ox + hw, self.oy + hh)
+            if sum(j - i for i, j in runs) <= self.MAX_POINTS:
+                self._route_level, self._cull_at = k, (self.ox, self.oy)
+                for i, j in runs:
+                    self._draw_chunks(r.xs[k][i:j], r.ys[k][i:j], self.ROUTE_COLOR, "route")
+                return
+            k = r.level_for(mpp, self.PX_TOL, self.MAX_POINTS)   # görünür kısım da fazla
+        self._route_level = k
+        self._draw_chunks(r.xs[k], r.ys[k], self.ROUTE_COLOR, "route")
+
+    def _draw_chunks(self, xs, ys, color, tag):
+        step = self.CHUNK
+        for i in range(0, len(xs) - 1, step):
+            coords = self._flat(xs[i:i + step + 1], ys[i:i + step + 1])   # 1 nokta örtüşme
+            self.cv.create_line(*coords, fill=color, width=2, tags=("world", tag))
+
+    def _set_chunk(self):
+        pts = self._chunk_pts
+        if len(pts) < 2:
+            return
+        coords = self._flat(*zip(*pts))
+        if self._chunk is None:
+            self._chunk = self.cv.create_line(*coords, fill=self.TRACK_COLOR, width=2,
+                                              tags=("world", "track"))
+        else:
+            self.cv.coords(self._chunk, *coords)
+
+    def _draw_new_track(self):
+        """Yalnızca yeni iz noktalarını açık parçaya ekle."""
+        tr, k = self.track, self._level
+        n = tr.size(k)
+        if n > self.MAX_POINTS and k + 1 < tr.levels:
+            self._redraw()               # iz sınırı aştı: bir seviye kabalaş
+            return
+        if n == self._drawn:
+            return
+        xs, ys, pts = tr.xs[k], tr.ys[k], self._chunk_pts
+        for i in range(self._drawn, n):
+            pts.append((xs[i], ys[i]))
+            if len(pts) > self.CHUNK:
+                self._set_chunk()        # parçayı kapat, son noktadan yenisini aç
+                self._chunk, pts = None, [pts[-1]]
+                self._chunk_pts = pts
+        self._set_chunk()
+        self._drawn = n
+
+    def _draw_plane(self, x, y, hdg_rad):
+        sx, sy = self._to_screen(x, y)
+        tr, k = self.track, self._level
+        if tr.size(k):
+            lx, ly = self._to_screen(tr.xs[k][-1], tr.ys[k][-1])
+            self.cv.coords(self._tail, lx, ly, sx, sy)
+        a = hdg_rad                                    # SimConnect heading'i radyandır
+        pts = []
+        for dx, dy in ((0, -10), (-6, 7), (6, 7)):     # burun yukarı üçgen, heading kadar döndür
+            pts += [sx + dx * math.cos(a) - dy * math.sin(a),
+                    sy + dx * math.sin(a) + dy * math.cos(a)]
+        self.cv.coords(self._plane, *pts)
+
+    def _update_info(self):
+        tr = self.track
+        route = f"rota {self.route.size(self._route_level)} (L{self._route_level})  " \
+            if self.route is not None else ""
+        self.cv.itemconfigure(self.info, text=(
+            f"{self.m_per_px:g} m/px  {route}iz {tr.size(self._level)}/{tr.count} (L{self._level})  "
+            f"{self.draw_ms:.1f} ms"))
+
+    # ────────────────────────────────────────────────────────────────────
+    def _on_close(self):
+        self.top.after_cancel(self._job)
+        self.top.destroy()
@@ -0,0 +1,140 @@
+from tkinter import Frame, Label, Listbox, Scrollbar, END, VERTICAL
+
+
+class ScenarioTable:
+    """Sanal kaydırmalı senaryo tablosu.
+
+    Listbox'ta yalnızca görünen satırlar (rows adet) bulunur; kaydırmada
+    bu satırlar sıkıştırılmış sütunlardan (PackedScenario.cols) yeniden
+    biçimlenir. Böylece 100 bin noktalık senaryo da tek ekranlık maliyetle
+    gösterilir. Seçim veri indeksleriyle tutulur ([start, stop) aralığı:
+    tık + Shift-tık), kaydırınca kaybolmaz.
+    """
+
+    FONT = ("Consolas", 9)
+    # (başlık, alan, biçim)
+    COLUMNS = (
+        ("#",      None,          "{:>7d}"),
+        ("LAT",    "lat",         "{:>10.5f}"),
+        ("LON",    "lon",         "{:>11.5f}"),
+        ("ALT ft", "alt",         "{:>8.0f}"),
+        ("SPD kt", "spd",         "{:>7.0f}"),
+        ("HDG",    "heading_deg", "{:>5.0f}"),
+        ("t s",    "t",           "{:>9.2f}"),
+    )
+
+    def __init__(self, parent, rows=8):
+        self.rows = rows
+        self.data = None
+        self.top = 0                     # ilk görünen satırın veri indeksi
+        self.anchor = self.cursor = None # seçim uçları (veri indeksi)
+
+        self.frame = Frame(parent)
+        widths = [len(fmt.format(0 if f is None else 0.0)) for _, f, fmt in self.COLUMNS]
+        head = " ".join(f"{h:>{w}}" for (h, _, _), w in zip(self.COLUMNS, widths))
+        Label(self.frame, text=head, font=self.FONT, anchor="w").grid(row=0, column=0, sticky="w")
+        self.lb = Listbox(self.frame, height=rows, width=len(head) + 1, font=self.FONT,
+                          activestyle="none", exportselection=False)
+        self.lb.grid(row=1, column=0)
+        self.sb = Scrollbar(self.frame, orient=VERTICAL, command=self._on_scroll)
+        self.sb.grid(row=1, column=1, sticky="ns")
+
+        lb = self.lb
+        lb.bind("<Button-1>", lambda e: self._click(e, extend=False))
+        lb.bind("<Shift-Button-1>", lambda e: self._click(e, extend=True))
+        lb.bind("<B1-Motion>", lambda e: self._click(e, extend=True))
+        lb.bind("<MouseWheel>", lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        lb.bind("<Button-4>", lambda e: self.scroll(-3))
+        lb.bind("<Button-5>", lambda e: self.scroll(3))
+        lb.bind("<Prior>", lambda e: self.scroll(-self.rows))
+        lb.bind("<Next>", lambda e: self.scroll(self.rows))
+        lb.bind("<Home>", lambda e: self.scroll_to(0))
+        lb.bind("<End>", lambda e: self.scroll_to(len(self)))
+
+    def grid(self, **kw):
+        self.frame.grid(**kw)
+
+    def __len__(self):
+        return len(self.data) if self.data is not None else 0
+
+    # --------------------------------------------------
+    def set_data(self, data):
+        self.data = data
+        self.top = 0
+        self.anchor = self.cursor = None
+        self.refresh()
+
+    @property
+    def selection(self):
+        """Seçili [start, stop) aralığı (yoksa None)."""
+        if self.anchor is None:
+            return None
+        n = len(self)
+        a, b = sorted((self.anchor, self.cursor))
+        if a >= n:
+            return None
+        return a, min(b, n - 1) + 1
+
+    def clear_selection(self):
+        self.anchor = self.cursor = None
+        self.refresh()
+
+    def scroll(self, delta):
+        self.scroll_to(self.top + delta)
+        return "break"
+
+    def scroll_to(self, index):
+        self.top = index
+        self.refresh()
+        return "break"
+
+    def _on_scroll(self, *args):
+        n = len(self)
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * n))
+        elif args[0] == "scroll":
+            step = self.rows if args[2] == "pages" else 1
+            self.scroll(int(args[1]) * step)
+
+    def _click(self, event, extend):
+        i = self.top + self.lb.nearest(event.y)
+        if i < len(self):
+            if not extend or self.anchor is None:
+                self.anchor = i
+            self.cursor = i
+            self.refresh()
+        return "break"                   # Listbox'ın kendi seçimini kullanma
+
+    # --------------------------------------------------
+    def refresh(self):
+        """Görünen satırları veriden yeniden çiz (yalnızca rows satır)."""
+        n = len(self)
+        self.top = max(0, min(self.top, n - self.rows))
+        lb = self.lb
+        lb.delete(0, END)
+        stop = min(self.top + self.rows, n)
+        for i in range(self.top, stop):
+            lb.insert(END, self._row(i))
+        sel = self.selection
+        if sel:
+            a, b = max(sel[0], self.top), min(sel[1], stop)
+            if a < b:
+                lb.selection_set(a - self.top, b - 1 - self.top)
+        if n:
+            self.sb.set(self.top / n, stop / n)
+        else:
+            self.sb.set(0.0, 1.0)
+
+    def _row(self, i):
+        cols = getattr(self.data, "cols", None)
+        out = []
+        for _, field, fmt in self.COLUMNS:
+            if field is None:
+                v = i + 1
+            else:
+                v = cols[field][i] if cols else getattr(self.data[i], field)
+                if v is None or v != v:                  # eksik (NaN)
+                    out.append(" " * (len(fmt.format(0.0)) - 1) + "—")
+                    continue
+            out.append(fmt.format(v))
+        return " ".join(out)